@@ -14,7 +14,11 @@ from generalgui.app import App
 from generalgui.pages.labelentry import LabelEntry
 from generalgui.pages.labelcheckbutton import LabelCheckbutton
 from generalgui.pages.grid import Grid
+from generalgui.pages.canvasgrid import CanvasGrid
 from generalgui.pages.spreadsheet import Spreadsheet
 from generalgui.pages.elementlist import ElementList
 from generalgui.pages.inputlist import InputList
 
+from generalgui.datasources import DataSource, DataFrameSource, MemmapSource, FeatherSource, ParquetSource
+
+from generalgui.spreadsheetmodel import SpreadsheetModel, ModelChange
@@ -9,6 +9,8 @@ from generalgui.shared_methods.scroller import Scroller
 from generalgui.shared_methods.resizer import Resizer
 from generalgui.shared_methods.menu import Menu_App
 from generalgui.shared_methods.binder import Binder_App
+from generalgui.shared_methods.measurer import Measurer
+from generalgui.shared_methods.pooler import Pooler
 
 from generallibrary.iterables import getFreeIndex
 
@@ -33,11 +35,12 @@ class tkTk(Tk):
         del self.element.afters[index]
 
 apps = []
-class App(Element_Page_App, Element_App, Page_App, Scroller, Resizer, Menu_App, Binder_App):
+class App(Element_Page_App, Element_App, Page_App, Scroller, Resizer, Menu_App, Binder_App, Measurer, Pooler):
     """
     Controls one tkinter Tk object and adds a lot of convenient features.
     Creates a window automatically.
     """
+    _materialized = True  # Tk is created right away, lazy Elements check their parentPart for this
     def __init__(self):
         Element_App.__init__(self)
         Element_Page_App.__init__(self)
@@ -76,6 +79,8 @@ class App(Element_Page_App, Element_App, Page_App, Scroller, Resizer, Menu_App,
         Scroller.__init__(self)
         Resizer.__init__(self)
         Menu_App.__init__(self)
+        Measurer.__init__(self)
+        Pooler.__init__(self)
 
         self.menu("App", Rainbow=self.rainbow, Reset_Rainbow=lambda: self.rainbow(True))
 
@@ -130,6 +135,49 @@ class App(Element_Page_App, Element_App, Page_App, Scroller, Resizer, Menu_App,
         if self.isShown():
             self.widget.withdraw()
 
+    def removeParts(self, parts):
+        """
+        Remove Elements and Pages for good together.
+        Every descendant is marked as removed in one traversal of the hierarchy index, only top widgets whose parentPart stays are destroyed and App is updated once at the end.
+        Pooled descendants are taken out of the element pool.
+
+        :param list[generalgui.element.Element or generalgui.Page] parts: Elements and Pages of this App, may contain each other
+        """
+        topElements = []
+        for part in parts:
+            if part.removed:
+                continue
+            part.removed = True
+            topElements.append(topElement := part.getTopElement())
+
+            elements = [topElement]
+            while elements:
+                element = elements.pop()
+                element.removed = True
+                if element.pooled:
+                    self._unpoolElement(element)
+                if element.parentPage.topElement is element:
+                    element.parentPage.removed = True
+                elements.extend(element._childElements)
+
+        destroyed = False
+        for topElement in topElements:
+            parentPart = topElement.parentPart
+            if parentPart.removed:
+                continue  # Destroyed along with parentPart
+            parentPart._childElements.pop(topElement, None)
+            if grid := topElement._getParentGrid():
+                grid._unindexGridElement(topElement)
+
+            if topElement.isMaterialized():
+                topElement.widget.destroy()
+                destroyed = True
+            elif not parentPart.isMaterialized():
+                parentPart._pendingActions = [action for action in parentPart._pendingActions if getattr(action, "__self__", None) is not topElement]
+
+        if destroyed:
+            self.widget.update()
+
 
 import generalgui as gui
 from generalgui.element import Element
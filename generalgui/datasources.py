@@ -0,0 +1,256 @@
+"""
+Read-only data sources that Spreadsheet can read one window of rows and columns at a time.
+
+Classes:
+    * DataSource
+    * DataFrameSource
+    * MemmapSource
+    * FeatherSource
+    * ParquetSource
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+
+def importPyarrow():
+    """
+    Import pyarrow lazily as it's an optional dependency.
+
+    :raises ImportError: If pyarrow isn't installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("pyarrow is required for feather and parquet files, install it with 'pip install generalgui[arrow]'") from e
+    return pyarrow
+
+
+class DataSource(ABC):
+    """
+    Base class for read-only data that Spreadsheet reads a window at a time with loadDataSource().
+    Subclasses define getShape(), getColumns() and _read(), they're abstract so a subclass missing one can't be created.
+
+    Index is row positions unless getIndex() is overridden.
+    """
+    @abstractmethod
+    def getShape(self):
+        """
+        Get (rows, columns) of entire source.
+
+        :rtype: tuple[int]
+        """
+
+    @abstractmethod
+    def getColumns(self):
+        """
+        Get all column keys.
+
+        :rtype: pd.Index
+        """
+
+    def getIndex(self, start=0, stop=None):
+        """
+        Get row keys of a range of rows.
+
+        :param int start: First row
+        :param int stop: Row after last row, None for all rows
+        :rtype: pd.Index
+        """
+        rows = self.getShape()[0]
+        stop = rows if stop is None else min(stop, rows)
+        return pd.RangeIndex(start, max(start, stop))
+
+    def read(self, rowStart=0, rowStop=None, columnStart=0, columnStop=None):
+        """
+        Read a window of rows and columns, only the window is loaded into memory.
+
+        :param int rowStart: First row
+        :param int rowStop: Row after last row, None for all rows
+        :param int columnStart: First column
+        :param int columnStop: Column after last column, None for all columns
+        :rtype: pd.DataFrame
+        """
+        rows, columns = self.getShape()
+        rowStop = rows if rowStop is None else min(rowStop, rows)
+        columnStop = columns if columnStop is None else min(columnStop, columns)
+        rowStop, columnStop = max(rowStart, rowStop), max(columnStart, columnStop)
+
+        df = self._read(rowStart, rowStop, columnStart, columnStop)
+        df.index = self.getIndex(rowStart, rowStop)
+        df.columns = self.getColumns()[columnStart:columnStop]
+        return df
+
+    @abstractmethod
+    def _read(self, rowStart, rowStop, columnStart, columnStop):
+        """
+        Read a window that is confined to shape, index and columns are set by read().
+
+        :rtype: pd.DataFrame
+        """
+
+    def close(self):
+        """
+        Release any open files.
+        """
+
+
+class DataFrameSource(DataSource):
+    """
+    DataSource of a DataFrame that's already in memory, keeps it's index.
+    """
+    def __init__(self, df):
+        """
+        :param pd.DataFrame df:
+        """
+        self.dataFrame = df
+
+    def getShape(self):
+        return self.dataFrame.shape
+
+    def getColumns(self):
+        return self.dataFrame.columns
+
+    def getIndex(self, start=0, stop=None):
+        return self.dataFrame.index[start:stop]
+
+    def _read(self, rowStart, rowStop, columnStart, columnStop):
+        return self.dataFrame.iloc[rowStart:rowStop, columnStart:columnStop].copy()
+
+
+class MemmapSource(DataSource):
+    """
+    DataSource of a memory-mapped NumPy array, the OS only pages in the part that's read.
+    Structured arrays get a column per field, 2D arrays a column per second axis and 1D arrays one column.
+    """
+    def __init__(self, array, columns=None, dtype=None, shape=None):
+        """
+        :param str or np.ndarray array: Array, path to a .npy file or path to a raw binary file
+        :param list columns: Column keys, defaults to field names or positions
+        :param dtype: dtype of a raw binary file
+        :param tuple shape: Shape of a raw binary file
+        """
+        if isinstance(array, str):
+            if array.endswith(".npy"):
+                array = np.load(array, mmap_mode="r")
+            else:
+                array = np.memmap(array, dtype=float if dtype is None else dtype, mode="r", shape=shape)
+
+        if array.dtype.names is None and array.ndim == 1:
+            array = array.reshape(-1, 1)
+        elif array.dtype.names is None and array.ndim != 2:
+            raise ValueError(f"MemmapSource needs a structured, 1D or 2D array, not {array.ndim}D")
+
+        if columns is None:
+            columns = array.dtype.names or range(array.shape[1])
+        self.array = array
+        self.columns = pd.Index(columns)
+
+    def getShape(self):
+        return len(self.array), len(self.columns)
+
+    def getColumns(self):
+        return self.columns
+
+    def _read(self, rowStart, rowStop, columnStart, columnStop):
+        window = self.array[rowStart:rowStop]
+        if self.array.dtype.names is None:
+            return pd.DataFrame(np.array(window[:, columnStart:columnStop]))
+        return pd.DataFrame({name: np.array(window[name]) for name in self.array.dtype.names[columnStart:columnStop]})
+
+
+class FeatherSource(DataSource):
+    """
+    DataSource of a Feather v2 / Arrow IPC file, memory-mapped so only the record batches in a window are read.
+    Requires pyarrow.
+    """
+    def __init__(self, path):
+        """
+        :param str path: Path to a Feather v2 or Arrow IPC file
+        """
+        pyarrow = importPyarrow()
+        self._pyarrow = pyarrow
+        self._file = pyarrow.memory_map(path, "r")
+        self._reader = pyarrow.ipc.open_file(self._file)
+        self.columns = pd.Index(self._reader.schema.names)
+        self.batchOffsets = np.cumsum([0] + [self._reader.get_batch(i).num_rows for i in range(self._reader.num_record_batches)])
+
+    def getShape(self):
+        return int(self.batchOffsets[-1]), len(self.columns)
+
+    def getColumns(self):
+        return self.columns
+
+    def _read(self, rowStart, rowStop, columnStart, columnStop):
+        names = list(self.columns[columnStart:columnStop])
+        if rowStart == rowStop:
+            return pd.DataFrame(columns=range(len(names)), index=range(0))
+
+        first, last = np.searchsorted(self.batchOffsets, [rowStart, rowStop - 1], side="right") - 1
+        table = self._pyarrow.Table.from_batches([self._reader.get_batch(i) for i in range(first, last + 1)])
+        table = table.slice(rowStart - self.batchOffsets[first], rowStop - rowStart).select(names)
+        return table.to_pandas()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSource(DataSource):
+    """
+    DataSource of a Parquet file, only the row groups and columns in a window are read.
+    The most recently read row groups are cached so scrolling within them doesn't read them again.
+    Requires pyarrow.
+    """
+    def __init__(self, path, cacheSize=4):
+        """
+        :param str path: Path to a Parquet file
+        :param int cacheSize: Number of row groups to keep in memory
+        """
+        pyarrow = importPyarrow()
+        self._pyarrow = pyarrow
+        self._file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        self.columns = pd.Index([name for name in self._file.schema_arrow.names if not name.startswith("__index_level_")])
+        metadata = self._file.metadata
+        self.groupOffsets = np.cumsum([0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+        self.cacheSize = cacheSize
+        self._groupCache = {}
+
+    def getShape(self):
+        return int(self.groupOffsets[-1]), len(self.columns)
+
+    def getColumns(self):
+        return self.columns
+
+    def _readGroup(self, i, names):
+        """
+        Read one row group with some columns, cached.
+
+        :param int i: Row group
+        :param tuple names: Column names
+        """
+        key = (i, names)
+        table = self._groupCache.pop(key, None)
+        if table is None:
+            table = self._file.read_row_group(i, columns=list(names))
+            if len(self._groupCache) >= self.cacheSize:
+                del self._groupCache[next(iter(self._groupCache))]
+        self._groupCache[key] = table
+        return table
+
+    def _read(self, rowStart, rowStop, columnStart, columnStop):
+        names = tuple(self.columns[columnStart:columnStop])
+        if rowStart == rowStop:
+            return pd.DataFrame(columns=range(len(names)), index=range(0))
+
+        first, last = np.searchsorted(self.groupOffsets, [rowStart, rowStop - 1], side="right") - 1
+        table = self._pyarrow.concat_tables([self._readGroup(i, names) for i in range(first, last + 1)])
+        table = table.slice(rowStart - self.groupOffsets[first], rowStop - rowStart)
+        return table.to_pandas(ignore_metadata=True)
+
+    def close(self):
+        self._groupCache = {}
+        self._file.close()
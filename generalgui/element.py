@@ -11,12 +11,46 @@ from generalgui.shared_methods.element_app import Element_App
 from generalvector import Vec2
 
 
+initPlans = {}
+widgetConfigKeys = {}
+masterPlaceholder = object()  # Replaced by parentPart's widget when an element is materialized
+
+
+def getInitPlan(widgetClass):
+    """
+    Get name, kind and default of each parameter that a widget class takes before it's **kwargs, cached per class so that Element doesn't inspect signatures.
+
+    :param class widgetClass: Tkinter widget class
+    :rtype: tuple[tuple]
+    """
+    if widgetClass not in initPlans:
+        plan = []
+        for parameterName, parameter in inspect.signature(widgetClass).parameters.items():
+            kind = str(parameter.kind)
+            if kind == "VAR_KEYWORD":
+                break
+            plan.append((parameterName, kind, parameter.default))
+        initPlans[widgetClass] = tuple(plan)
+    return initPlans[widgetClass]
+
+
 class Element(Element_Page, Element_App, Element_Page_App):
     """
     Element is inherited by all tkinter widgets exluding App and Page.
     Shown by default. So when it's page is shown then all of page's children are shown automatically.
+    Each widget class' init parameters and config keys are looked up once and cached in initPlans and widgetConfigKeys.
+    A lazy element records it's config and pack calls and creates it's widget once it's packed or it's widget is used, along with every element inside it.
+    Elements have no instance dict, so every attribute of an element class is declared in it's __slots__.
     """
-    def __init__(self, parentPage, widgetClass, pack=True, makeBase=False, resizeable=False, onClick=None, pos=None, **parameters):
+    __slots__ = ("styleHandler", "events", "disabledPropagations", "menuContent", "removed", "pooled", "_childElements",
+                 "app", "parentPage", "parentPart", "parameters", "packParameters", "baseFor", "poolKey",
+                 "_widget", "_widgetClass", "_initArgs", "_pendingConfig", "_pendingActions", "_materialized")
+    reuseParameters = ("pack", "pos", "column", "row", "onClick")
+
+    def __init__(self, parentPage, widgetClass, pack=True, makeBase=False, resizeable=False, onClick=None, pos=None, lazy=False, **parameters):
+        """
+        :param bool lazy: Whether to wait with creating widget until it's packed or used, elements in an unmaterialized element are always lazy
+        """
         Element_App.__init__(self)
         Element_Page_App.__init__(self)
 
@@ -30,44 +64,57 @@ class Element(Element_Page, Element_App, Element_Page_App):
         self.app = parentPage.app
         self.parentPage = parentPage
         self.parentPart = parentPage.getBaseElement()
-        parameters["master"] = self.parentPart.widget
+        self.parentPart._addChildElement(self)
+        parameters["master"] = masterPlaceholder
 
         # Extract initialization arguments from parameters
         initArgs = []
-        signature = inspect.signature(widgetClass)
-        for parameterName in signature.parameters:
-            parameter = signature.parameters[parameterName]
-            kind = str(parameter.kind)
-            if kind == "VAR_KEYWORD":
-                break
+        for parameterName, kind, default in getInitPlan(widgetClass):
             if parameterName in parameters:
                 if kind == "VAR_POSITIONAL":
                     initArgs.extend(parameters[parameterName])
                 else:
                     initArgs.append(parameters[parameterName])
                 del parameters[parameterName]
-            elif parameter.default != inspect.Parameter.empty:
-                initArgs.append(parameter.default)
+            elif default is not inspect.Parameter.empty:
+                initArgs.append(default)
             elif kind == "VAR_POSITIONAL":
                 break
             else:
                 raise AttributeError(f"Missing positional parameter that doesn't have a default value {parameterName} with kind {kind}")
 
         self.parameters = parameters
-        self.widget = widgetClass(*initArgs)
         self.baseFor = None
-
-        setattr(self.widget, "element", self)
+        self.poolKey = None
+        self._widgetClass = widgetClass
+        self._initArgs = initArgs
+        self._pendingConfig = None
+        self._pendingActions = None
+        self._materialized = False
+
+        parentDeferred = not self.parentPart._materialized
+        if lazy or parentDeferred:
+            self._pendingConfig = {}
+            self._pendingActions = []
+            if widgetClass not in widgetConfigKeys:
+                probe = widgetClass(*self._getInitArgs(self.app.widget))
+                widgetConfigKeys[widgetClass] = frozenset(probe.keys())
+                probe.destroy()
+            if parentDeferred and not lazy:
+                self.parentPart._pendingActions.append(self._materialize)
+        else:
+            self._materialize()
 
         configParameters = {}
         self.packParameters = {}
-        allConfigKeys = self.getAllWidgetConfigs()
+        allConfigKeys = widgetConfigKeys[widgetClass]
         for key, value in parameters.items():
             if key in allConfigKeys:
                 configParameters[key] = value
             else:
                 self.packParameters[key] = value
-        self.widgetConfig(**configParameters)
+        if configParameters:
+            self.widgetConfig(**configParameters)
 
         if makeBase:
             self.makeBase()
@@ -76,7 +123,109 @@ class Element(Element_Page, Element_App, Element_Page_App):
         if resizeable:
             self.resizeable()
         if onClick:
-            self.onClick(onClick)
+            self.createBind("<Button-1>", onClick, name="OnClick")
+
+    @property
+    def widget(self):
+        """
+        Tkinter widget of this element, created first if element is still lazy.
+
+        :rtype: tk.Widget
+        """
+        if not self._materialized:
+            self._materialize()
+        return self._widget
+
+    def afterMaterialize(self, func):
+        """
+        Call a function once this element's widget is created, right away if it already is.
+
+        :param function func: Function that takes no arguments
+        """
+        if self._materialized:
+            func()
+        else:
+            self._pendingActions.append(func)
+
+    def _materialize(self):
+        """
+        Create this element's widget, starting with unmaterialized parents.
+        Then apply recorded config and replay recorded actions in order, such as creating and packing lazy children.
+        """
+        if self._materialized:
+            return
+        if not self.parentPart._materialized:
+            self.parentPart._materialize()
+            if self._materialized:  # Queued in parentPart
+                return
+
+        self._materialized = True
+        self._widget = self._widgetClass(*self._getInitArgs(self.parentPart.widget))
+        setattr(self._widget, "element", self)
+
+        if self._widgetClass not in widgetConfigKeys:
+            widgetConfigKeys[self._widgetClass] = frozenset(self.getAllWidgetConfigs())
+        config = self._pendingConfig
+        self._initArgs = self._pendingConfig = None
+        if config:
+            self.widgetConfig(**config)
+
+        actions = self._pendingActions
+        self._pendingActions = None
+        for action in actions or ():
+            action()
+
+    def _getInitArgs(self, master):
+        """
+        Get arguments to create widget with.
+
+        :param tk.Widget master: Widget to create widget in
+        """
+        return [master if arg is masterPlaceholder else arg for arg in self._initArgs]
+
+    def widgetConfig(self, **kwargs):
+        """
+        Configure widget, or record config until widget is created.
+        """
+        if self._materialized:
+            self._widget.config(**kwargs)
+        else:
+            self._pendingConfig.update(kwargs)
+
+    def _reuse(self, pack=True, pos=None, column=None, row=None, onClick=None, **parameters):
+        """
+        Prepare a pooled element to be used again, called by App.borrowElement() with the parameters it would have been created with.
+        Config parameters are applied again as they may have been changed while it was used, such as the color of a moved cell.
+        Subclasses handle their own reuseParameters and then call this.
+        """
+        self.pooled = False
+
+        if pos is not None:
+            pos = Vec2(pos)
+            column, row = pos.x, pos.y
+        self.packParameters.pop("column", None)
+        self.packParameters.pop("row", None)
+        if column is not None and row is not None:
+            self.packParameters.update(column=column, row=row)
+
+        config = {key: value for key, value in parameters.items() if key in self.parameters and key not in self.packParameters}
+        if self.styleHandler:
+            for name in ("Hover", "Click"):  # Pooled while hovered or clicked, such as menu buttons
+                if style := self.styleHandler.getStyle(name, onlyEnabled=True):
+                    style.disable()
+            original = self.styleHandler.originalStyle
+            styled = [key for key in config if key in original.kwargs]
+            for key in styled:
+                original[key] = config.pop(key)
+            if styled:
+                self.styleHandler.update()
+        if config:
+            self.widgetConfig(**config)
+
+        if onClick:
+            self.createBind("<Button-1>", onClick, name="OnClick")
+        if pack:
+            self.pack()
 
 
     def resizeable(self):
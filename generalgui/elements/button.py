@@ -12,6 +12,8 @@ class Button(Label):
     """
     Controls one tkinter Button
     """
+    __slots__ = ()
+
     def __init__(self, parentPage, value, onClick=None, **parameters):
         """
         Create a Button element that controls a button.
@@ -12,6 +12,8 @@ class Canvas(Element):
     Attributes:
         widget  Hello
     """
+    __slots__ = ()
+
     def __init__(self, parentPage, **parameters):
         """
         Create a Canvas element that controls a canvas.
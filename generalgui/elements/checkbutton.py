@@ -9,6 +9,9 @@ class Checkbutton(Element):
     """
     Controls one tkinter Checkbutton
     """
+    __slots__ = ("default", "_boolVar")
+    reuseParameters = Element.reuseParameters + ("default", )
+
     def __init__(self, parentPage, default=False, **parameters):
         """
         Create an Entry element that controls an entry.
@@ -21,6 +24,14 @@ class Checkbutton(Element):
         super().__init__(parentPage, tk.Checkbutton, variable=self._boolVar, cursor="hand2", **parameters)
         self.default = default
 
+    def _reuse(self, default=False, **parameters):
+        """
+        Prepare a pooled Checkbutton to be used again with a new default value.
+        """
+        self.default = default
+        self._boolVar.set(default)
+        super()._reuse(**parameters)
+
     def toggle(self):
         """
         Turn on checkbutton if it's off and vice versa.
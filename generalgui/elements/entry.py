@@ -11,6 +11,9 @@ class Entry(Element):
     """
     Controls one tkinter Entry
     """
+    __slots__ = ("_default", )
+    reuseParameters = Element.reuseParameters + ("default", )
+
     def __init__(self, parentPage, default=None, width=15, **parameters):
         """
         Create an Entry element that controls an entry.
@@ -32,6 +35,14 @@ class Entry(Element):
         self.createBind("<FocusOut>", lambda: self.setValue(self.getDefault()) if self.getValue() == "" else None)
         self.createBind("<Return>", self._clickNextButton)
 
+    def _reuse(self, default=None, **parameters):
+        """
+        Prepare a pooled Entry to be used again with a new default value.
+        """
+        self._default = default
+        self.setValue(default if default else None, useDefault=False)
+        super()._reuse(**parameters)
+
     def _clickNextButton(self):
         """
         Click the first sibling that's a button when Enter key is pressed.
@@ -9,6 +9,8 @@ class Frame(Element):
     """
     Controls one tkinter Frame
     """
+    __slots__ = ()
+
     def __init__(self, parentPage, **parameters):
         """
         Create a Frame element that controls a frame.
@@ -6,16 +6,21 @@ from generalgui.element import Element
 from generallibrary.functions import defaults
 
 import re
+import inspect
 
 class Label(Element):
     """Controls one tkinter Label"""
-    def __init__(self, parentPage, value=None, hideMultiline=None, maxLen=None, **parameters):
+    __slots__ = ("hideMultiline", "hiddenMultiline", "maxLen", "multilineStyle", "_value", "_formatted", "_displayed")
+    reuseParameters = Element.reuseParameters + ("value", "formatted")
+
+    def __init__(self, parentPage, value=None, hideMultiline=None, maxLen=None, formatted=None, **parameters):
         """
         Create a Label element that controls a label.
 
         :param generalgui.Page parentPage: Parent page
         :param str value: Text to be displayed
         :param bool hideMultiline: Whether to have option to hide multilines or not
+        :param tuple formatted: Optional pre-formatted (text, shortText, hideable) of value to skip formatting it
         :param parameters: Both config and pack parameters together
         """
         if value is None:
@@ -29,8 +34,11 @@ class Label(Element):
         self.hiddenMultiline = hideMultiline
         self.maxLen = maxLen
         self._value = value
-        
-        super().__init__(parentPage, tk.Label, text=self._getNewDisplayedValue(value), **defaults(parameters, justify="left"))
+        self._formatted = formatted
+
+        self._displayed = self._getNewDisplayedValue(value)
+
+        super().__init__(parentPage, tk.Label, text=self._displayed, **defaults(parameters, justify="left"))
 
         # Multiline hiding part is a mess, but it works
         # Wont work very well if Labels's values are changed
@@ -41,6 +49,14 @@ class Label(Element):
             self.multilineStyle = self.createStyle("Multiline", priority=0.5, fg="gray60")
             self._updateStyle()
 
+    def _reuse(self, value=None, formatted=None, **parameters):
+        """
+        Prepare a pooled Label to be used again with a new value, multilines are hidden again if they were shown.
+        """
+        self.hiddenMultiline = self.hideMultiline
+        inspect.unwrap(type(self).setValue)(self, value, formatted=formatted)
+        super()._reuse(**parameters)
+
     def _updateStyle(self):
         if self.hideMultiline:
             if self.hiddenMultiline:
@@ -48,34 +64,61 @@ class Label(Element):
             else:
                 self.multilineStyle.disable()
 
-    def _strShouldBeHidden(self, value):
+    @staticmethod
+    def isHideable(value, maxLen=None):
+        """
+        Get whether a value has multiple lines or is longer than maxLen.
+
+        :param any value: Any value, is cast to str
+        :param int maxLen: Optional max length
+        """
         value = str(value)
-        splitValue = value.split("\n")
-        multipleLines = len(splitValue) > 1
-        tooLong = self.maxLen and len(value) > self.maxLen
-        return multipleLines or tooLong
+        multipleLines = "\n" in value
+        tooLong = maxLen and len(value) > maxLen
+        return bool(multipleLines or tooLong)
+
+    @staticmethod
+    def getShortValue(value, maxLen=None):
+        """
+        Get first non-empty line of a value without leading spaces, limited to maxLen and ending with " ...".
+
+        :param any value: Any value, is cast to str
+        :param int maxLen: Optional max length
+        """
+        for line in str(value).split("\n"):
+            if line != "":
+                break
+        else:
+            line = ""
+
+        # Remove spaces from start
+        line = re.sub('^ +', '', line)
+
+        # Limit length
+        if maxLen and len(line) > maxLen:
+            line = line[0:maxLen]
+
+        return f"{line} ..."
+
+    def _strShouldBeHidden(self, value):
+        return self.isHideable(value, self.maxLen)
 
     def _getNewDisplayedValue(self, value):
+        if self._formatted is not None:
+            text, shortText, hideable = self._formatted
+            if self.hiddenMultiline:
+                self.hiddenMultiline = hideable
+                if hideable:
+                    return shortText
+            return text
+
         value = str(value)
 
         # This part seems weird but it works
         if self.hiddenMultiline:
             self.hiddenMultiline = self._strShouldBeHidden(value)
             if self.hiddenMultiline:
-                for line in value.split("\n"):
-                    if line != "":
-                        break
-                else:
-                    line = ""
-
-                # Remove spaces from start
-                line = re.sub('^ +', '', line)
-
-                # Limit length
-                if self.maxLen and len(line) > self.maxLen:
-                    line = line[0:self.maxLen]
-
-                return f"{line} ..."
+                return self.getShortValue(value, self.maxLen)
 
         return value
 
@@ -93,24 +136,37 @@ class Label(Element):
             equals = self.hiddenMultiline == hide
             value = self.getValue()
 
-            if not equals and self._strShouldBeHidden(value):
+            hideable = self._strShouldBeHidden(value) if self._formatted is None else self._formatted[2]
+
+            if not equals and hideable:
                 # print("here", self.hideMultiline)
                 self.hiddenMultiline = hide
-                self.setValue(value)
+                self.setValue(value, formatted=self._formatted)
 
-    def setValue(self, value):
+    def setValue(self, value, formatted=None):
         """
-        Set value of label
+        Set value of label, widget is only configured if displayed text changes
 
         :param any value: Any value, is cast to str
+        :param tuple formatted: Optional pre-formatted (text, shortText, hideable) of value to skip formatting it
         """
         if value is None:
             value = ""
         self._value = value
+        self._formatted = formatted
 
-        self.widget["text"] = self._getNewDisplayedValue(value)
+        displayed = self._getNewDisplayedValue(value)
+        if displayed != self._displayed:
+            self._displayed = displayed
+            self.widgetConfig(text=displayed)
         self._updateStyle()
 
+    def getDisplayedValue(self):
+        """
+        Get text that's currently displayed, without asking the widget.
+        """
+        return self._displayed
+
     def getValue(self):
         """
         Get value of label as a dynamic type, "tRue" becomes True for example
@@ -12,6 +12,8 @@ class OptionMenu(Element):
     """
     Controls one tkinter OptionMenu
     """
+    __slots__ = ("_options", "_tkString", "_default")
+
     def __init__(self, parentPage, options, default=None, func=None, **parameters):
         """
         Create a OptionMenu element that controls an OptionMenu.
@@ -9,6 +9,8 @@ class Scrollbar(Element):
     """
     Controls one tkinter Scrollbar
     """
+    __slots__ = ()
+
     def __init__(self, parentPage, **parameters):
         """
         Create a Scrollbar element that controls a scrollbar.
@@ -14,7 +14,7 @@ class Page(Element_Page, Element_Page_App, Page_App):
     Controls one tkinter Frame and adds a lot of convenient features.
     Hidden by default.
     """
-    def __init__(self, parentPage, removeSiblings=False, vsb=False, hsb=False, pack=False, scrollable=False, mouseScroll=True, resizeable=False, hideMultiline=False, **parameters):
+    def __init__(self, parentPage, removeSiblings=False, vsb=False, hsb=False, pack=False, scrollable=False, mouseScroll=True, resizeable=False, hideMultiline=False, lazy=False, **parameters):
         """
         Create a new page that is hidden by default and controls one frame. Becomes scrollable if width or height is defined.
 
@@ -24,6 +24,7 @@ class Page(Element_Page, Element_Page_App, Page_App):
         :param None or int height: Width in pixels
         :param vsb: Vertical scrollbar if page is scrollable.
         :param hsb: Horiziontal scrollbar if page is scrollable
+        :param lazy: Whether to wait with creating any tkinter widget of page and it's children until it's packed or shown
         :param packParameters: Parameters given to page's tkinter Frame when being packed.
         """
         Element_Page_App.__init__(self)
@@ -50,41 +51,34 @@ class Page(Element_Page, Element_Page_App, Page_App):
         self.app = parentPage.app
         self.baseElement = None
         self.topElement = None
-        self.frame = self.app.Frame(self, pack=False, makeBase=True, resizeable=resizeable, **parameters)
+        self._pageChain = None
+        self._parentsByClass = {}
+        self.frame = self.app.Frame(self, pack=False, makeBase=True, resizeable=resizeable, lazy=lazy, **parameters)
 
 
         if "width" in parameters or "height" in parameters:
-            self.frame.widget.pack_propagate(0)
+            self.frame.afterMaterialize(lambda: self.frame.widget.pack_propagate(0))
 
         if self.scrollable:
             self.canvas = self.app.Canvas(self, pack=False, fill="both", side="left", expand=True, bd=-2)
-            self.canvas.widget.pack_propagate(0)  # Not sure why we need it
+            self.canvas.afterMaterialize(lambda: self.canvas.widget.pack_propagate(0))  # Not sure why we need it
 
             if self.vsb:
-                self.vsb = self.app.Scrollbar(self, orient="vertical", command=self.canvas.widget.yview, side="right", fill="y")
-                self.canvas.widgetConfig(yscrollcommand=self.vsb.widget.set)
+                self.vsb = self.app.Scrollbar(self, orient="vertical", side="right", fill="y")
+                self.vsb.afterMaterialize(lambda: self._connectScrollbar(self.vsb, "y"))
             if self.hsb:
-                self.hsb = self.app.Scrollbar(self, orient="horizontal", command=self.canvas.widget.xview, side="bottom", fill="x")
-                self.canvas.widgetConfig(xscrollcommand=self.hsb.widget.set)
+                self.hsb = self.app.Scrollbar(self, orient="horizontal", side="bottom", fill="x")
+                self.hsb.afterMaterialize(lambda: self._connectScrollbar(self.hsb, "x"))
 
             self.canvas.pack()
             self.canvas.makeBase()
 
+            self.scrollSize = None
+            self.canvasWindow = None
             self.canvasFrame = self.app.Frame(self, pack=False, makeBase=True, padx=2, pady=2)
-            self.canvas.widget.create_window(0, 0, window=self.canvasFrame.widget, anchor="nw")
+            self.canvasFrame.afterMaterialize(self._createCanvasWindow)
 
-            def _canvasConfigure(_):
-                self.canvas.widgetConfig(scrollregion=self.canvas.widget.bbox("all"))
-
-                # Trying to fix view being outside content, but it's tough
-                # scrollregion = self.canvas.getWidgetConfig("scrollregion").split(" ")
-                # regionSize = Vec2(scrollregion[2], scrollregion[3])
-                # canvasSize = self.canvas.getSize()
-                # view = Vec2(self.canvas.widget.xview()[0], self.canvas.widget.yview()[0])
-                # if not canvasSize <= regionSize or 1:
-                #     print(regionSize, canvasSize, view)
-
-            self.canvasFrame.createBind("<Configure>", _canvasConfigure)
+            self.canvasFrame.createBind("<Configure>", self._canvasConfigure)
 
             self.canvas.widgetConfig(yscrollincrement="1")
             self.canvas.widgetConfig(xscrollincrement="1")
@@ -92,6 +86,84 @@ class Page(Element_Page, Element_Page_App, Page_App):
         if pack:
             self.pack()
 
+    def _getPageChain(self):
+        """
+        Get this page followed by it's parent pages up to the top page, cached as parentPage never changes.
+
+        :rtype: tuple[Page]
+        """
+        if self._pageChain is None:
+            if self.parentPage is self.app:
+                self._pageChain = (self, )
+            else:
+                self._pageChain = (self, ) + self.parentPage._getPageChain()
+        return self._pageChain
+
+    def _getParentByClass(self, className):
+        """
+        Get first page of _getPageChain() that matches className or None, cached per className.
+
+        :param str or type className: Name or type of page, used by typeChecker
+        """
+        if className not in self._parentsByClass:
+            if typeChecker(self, className, error=False):
+                self._parentsByClass[className] = self
+            elif self.parentPage is self.app:
+                self._parentsByClass[className] = None
+            else:
+                self._parentsByClass[className] = self.parentPage._getParentByClass(className)
+        return self._parentsByClass[className]
+
+    def _connectScrollbar(self, scrollbar, axis):
+        """
+        Let a scrollbar and canvas of a scrollable page control each other, called once both are materialized.
+
+        :param generalgui.Scrollbar scrollbar: vsb or hsb
+        :param str axis: "x" or "y"
+        """
+        scrollbar.widgetConfig(command=getattr(self.canvas.widget, f"{axis}view"))
+        self.canvas.widgetConfig(**{f"{axis}scrollcommand": scrollbar.widget.set})
+
+    def _createCanvasWindow(self):
+        """
+        Put canvasFrame in canvas of a scrollable page, called once canvasFrame is materialized.
+        """
+        self.canvasWindow = self.canvas.widget.create_window(0, 0, window=self.canvasFrame.widget, anchor="nw")
+
+    def _canvasConfigure(self):
+        """
+        Update canvas' scrollregion to fit canvasFrame, or to scrollSize if it's defined.
+        """
+        scrollregion = self.canvas.widget.bbox("all")
+        if self.scrollSize is not None and scrollregion:
+            scrollregion = (0, 0, self.scrollSize.x or scrollregion[2], self.scrollSize.y or scrollregion[3])
+        self.canvas.widgetConfig(scrollregion=scrollregion)
+
+        # Trying to fix view being outside content, but it's tough
+        # scrollregion = self.canvas.getWidgetConfig("scrollregion").split(" ")
+        # regionSize = Vec2(scrollregion[2], scrollregion[3])
+        # canvasSize = self.canvas.getSize()
+        # view = Vec2(self.canvas.widget.xview()[0], self.canvas.widget.yview()[0])
+        # if not canvasSize <= regionSize or 1:
+        #     print(regionSize, canvasSize, view)
+
+    def setScrollSize(self, size=None):
+        """
+        Set a fixed scrollregion size for a scrollable page, allows scrolling to content that isn't created yet.
+
+        :param Vec2 or None size: Size in pixels, an axis of 0 uses content's size. None to only use content's size.
+        """
+        self.scrollSize = None if size is None else Vec2(size)
+        self._canvasConfigure()
+
+    def placeCanvasFrame(self, pos):
+        """
+        Move canvasFrame inside canvas of a scrollable page.
+
+        :param Vec2 pos: Pixel position of canvasFrame's upper left corner
+        """
+        self.canvas.widget.coords(self.canvasWindow, pos.x, pos.y)
+
     def toggleAllMultilines(self, show=None):
         """
         Toggles all labels to show or hide multilines.
@@ -0,0 +1,420 @@
+"""CanvasGrid class that inherits Page"""
+
+from generalgui import Label, Page
+
+from generalvector import Vec2
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+
+class CanvasGrid(Page):
+    """
+    Controls a grid of cells drawn as text and rectangle items on one canvas, inherits Page.
+    Lighter alternative to Grid when there are a lot of cells since no widgets are created per cell.
+
+    Only visible cells are drawn and their canvas items are reused when scrolling, so memory scales with what's visible.
+    Rows are measured once they're first drawn, so setting values doesn't measure every cell.
+    Rows that haven't been measured are one line high and columns widen as wider cells are scrolled into view.
+    Cell positions are (column, row) Vec2's starting at 0.
+    Clicks are hit-tested to cell positions, menuCellPos is the cell that was last right clicked.
+    """
+    def __init__(self, parentPage=None, anchor="w", color=False, maxLen=None, padx=1, pady=1, borderwidth=0, relief="flat", onClick=None, onScroll=None, onResize=None, **parameters):
+        """
+        Create a scrollable page with a canvas that cells are drawn on.
+
+        :param generalgui.Page parentPage: Parent page
+        :param str anchor: Anchor of each cell's text, n, s, e, w or c
+        :param color: Whether to color alternating rows
+        :param int maxLen: Hide values longer than this, enables hideMultiline
+        :param int padx: Horizontal padding inside each cell
+        :param int pady: Vertical padding inside each cell
+        :param int borderwidth: Width of each cell's outline
+        :param str relief: Cells get an outline unless relief is flat
+        :param function onClick: Called with event when a cell is left clicked, replaces toggling of multilines
+        :param function onScroll: Called when canvas is scrolled
+        :param function onResize: Called when a column width or row height changed by itself
+        """
+        parameters["scrollable"] = True
+        super().__init__(parentPage=parentPage, **parameters)
+
+        self.anchor = anchor
+        self.color = color
+        self.maxLen = maxLen
+        self.hideMultiline = self.hideMultiline or bool(maxLen)
+        self.padx = padx
+        self.pady = pady
+        self.borderwidth = borderwidth
+        self.relief = relief
+        self.onClick = onClick
+        self.onScroll = onScroll
+        self.onResize = onResize
+
+        self.font = "TkDefaultFont"
+
+        self.size = Vec2(0)
+        self.values = []
+        self.formatted = None
+        self.shownMultilines = set()
+        self.measuredColumnWidths = []
+        self.measuredRowHeights = []
+        self._measuredRows = []
+        self.columnWidths = []
+        self.rowHeights = []
+        self.menuCellPos = None
+        self._columnOffsets = [0]
+        self._rowOffsets = [0]
+        self._items = []
+
+        self.canvasFrame.afterMaterialize(self._hideCanvasWindow)
+        self.canvas.widgetConfig(xscrollcommand=self._getScrollCommand(self.hsb))
+        self.canvas.widgetConfig(yscrollcommand=self._getScrollCommand(self.vsb))
+        self.canvas.createBind("<Configure>", self.render)
+        self.canvas.createBind("<Button-1>", self._click)
+        self.canvas.createBind("<Button-3>", self._storeMenuCellPos)
+
+    def _hideCanvasWindow(self):
+        """
+        Hide canvasFrame as cells are drawn on canvas, called once canvasWindow is created.
+        """
+        self.canvas.widget.itemconfigure(self.canvasWindow, state="hidden")
+
+    def _getScrollCommand(self, scrollbar):
+        """
+        Create a scrollcommand for canvas that also draws cells that became visible.
+
+        :param generalgui.Scrollbar or bool scrollbar: Optional scrollbar to keep updated
+        """
+        def command(*args):
+            """Set scrollbar, render and call onScroll."""
+            if scrollbar:
+                scrollbar.widget.set(*args)
+            self.render()
+            if self.onScroll:
+                self.onScroll()
+        return command
+
+    def setValues(self, values, size, formatted=None):
+        """
+        Set every cell's value, measure them and draw visible cells.
+
+        :param values: Values going left to right row by row
+        :param Vec2 size: Size of values as Vec2, needs to match values len
+        :param list[tuple] formatted: Optional pre-formatted (text, shortText, hideable) of each value
+        :raises ValueError: If values or formatted length doesn't match size
+        """
+        values = list(values)
+        if len(values) != size.x * size.y:
+            raise ValueError("Values length doesn't match size")
+        if formatted is not None and len(formatted) != len(values):
+            raise ValueError("Formatted length doesn't match size")
+
+        self.size = Vec2(size)
+        self.values = [values[y * size.x:(y + 1) * size.x] for y in range(size.y)]
+        self.formatted = None if formatted is None else [formatted[y * size.x:(y + 1) * size.x] for y in range(size.y)]
+        self.shownMultilines = set()
+        self.measure()
+
+    def getValue(self, pos):
+        """
+        Get value of a cell.
+
+        :param Vec2 pos: Cell position
+        """
+        return self.values[pos.y][pos.x]
+
+    def getValues(self):
+        """Returns all cell values in a list, going left to right row by row"""
+        return [value for row in self.values for value in row]
+
+    def getFormatted(self, pos):
+        """
+        Get (text, shortText, hideable) of a cell, formatted here unless pre-formatted values were given.
+
+        :param Vec2 pos: Cell position
+        """
+        if self.formatted is not None:
+            return self.formatted[pos.y][pos.x]
+        value = self.getValue(pos)
+        hideable = Label.isHideable(value, self.maxLen)
+        return str(value), Label.getShortValue(value, self.maxLen) if hideable else None, hideable
+
+    def isHideable(self, pos):
+        """
+        Get whether a cell's value has multiple lines or is longer than maxLen.
+
+        :param Vec2 pos: Cell position
+        """
+        return self.getFormatted(pos)[2]
+
+    def isHidden(self, pos):
+        """
+        Get whether a cell is currently showing a shortened value.
+
+        :param Vec2 pos: Cell position
+        """
+        return self.hideMultiline and (pos.x, pos.y) not in self.shownMultilines and self.isHideable(pos)
+
+    def getDisplayedText(self, pos):
+        """
+        Get text that's drawn for a cell.
+
+        :param Vec2 pos: Cell position
+        """
+        text, shortText, hideable = self.getFormatted(pos)
+        if hideable and self.hideMultiline and (pos.x, pos.y) not in self.shownMultilines:
+            return shortText
+        return text
+
+    def getRowColor(self, row):
+        """
+        Get fill color of a row, empty string means transparent.
+
+        :param int row:
+        """
+        return "gray88" if self.color and row % 2 else ""
+
+    def _measureCell(self, pos):
+        """
+        Get pixel size of a cell's displayed text including padding and outline.
+
+        :param Vec2 pos: Cell position
+        :rtype: tuple[int]
+        """
+        width, height = self.app.measureTextSize(self.getDisplayedText(pos), self.font)
+        inset = Vec2(self.padx, self.pady) + self.borderwidth
+        return width + inset.x * 2, height + inset.y * 2
+
+    def _getLineHeight(self):
+        """
+        Get pixel height of a row with one line of text, used for rows that haven't been measured.
+        """
+        return self.app.getLineHeight(self.font) + (self.pady + self.borderwidth) * 2
+
+    def _measurePositions(self, positions):
+        """
+        Widen measured column widths and row heights to fit cells.
+
+        :param positions: Cell positions as Vec2's
+        """
+        for pos in positions:
+            width, height = self._measureCell(pos)
+            self.measuredColumnWidths[pos.x] = max(self.measuredColumnWidths[pos.x], width)
+            self.measuredRowHeights[pos.y] = max(self.measuredRowHeights[pos.y], height)
+
+    def measure(self, column=None, row=None):
+        """
+        Measure cells to get width of each column and height of each row, then draw visible cells.
+        Every row is measured again as it's drawn unless column or row is defined, a column is only measured in rows that have been measured.
+
+        :param int column: Optional single column to measure
+        :param int row: Optional single row to measure
+        """
+        if column is None and row is None:
+            self.measuredColumnWidths = [0] * self.size.x
+            self.measuredRowHeights = [self._getLineHeight()] * self.size.y
+            self._measuredRows = [False] * self.size.y
+        else:
+            positions = []
+            if column is not None:
+                self.measuredColumnWidths[column] = 0
+                positions.extend(Vec2(column, y) for y in range(self.size.y) if self._measuredRows[y])
+            if row is not None:
+                self.measuredRowHeights[row] = 0
+                self._measuredRows[row] = True
+                positions.extend(Vec2(x, row) for x in range(self.size.x))
+            self._measurePositions(positions)
+
+        self.columnWidths = list(self.measuredColumnWidths)
+        self.rowHeights = list(self.measuredRowHeights)
+        self._updateOffsets()
+
+    def _measureRows(self, rows):
+        """
+        Measure rows that haven't been measured, columns are widened and rows are given their height where needed.
+
+        :param range rows: Rows to measure
+        :return: Whether a column width or row height changed
+        """
+        rows = [row for row in rows if not self._measuredRows[row]]
+        if not rows:
+            return False
+        for row in rows:
+            self._measuredRows[row] = True
+        self._measurePositions(Vec2(x, row) for row in rows for x in range(self.size.x))
+
+        changed = False
+        for x, width in enumerate(self.measuredColumnWidths):
+            if width > self.columnWidths[x]:
+                self.columnWidths[x] = width
+                changed = True
+        for row in rows:
+            if self.measuredRowHeights[row] > self.rowHeights[row]:
+                self.rowHeights[row] = self.measuredRowHeights[row]
+                changed = True
+        return changed
+
+    def setColumnWidths(self, widths):
+        """
+        Set width of each column in pixels, used to sync columns with another CanvasGrid.
+
+        :param list[int] widths:
+        """
+        self.columnWidths = list(widths)
+        self._updateOffsets()
+
+    def setRowHeights(self, heights):
+        """
+        Set height of each row in pixels, used to sync rows with another CanvasGrid.
+
+        :param list[int] heights:
+        """
+        self.rowHeights = list(heights)
+        self._updateOffsets()
+
+    def getTotalSize(self):
+        """Get pixel size of all cells together as a Vec2."""
+        return Vec2(self._columnOffsets[-1], self._rowOffsets[-1])
+
+    def _updateOffsets(self):
+        """Update cumulative offsets from columnWidths and rowHeights, give canvas the size of all cells and draw cells again."""
+        self._columnOffsets = [0] + list(accumulate(self.columnWidths))
+        self._rowOffsets = [0] + list(accumulate(self.rowHeights))
+        self.setScrollSize(self.getTotalSize().max(1))
+        self.render()
+
+    def getCellPos(self, event):
+        """
+        Get position of cell at an event's coordinates, or None if there's no cell there.
+
+        :param event: Event from canvas
+        :rtype: Vec2 or None
+        """
+        x = self.canvas.widget.canvasx(event.x)
+        y = self.canvas.widget.canvasy(event.y)
+        column = bisect_right(self._columnOffsets, x) - 1
+        row = bisect_right(self._rowOffsets, y) - 1
+        if 0 <= column < self.size.x and 0 <= row < self.size.y:
+            return Vec2(column, row)
+
+    def _getVisibleRange(self, offsets, start, length):
+        """
+        Get range of columns or rows that overlap a pixel span.
+
+        :param list[int] offsets: Cumulative column or row offsets
+        :param float start: Start of span in canvas coordinates
+        :param float length: Length of span
+        """
+        first = max(0, bisect_right(offsets, start) - 1)
+        last = min(len(offsets) - 1, bisect_left(offsets, start + length))
+        return range(first, last)
+
+    def render(self):
+        """
+        Draw cells that are visible in canvas, reusing canvas items from previous render and hiding excess ones.
+        """
+        if self.removed:
+            return
+
+        canvas = self.canvas.widget
+        if canvas.winfo_ismapped():
+            canvasSize = Vec2(canvas.winfo_width(), canvas.winfo_height())
+        else:
+            canvasSize = Vec2(canvas.winfo_reqwidth(), canvas.winfo_reqheight())
+        topLeft = Vec2(canvas.canvasx(0), canvas.canvasy(0))
+
+        rows = self._getVisibleRange(self._rowOffsets, topLeft.y, canvasSize.y)
+        if self._measureRows(rows):
+            self._updateOffsets()
+            if self.onResize:
+                self.onResize()
+            return
+        columns = self._getVisibleRange(self._columnOffsets, topLeft.x, canvasSize.x)
+        outline = "gray70" if self.borderwidth and self.relief != "flat" else ""
+        inset = Vec2(self.padx, self.pady) + self.borderwidth
+
+        i = 0
+        for row in rows:
+            y0, y1 = self._rowOffsets[row], self._rowOffsets[row + 1]
+            fill = self.getRowColor(row)
+            for column in columns:
+                x0, x1 = self._columnOffsets[column], self._columnOffsets[column + 1]
+                pos = Vec2(column, row)
+
+                if i < len(self._items):
+                    rect, text = self._items[i]
+                else:
+                    rect = canvas.create_rectangle(0, 0, 0, 0)
+                    text = canvas.create_text(0, 0, font=self.font, justify="left")
+                    self._items.append((rect, text))
+                i += 1
+
+                canvas.coords(rect, x0, y0, x1 - 1, y1 - 1)
+                canvas.itemconfigure(rect, fill=fill, outline=outline, width=self.borderwidth, state="normal")
+
+                textX = x0 + inset.x if "w" in self.anchor else x1 - inset.x if "e" in self.anchor else (x0 + x1) / 2
+                textY = y0 + inset.y if "n" in self.anchor else y1 - inset.y if "s" in self.anchor else (y0 + y1) / 2
+                canvas.coords(text, textX, textY)
+                canvas.itemconfigure(text, text=self.getDisplayedText(pos), anchor=self.anchor if self.anchor != "c" else "center",
+                                     fill="gray60" if self.isHidden(pos) else "black", state="normal")
+
+        for rect, text in self._items[i:]:
+            canvas.itemconfigure(rect, state="hidden")
+            canvas.itemconfigure(text, state="hidden")
+
+    def _click(self, event):
+        """Call onClick if a cell was clicked, otherwise toggle clicked cell's multilines."""
+        pos = self.getCellPos(event)
+        if pos is None:
+            return
+        if self.onClick:
+            self.onClick(event)
+        elif self.hideMultiline:
+            self.toggleMultilines(pos)
+
+    def _storeMenuCellPos(self, event):
+        """Store which cell was right clicked so that menu functions can get it."""
+        self.menuCellPos = self.getCellPos(event)
+
+    def toggleMultilines(self, pos, show=None):
+        """
+        Toggle whether a cell shows it's entire value or only it's first line.
+
+        :param Vec2 pos: Cell position
+        :param bool show: Whether to show multiline or not. Leave as None to toggle state.
+        """
+        if not self.hideMultiline or not self.isHideable(pos):
+            return
+
+        key = (pos.x, pos.y)
+        if show is None:
+            show = key not in self.shownMultilines
+        if show:
+            self.shownMultilines.add(key)
+        else:
+            self.shownMultilines.discard(key)
+
+        self.measure(column=pos.x, row=pos.y)
+        if self.onResize:
+            self.onResize()
+
+    def toggleAllMultilines(self, show=None):
+        """
+        Toggles all cells to show or hide multilines.
+
+        :param bool show: Whether to show multilines or not. Leave as None to toggle each cell.
+        """
+        if not self.hideMultiline:
+            return
+
+        hideable = {(pos.x, pos.y) for pos in Vec2(0).range(self.size) if self.isHideable(pos)}
+        if show is None:
+            self.shownMultilines = hideable - self.shownMultilines
+        elif show:
+            self.shownMultilines = hideable
+        else:
+            self.shownMultilines = set()
+
+        self.measure()
+        if self.onResize:
+            self.onResize()
@@ -5,32 +5,173 @@ from generalgui.element import Element
 
 from generalvector import Vec2
 
-from generallibrary.types import typeChecker
+from generallibrary.functions import defaults
 
 from generallibrary.values import debug
 
+import inspect
+import heapq
+import bisect
+
 
 class Grid(Page):
     """
     Controls a grid, inherits Page.
+
+    Gridded elements are indexed by position as they're gridded, hidden and removed, so looking up cells doesn't ask tkinter.
+    gridCells maps (x, y) to the top elements in that cell, latest gridded last, and gridPositions maps top elements to (x, y).
+
+    Each pattern used by getFirstPatternPos(), appendToColumn() and appendToRow() keeps a free slot cursor and a heap of holes.
+    Every slot before the cursor was filled when it passed, and slots before it that are emptied are pushed as holes, so finding a free slot doesn't scan filled ones again.
+
+    A sparse Grid also keeps rowIndexes and columnIndexes, mapping each row and column to the sorted positions of it's occupied cells.
+    getFirstElementPos() then looks up occupied cells instead of stepping over empty ones and getGridSize() only looks at occupied rows and columns.
     """
-    def __init__(self, parentPage=None, **parameters):
+    def __init__(self, parentPage=None, sparse=False, **parameters):
+        """
+        :param generalgui.App or generalgui.Page parentPage:
+        :param bool sparse: Whether to keep sorted indexes of occupied cells for each row and column, for huge grids that are mostly empty
+        """
+        self.gridCells = {}
+        self.gridPositions = {}
+        self._gridSize = (0, 0)
+        self._patternSlots = {}
+        self.sparse = sparse
+        self.rowIndexes = {}
+        self.columnIndexes = {}
         super().__init__(parentPage=parentPage, **parameters)
 
+    def _indexGridElement(self, element, x, y):
+        """
+        Index an element that has just been gridded in this grid, called by Element_Page._grid().
+
+        :param generalgui.element.Element element: Top element of gridded part
+        :param int x: Column
+        :param int y: Row
+        """
+        self._unindexGridElement(element)
+        pos = (int(x), int(y))
+        self.gridPositions[element] = pos
+        if pos not in self.gridCells:
+            self.gridCells[pos] = []
+            if self.sparse:
+                bisect.insort(self.rowIndexes.setdefault(pos[1], []), pos[0])
+                bisect.insort(self.columnIndexes.setdefault(pos[0], []), pos[1])
+        self.gridCells[pos].append(element)
+        if self._gridSize is not None:
+            self._gridSize = (max(self._gridSize[0], pos[0] + 1), max(self._gridSize[1], pos[1] + 1))
+
+    def _unindexGridElement(self, element):
+        """
+        Forget an element that's no longer gridded in this grid, called when it's hidden or removed.
+
+        :param generalgui.element.Element element: Top element of gridded part
+        """
+        pos = self.gridPositions.pop(element, None)
+        if pos is None:
+            return
+        cell = self.gridCells[pos]
+        cell.remove(element)
+        if not cell:
+            del self.gridCells[pos]
+            if self._gridSize is not None and (pos[0] + 1 == self._gridSize[0] or pos[1] + 1 == self._gridSize[1]):
+                self._gridSize = None
+            if self.sparse:
+                for indexes, key, value in ((self.rowIndexes, pos[1], pos[0]), (self.columnIndexes, pos[0], pos[1])):
+                    line = indexes[key]
+                    del line[bisect.bisect_left(line, value)]
+                    if not line:
+                        del indexes[key]
+            self._freePatternSlot(pos)
+
+    @staticmethod
+    def _getPatternIndex(pattern, pos):
+        """
+        Get index of a position in a pattern, or None if it's not in pattern.
+
+        :param tuple pattern: (startX, startY, firstX, firstY, secondX, secondY, maxFirstSteps)
+        :param tuple pos: (x, y)
+        :raises ArithmeticError: If firstStep and secondStep are parallel so index can't be solved
+        :rtype: int or None
+        """
+        startX, startY, firstX, firstY, secondX, secondY, maxFirstSteps = pattern
+        dx, dy = pos[0] - startX, pos[1] - startY
+
+        if maxFirstSteps == 1:
+            if secondX:
+                second, rest = divmod(dx, secondX)
+                return second if not rest and second >= 0 and dy == second * secondY else None
+            if secondY:
+                second, rest = divmod(dy, secondY)
+                return second if not rest and second >= 0 and dx == 0 else None
+            return 0 if dx == dy == 0 else None
+
+        determinant = firstX * secondY - firstY * secondX
+        if not determinant:
+            raise ArithmeticError("Parallel steps")
+        first, firstRest = divmod(dx * secondY - dy * secondX, determinant)
+        second, secondRest = divmod(firstX * dy - firstY * dx, determinant)
+        if firstRest or secondRest or not 0 <= first < maxFirstSteps or second < 0:
+            return None
+        return second * maxFirstSteps + first
+
+    def _freePatternSlot(self, pos):
+        """
+        Push an emptied cell as a hole to every pattern that has passed it.
+
+        :param tuple pos: (x, y)
+        """
+        for pattern, slots in self._patternSlots.items():
+            try:
+                index = self._getPatternIndex(pattern, pos)
+            except ArithmeticError:
+                slots[0] = 0
+                slots[1] = []
+                continue
+            if index is not None and index < slots[0]:
+                heapq.heappush(slots[1], index)
+
+    def _getFreePatternPos(self, pattern):
+        """
+        Get first empty position in a pattern using it's cursor and holes.
+
+        :param tuple pattern: (startX, startY, firstX, firstY, secondX, secondY, maxFirstSteps)
+        :rtype: tuple
+        """
+        startX, startY, firstX, firstY, secondX, secondY, maxFirstSteps = pattern
+        slots = self._patternSlots.setdefault(pattern, [0, []])
+        holes = slots[1]
+
+        def getPos(index):
+            second, first = divmod(index, maxFirstSteps)
+            return startX + first * firstX + second * secondX, startY + first * firstY + second * secondY
+
+        while holes:
+            pos = getPos(holes[0])
+            if pos not in self.gridCells:
+                return pos
+            heapq.heappop(holes)
+
+        while (pos := getPos(slots[0])) in self.gridCells:
+            slots[0] += 1
+        return pos
+
     def getGridElement(self, pos):
         """
         Returns the element in a certain position in grid, or None
 
         :param Vec2 pos: Grid position to check
+        :raises ValueError: If pos isn't whole numbers
         """
-        pos = Vec2(pos)
-        if not pos >= Vec2(0, 0):
+        if not isinstance(pos, Vec2):
+            pos = Vec2(pos)
+        if pos.x < 0 or pos.y < 0:
             return None
+        if pos.x != int(pos.x) or pos.y != int(pos.y):
+            raise ValueError(f"{pos} failed 'ints' sanitizing")
 
-        pos = pos.sanitize(ints=True)
-
-        if slave := self.getBaseWidget().grid_slaves(column=pos.x, row=pos.y):
-            return slave[0].element
+        if cell := self.gridCells.get((int(pos.x), int(pos.y))):
+            return cell[-1]
 
     def getGridPos(self, element):
         """
@@ -42,100 +183,181 @@ class Grid(Page):
         if element.parentPage != self:
             raise AttributeError(f"{element}'s parent is {element.parentPage}, not {self}")
 
-        gridInfo = element.getTopWidget().grid_info()
-
-        if "column" not in gridInfo or "row" not in gridInfo:
-            raise AttributeError(f"{gridInfo} missing column and or row")
+        pos = self.gridPositions.get(element.getTopElement())
+        if pos is None:
+            raise AttributeError(f"{element} isn't gridded in {self}")
 
-        return Vec2(gridInfo["column"], gridInfo["row"])
+        return Vec2(*pos)
 
     def getGridSize(self):
         """
         Get current grid size as a Vec2.
         Only looks at cell with greatest position, so you could say (gridSize - Vec2(1)) is just pos of bottom right cell.
         """
-        size = self.getBaseWidget().grid_size()
-        return Vec2(size[0], size[1])
+        if self._gridSize is None:
+            if not self.gridCells:
+                self._gridSize = (0, 0)
+            elif self.sparse:
+                self._gridSize = (max(self.columnIndexes) + 1, max(self.rowIndexes) + 1)
+            else:
+                self._gridSize = (max(x for x, y in self.gridCells) + 1, max(y for x, y in self.gridCells) + 1)
+        return Vec2(*self._gridSize)
+
+    def getRowColor(self, y):
+        """
+        Get background color of a row when using fillGrid's color parameter, None is default color.
 
-    def _removeOrHideEle(self, values, element):
-        """Don't remove an element that can be displayed as is"""
-        if element in values:
+        :param int y: Row in grid
+        """
+        return None if y % 2 else "gray88"
+
+    def colorElement(self, element, y):
+        """
+        Give an existing element the background color of a row, used when cells are moved between rows.
+        Updates original style if element has a StyleHandler so that hover styles still restore the right color.
+
+        :param generalgui.element.Element element:
+        :param int y: Row in grid
+        """
+        color = self.getRowColor(y)
+        if color is None:
+            color = self.getBaseWidget()["bg"]
+
+        if element.styleHandler and "bg" in element.styleHandler.originalStyle.kwargs:
+            element.styleHandler.originalStyle["bg"] = color
+            element.styleHandler.update()
+        else:
+            element.widgetConfig(bg=color)
+
+    def _removeOrHideEle(self, valueElements, element):
+        """
+        Don't remove an element that can be displayed as is
+
+        :param set[int] valueElements: Ids of elements that are values of the current fill
+        :param generalgui.element.Element element:
+        """
+        if id(element) in valueElements:
             element.hide()
         else:
-            element.remove()
+            self.app.recycleElement(element)
 
-    def fillGrid(self, eleCls, start, size, values=None, removeExcess=False, color=False, **parameters):
+    def fillGrid(self, eleCls, start, size, values=None, removeExcess=False, color=False, formatted=None, **parameters):
         """
         Fill grid with values, using a start position and a size.
         If there already is an element in the cell then it's re-used, unless value is an Element.
 
+        Cells are resolved in one pass over the fill area using gridCells, new elements are gridded with one tkinter call at their explicit columns and rows.
+        Spreadsheet's sizes are synced once afterwards instead of for every updated element.
+        New elements are borrowed from App's element pool and removed ones are recycled into it.
+
         :param class eleCls: Class to be created in each cell unless value is an Element
         :param Vec2 start: Start position
         :param Vec2 size: Size of values as Vec2, needs to match values len
         :param list[str or generalgui.element.Element] values: Values to be given to object as 'value' parameter
         :param removeExcess: Whether to remove cells with a greater position than fill area
         :param color: Whether to color alternating rows
+        :param list[tuple] formatted: Optional pre-formatted (text, shortText, hideable) of each value, given to eleCls as 'formatted' parameter
         :param parameters: Parameters to be given to objects
+        :return: Elements in fill area, going left to right row by row
+        :rtype: list[generalgui.element.Element]
         """
         if eleCls == Label and "anchor" not in parameters:
             parameters["anchor"] = "w"
 
-        currentSize = self.getGridSize()
-        maxSize = currentSize.max(start + size)
-        fillRange = start.range(size)
+        start = Vec2(start).sanitize(ints=True)
+        size = Vec2(size).sanitize(ints=True, positiveOrZero=True)
+        startX, startY, width, height = int(start.x), int(start.y), int(size.x), int(size.y)
+        count = width * height
 
         if values is not None:
             values = list(values)
-            if len(values) != len(fillRange):
+            if len(values) != count:
                 raise ValueError("Values length doesn't match fillRange's")
-
-        for pos in Vec2(0).range(maxSize):
-            # Create cell with pos and values[0]
-            if fillRange and pos == fillRange[0]:
-
-                value = values[0] if values else None
-                valueIsElement = typeChecker(value, "Element", error=False) and value.__class__.__name__ != "type"
-                existingElement = self.getGridElement(pos)
-
-                # debug(locals(), "eleCls", "pos", "value", "valueIsElement", "existingElement")
-
-                if valueIsElement:
-                    element = value
-                    if element.parentPage != self:
-                        raise AttributeError(f"{element}'s parentPage has to be grid {self}")
-
+        if formatted is not None:
+            formatted = list(formatted)
+            if values is None or len(formatted) != len(values):
+                raise ValueError("Formatted length doesn't match values'")
+
+        valueElements = {id(value) for value in values if isinstance(value, Element)} if values else set()
+        setValueFuncs = {}
+        defaultColor = None
+        updated = False
+        created = []
+        elements = []
+
+        for i in range(count):
+            x, y = startX + i % width, startY + i // width
+            value = values[i] if values else None
+            cell = self.gridCells.get((x, y))
+            existingElement = cell[-1] if cell else None
+
+            if isinstance(value, Element):
+                if value.parentPage != self:
+                    raise AttributeError(f"{value}'s parentPage has to be grid {self}")
+                if existingElement is not value:
                     if existingElement:
-                        self._removeOrHideEle(values, existingElement)
-
-                    element.grid(pos)
-
-                else:
-                    if existingElement:
-                        sameCls = typeChecker(existingElement, eleCls, error=False)
-                        canSetValue = hasattr(existingElement, "setValue")
-
-                        # debug(locals(), "existingElement", "sameCls", "canSetValue", "value")
-
-                        if sameCls and (canSetValue or value is None):
-                            if value is not None:
-                                existingElement.setValue(value)
-                        else:
-                            self._removeOrHideEle(values, existingElement)
-                            existingElement = None
+                        self._removeOrHideEle(valueElements, existingElement)
+                    value.grid(Vec2(x, y))
+                elements.append(value)
+                continue
+
+            if existingElement:
+                if isinstance(existingElement, eleCls) and (value is None or hasattr(existingElement, "setValue")):
+                    if value is not None or formatted:
+                        cls = existingElement.__class__
+                        if cls not in setValueFuncs:
+                            setValueFuncs[cls] = inspect.unwrap(cls.setValue)
+                        setValueFuncs[cls](existingElement, value, **({"formatted": formatted[i]} if formatted else {}))
+                        updated = True
+                    elements.append(existingElement)
+                    continue
+                self._removeOrHideEle(valueElements, existingElement)
+
+            if color and y:
+                # Explicit default color so that pooled elements that were recolored are reset
+                if (rowColor := self.getRowColor(y)) is None:
+                    if defaultColor is None:
+                        defaultColor = self.getBaseWidget()["bg"]
+                    rowColor = defaultColor
+                parameters["bg"] = rowColor
+            element = self.app.borrowElement(eleCls, self, column=x, row=y, value=value, pack=False, **({"formatted": formatted[i]} if formatted else {}), **parameters)
+            created.append((x, y, element))
+            elements.append(element)
+
+        self._gridElements(created)
+
+        if removeExcess:
+            excess = [pos for pos in self.gridCells if pos[0] >= startX + width or pos[1] >= startY + height]
+            self.app.recycleElements([element for pos in excess for element in self.gridCells[pos]])
+
+        if updated and (spreadsheet := self.getFirstParentByClass("Spreadsheet")):
+            spreadsheet.syncSizes()
+
+        return elements
+
+    def _gridElements(self, created):
+        """
+        Grid new elements with one tkinter call that loops over them in Tcl, giving each it's own column and row.
+        grid configure applies -column to every window it's given, so windows sharing one call would share a column.
 
-                    if not existingElement:
-                        if color and pos.y:
-                            parameters["bg"] = None if pos.y % 2 else "gray88"
-                        element = eleCls(self, column=pos.x, row=pos.y, value=value, **parameters)
+        :param list[tuple] created: (x, y, element) of elements created with pack=False and the same parameters, in row major order
+        """
+        if not created:
+            return
 
+        # Like tkinter's grid(), options that are None are left out
+        options = defaults({key: value for key, value in created[0][2].packParameters.items() if key not in ("column", "row") and value is not None}, sticky="NSEW")
+        flags = [item for key, value in options.items() for item in (f"-{key}", value)]
 
-                del fillRange[0]
-                if values:
-                    del values[0]
+        cells = [item for x, y, element in created for item in (str(element.getTopWidget()), x, y)]
+        gridCells = ("cells flags", "foreach {path column row} $cells {grid configure $path -column $column -row $row {*}$flags}")
+        self.getBaseWidget().tk.call("apply", gridCells, cells, flags)
+        for x, y, element in created:
+            self._indexGridElement(element, x, y)
 
-            elif removeExcess and not pos <= start + size - 1:
-                if element := self.getGridElement(pos):
-                    element.remove()
+        if self.scrollable:
+            self.app.widget.update()  # To get correct scroll region
+            self.canvas.callBind("<Configure>")  # Update canvas scroll region manually
 
 
 
@@ -179,7 +401,18 @@ class Grid(Page):
             maxPos = self.getGridSize() - 1
         return pos.confineTo(Vec2(0, 0), maxPos, margin=0.5)
 
-    def _traverse(self, checkPosFunc, startPos, step=None, maxPos=None, confine=False, maxSteps=100):
+    def _traverse(self, checkPosFunc, startPos, step=None, maxPos=None, confine=False, maxSteps=100, occupied=False):
+        """
+        Step from startPos until checkPosFunc returns something.
+
+        :param function checkPosFunc: Gets each pos, traversing stops once it returns something other than None
+        :param Vec2 startPos: Inclusive position to start search
+        :param Vec2 step: Directional Vec2 to be used as step for each iteration
+        :param Vec2 maxPos: Lower right corner to stop or confine at, defaults to grid size - 1
+        :param confine: Whether to confine search or not
+        :param int maxSteps: Maximum amount of steps to take without result before returning None
+        :param bool occupied: Whether checkPosFunc returns pos for occupied cells and nothing else, lets a sparse grid look them up instead
+        """
         if step is None:
             step = Vec2(0)
         if maxPos is None:
@@ -192,6 +425,11 @@ class Grid(Page):
 
         pos = self.confinePos(pos, maxPos)
 
+        if occupied and self.sparse and not confine and step != 0:
+            result = self._traverseOccupied(pos, step, maxPos, maxSteps)
+            if result is not False:
+                return result
+
         for i in range(maxSteps + 1):
             if (result := checkPosFunc(pos)) is not None:
                 return result
@@ -204,6 +442,51 @@ class Grid(Page):
                 break
         return None
 
+    def _traverseOccupied(self, pos, step, maxPos, maxSteps):
+        """
+        Get first occupied position when stepping from pos without confining, using rowIndexes and columnIndexes of a sparse grid.
+        Costs as much as the number of occupied cells in the row or column, diagonal steps look at every occupied cell.
+
+        :param Vec2 pos: Start position inside grid
+        :param Vec2 step: Non zero step
+        :param Vec2 maxPos: Lower right corner to stop at
+        :param int maxSteps: Maximum amount of steps
+        :return: Vec2, None if there is none or False if stepping is cheaper
+        """
+        x, y, stepX, stepY = int(pos.x), int(pos.y), int(step.x), int(step.y)
+
+        limit = maxSteps
+        for start, stepAxis, maxAxis in ((x, stepX, int(maxPos.x)), (y, stepY, int(maxPos.y))):
+            if stepAxis > 0:
+                limit = min(limit, (maxAxis - start) // stepAxis)
+            elif stepAxis < 0:
+                limit = min(limit, start // -stepAxis)
+
+        if stepX and stepY:
+            if len(self.gridCells) > limit:
+                return False
+            steps = None
+            for cellX, cellY in self.gridCells:
+                i, rest = divmod(cellX - x, stepX)
+                if not rest and 0 <= i <= limit and cellY - y == i * stepY and (steps is None or i < steps):
+                    steps = i
+            return None if steps is None else Vec2(x + steps * stepX, y + steps * stepY)
+
+        if stepX:
+            line, start, stepAxis = self.rowIndexes.get(y, []), x, stepX
+        else:
+            line, start, stepAxis = self.columnIndexes.get(x, []), y, stepY
+        end = start + limit * stepAxis
+
+        if stepAxis > 0:
+            values = line[bisect.bisect_left(line, start):bisect.bisect_right(line, end)]
+        else:
+            values = reversed(line[bisect.bisect_left(line, end):bisect.bisect_right(line, start)])
+        for value in values:
+            if not (value - start) % stepAxis:
+                return Vec2(value, y) if stepX else Vec2(x, value)
+        return None
+
     def getFirstElementPos(self, startPos, step=None, confine=False, maxSteps=100):
         """
         Get position of first found element.
@@ -220,7 +503,7 @@ class Grid(Page):
             if self.getGridElement(pos):
                 return pos
 
-        return self._traverse(checkPosFunc=checkPosFunc, startPos=startPos, step=step, confine=confine, maxSteps=maxSteps)
+        return self._traverse(checkPosFunc=checkPosFunc, startPos=startPos, step=step, confine=confine, maxSteps=maxSteps, occupied=True)
 
     def getFirstEmptyPos(self, startPos, step=None, confine=False, maxSteps=100):
         """
@@ -259,13 +542,8 @@ class Grid(Page):
         :param Vec2 secondStep: Directional Vec2 to be used as step for each time firstStep has been made maxFirstSteps times
         :param maxFirstSteps: Number of firstSteps before one secondStep
         """
-        pos = startPos
-        while True:
-            for i in range(maxFirstSteps):
-                if not self.getGridElement(pos):
-                    return pos
-                pos += firstStep
-            pos = pos - firstStep * maxFirstSteps + secondStep
+        pattern = (int(startPos.x), int(startPos.y), int(firstStep.x), int(firstStep.y), int(secondStep.x), int(secondStep.y), int(maxFirstSteps))
+        return Vec2(*self._getFreePatternPos(pattern))
 
     def appendToColumn(self, part, column):
         """
@@ -275,9 +553,7 @@ class Grid(Page):
         :param int column: Which column to append to
         :return: Position of filled cell
         """
-        firstEmptyPos = self.getFirstEmptyPos(Vec2(column, 0), Vec2(0, 1))
-        if firstEmptyPos is None:
-            firstEmptyPos = Vec2(column, self.getGridSize().y)
+        firstEmptyPos = Vec2(*self._getFreePatternPos((int(column), 0, 0, 0, 0, 1, 1)))
         part.grid(firstEmptyPos)
         return firstEmptyPos
 
@@ -289,9 +565,7 @@ class Grid(Page):
         :param int row: Which row to append to
         :return: Position of filled cell
         """
-        firstEmptyPos = self.getFirstEmptyPos(Vec2(0, row), Vec2(1, 0))
-        if firstEmptyPos is None:
-            firstEmptyPos = Vec2(self.getGridSize().x, row)
+        firstEmptyPos = Vec2(*self._getFreePatternPos((0, int(row), 0, 0, 1, 0, 1)))
         part.grid(firstEmptyPos)
         return firstEmptyPos
 
@@ -67,14 +67,12 @@ class InputList(ElementList):
         if key in self._inputElements:
             self.removeInput(key)
 
-        label = self.app.Label(self, key)
         pos = self.getFirstPatternPos(secondStep=Vec2(2, 0), maxFirstSteps=self.maxFirstSteps)
-        label.grid(pos)
+        self.app.borrowElement(self.app.Label, self, value=key, pos=pos)
         if value is True or value is False:
-            element = self.app.Checkbutton(parentPage=self, default=value)
+            element = self.app.borrowElement(self.app.Checkbutton, self, default=value, pos=pos + Vec2(1, 0))
         else:
-            element = self.app.Entry(parentPage=self, default=str(value))
-        element.grid(pos + Vec2(1, 0))
+            element = self.app.borrowElement(self.app.Entry, self, default=str(value), pos=pos + Vec2(1, 0))
 
         self._inputElements[key] = element
 
@@ -87,20 +85,20 @@ class InputList(ElementList):
         """
         if element := self.getInputElement(key):
             label = self.getGridElement(self.getGridPos(element) - Vec2(1, 0))
-            element.remove()
-            label.remove()
+            self.app.recycleElement(element)
+            self.app.recycleElement(label)
             del self._inputElements[key]
             return True
         return False
 
     def removeChildren(self, recurrent=False, ignore=None):
         """
-        Simple override to also reset inputElements.
+        Simple override to also reset inputElements, children are recycled into App's element pool.
         """
         if ignore is not None:
             raise NotImplementedError("Cannot use ignore parameter when using inputlist's removeChildren method")
 
-        super().removeChildren(ignore=ignore)
+        self.app.recycleElements(self.getChildren())
         self._inputElements = {}
 
     def packPart(self, element):
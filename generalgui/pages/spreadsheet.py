@@ -1,41 +1,50 @@
 """Spreadsheet class that inherits Page"""
 
-from generalgui import Page, Label, Frame, Grid
+from generalgui import Page, Label, Frame, Grid, CanvasGrid
+from generalgui.shared_methods.virtualizer import Virtualizer
+from generalgui.shared_methods.formatter import Formatter
+from generalgui.shared_methods.loader import Loader
+from generalgui.shared_methods.exporter import Exporter
+from generalgui.shared_methods.appender import Appender
+from generalgui.shared_methods.sorter import Sorter
+from generalgui.shared_methods.filterer import Filterer
+from generalgui.shared_methods.statistician import Statistician
+from generalgui.shared_methods.linker import Linker
+from generalgui.shared_methods.journaler import Journaler, Operation
 
 from generalvector import Vec2
 
+import numpy as np
 import pandas as pd
 
 from tkinter import filedialog
-from generalfile import File
 
 from generallibrary.functions import changeArgsAndKwargs, getParameter
 from generallibrary.types import typeChecker
 
-# import statistics
-
-import numpy as np
-
 
-def ascending(attrName):
+def ascending(attrName, parameterName="cellValue"):
     """
     Generate a decorator based on attrName that works both for row and coloumn
 
     :param str attrName: Should be "previousColumnSort" or "previousRowSort"
+    :param str parameterName: Name of parameter that holds what's sorted by, "keys" holds a list of keys
     """
     def wrapper(func):
         """Decorator to automatically make the ascending parameter toggleable"""
         def decorator(self, *args, **kwargs):
             """."""
-            cellValue = getParameter(func, args, kwargs, "cellValue")
+            cellValue = getParameter(func, args, kwargs, parameterName)
 
             if getParameter(func, args, kwargs, "ascending") is None:
+                # Stored as a tuple of keys so that single and multi key sorts sharing attrName can be compared
+                sortKeys = tuple(cellValue) if parameterName == "keys" else (cellValue, )
                 ascending = True
-                if getattr(self, attrName) == cellValue:
+                if getattr(self, attrName) == sortKeys:
                     ascending = False
                     setattr(self, attrName, None)
                 else:
-                    setattr(self, attrName, cellValue)
+                    setattr(self, attrName, sortKeys)
 
                 changeArgsAndKwargs(func, args, kwargs, ascending=ascending)
 
@@ -45,11 +54,29 @@ def ascending(attrName):
 
 
 def loadDataFrame(func):
-    """Decorator to automatically reload dataframe once it's been changed"""
+    """
+    Decorator to automatically reload dataframe once it's been changed.
+    Only the outermost decorated call reloads, and it only applies what changed if possible.
+    Changes made during the outermost call are journaled as one entry to undo.
+    Does nothing while a read-only dataSource is shown.
+    """
     def f(self, *args, **kwargs):
         """."""
-        result = func(self, *args, **kwargs)
-        self.loadDataFrame()
+        if self.dataSource is not None:
+            return None
+        if not self._mutationDepth:
+            self._journalGroup = []
+        self._mutationDepth += 1
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            self._mutationDepth -= 1
+            if not self._mutationDepth:
+                group, self._journalGroup = self._journalGroup, None
+                if group:
+                    self._pushEntry(group)
+        if not self._mutationDepth:
+            self._reloadDataFrame()
         return result
     return f
 
@@ -72,29 +99,42 @@ def _cellValue(func, self, args, kwargs, index=False, header=False):
     cellValue = getParameter(func, args, kwargs, "cellValue")
 
     element = None
+    cellPos = None
     if cellValue is None:
         if self.app.menuTargetElement is None:
             raise ValueError("cellValue is None and app.menuTargetElement is None")
 
         element = self.app.menuTargetElement
-        if not typeChecker(element, ("Button", "Label"), error=False):  # Because element can be Frame
+        if typeChecker(element.parentPage, "CanvasGrid", error=False):
+            cellPos = element.parentPage.menuCellPos
+            if cellPos is None:
+                return
+        elif not typeChecker(element, ("Button", "Label"), error=False):  # Because element can be Frame
             return
 
     elif typeChecker(cellValue, "Event", error=False):
         event = cellValue
         element = event.widget.element
+        if typeChecker(element.parentPage, "CanvasGrid", error=False):
+            cellPos = element.parentPage.getCellPos(event)
+            if cellPos is None:
+                return
 
     if element is not None:
         grid = element.parentPage
-        spreadsheet = grid.getFirstParentByClass("Spreadsheet")
-        if grid == spreadsheet.mainGrid:
-            gridPos = grid.getGridPos(element)
+        if grid is self.mainGrid:
+            if cellPos is not None:
+                gridPos = cellPos + 1
+            else:
+                gridPos = grid.getGridPos(element)
             if index:
-                value = spreadsheet.dataFrame.index[gridPos.y - 1]
+                value = self.getRowKey(self.viewStart.y + gridPos.y - 1)
             elif header:
-                value = spreadsheet.dataFrame.columns[gridPos.x]
+                value = self.getColumnKey(self.viewStart.x + gridPos.x - 1)
             else:
                 raise ValueError("index or header has to be True")
+        elif cellPos is not None:
+            value = grid.getValue(cellPos)
         else:
             value = element.getValue()
         args, kwargs = changeArgsAndKwargs(func, args, kwargs, cellValue=value)
@@ -102,7 +142,7 @@ def _cellValue(func, self, args, kwargs, index=False, header=False):
     return func(self, *args, **kwargs)
 
 
-class Spreadsheet(Page):
+class Spreadsheet(Page, Virtualizer, Formatter, Loader, Exporter, Appender, Sorter, Filterer, Statistician, Linker, Journaler):
     """
     Controls multiple grids in a certain way to make it all look cohesive.
     Has optional scrollbars and optional fixed row / column for keys.
@@ -125,8 +165,26 @@ class Spreadsheet(Page):
      * im   immmm
 
     i=indexFrame, h=headerFrame, m=mainCell, x=empty, f=frame
+
+    Large dataFrames should use virtual=True to only create cells for the visible part of the dataFrame.
+    Or canvasCells=True to draw cells on one canvas per grid with CanvasGrid instead of creating widgets, virtual is ignored then.
+
+    Sorting and dropping only moves or removes existing cells, dataVersion is increased by every method that changes values or keys.
+    Sorted orders are cached until dataVersion changes, so sorting by a previous key or toggling ascending doesn't sort again.
+    Call loadDataFrame() after changing dataFrame's values inplace to show them.
+
+    Cell values are formatted column by column according to dtype, see floatPrecision, datetimeFormat and maxLen.
+
+    Data that doesn't fit in memory can be shown read-only with loadDataSource(), together with virtual=True only the window in view is read.
+
+    Files are loaded in chunks on a worker thread with loadFile(), showing the first chunk immediately.
+    Files are saved in chunks on a worker thread with exportFile() as tsv, csv, parquet or feather, sorting and editing can continue meanwhile.
+    Rows can be streamed to the bottom with appendRows(), which is coalesced to appendFps.
+    Rows can be filtered with setFilter() or by typing in the entry created by filterEntry=True, filtered rows stay in dataFrame.
+    Several Spreadsheets can show the same SpreadsheetModel with model parameter or setModel(), each with it's own sort, filter and columns.
+    Changes of dataFrame can be undone with undo() and redone with redo(), the journal keeps at most journalBytes alive.
     """
-    def __init__(self, parentPage=None, width=300, height=300, cellHSB=False, cellVSB=False, columnKeys=True, rowKeys=True, hideMultiline=True, **parameters):
+    def __init__(self, parentPage=None, width=300, height=300, cellHSB=False, cellVSB=False, columnKeys=True, rowKeys=True, hideMultiline=True, virtual=False, overscan=5, canvasCells=False, maxLen=None, floatPrecision=None, datetimeFormat=None, chunkSize=10000, appendFps=30, filterEntry=False, model=None, journalBytes=100 * 2 ** 20, **parameters):
         super().__init__(parentPage=parentPage, width=width, height=height, relief="solid", borderwidth=1, resizeable=True, **parameters)
 
         # Menus to put in respective keys grid if they exist, otherwise it's put in main grid
@@ -134,7 +192,6 @@ class Spreadsheet(Page):
             "Row": {
                 "Index:": self.getIndexName,
                 "Row:": self.getRowName,
-                "Average:": self.getRowAverage,
 
                 "Sort_row": self.sortRow,
                 "Sort_index": self.sortIndex,
@@ -147,7 +204,6 @@ class Spreadsheet(Page):
             "Column": {
                 "Header:": self.getHeaderName,
                 "Column:": self.getColumnName,
-                "Average:": self.getColumnAverage,
 
                 "Sort_column": self.sortColumn,
                 "Sort_header": self.sortHeader,
@@ -156,16 +212,29 @@ class Spreadsheet(Page):
 
                 "Make_column_index": self.makeColumnIndex,
                 "Reset_header": self.resetHeader,
-            }
+            },
+            "Row statistics": self._getStatisticsMenu(self.getRowStatistics),
+            "Column statistics": self._getStatisticsMenu(self.getColumnStatistics),
         }
 
         self.cellHSB = cellHSB
         self.cellVSB = cellVSB
         self.columnKeys = columnKeys
         self.rowKeys = rowKeys
+        self.canvasCells = canvasCells
         self.previousColumnSort = None
         self.previousRowSort = None
         self.dataFrameIsLoading = False
+        self.dataVersion = 0
+        self._mutationDepth = 0
+
+        # Rendered cells as [y][x] lists mirroring each grid, None where there's no element
+        self.mainCells = [[None]]
+        self.headerCells = [[None], [None]]
+        self.indexCells = [[None, None]]
+        self._rendered = None
+        self.renderedColumnWidths = []
+        self.renderedRowHeights = []
 
         if self.columnKeys:
             self.columnKeysPageContainer = Page(self, pack=True, fill="x", padx=1 if self.rowKeys else 0)
@@ -173,15 +242,20 @@ class Spreadsheet(Page):
             if self.rowKeys:
                 self.columnKeysFillerLeft = Frame(self.columnKeysPageContainer, side="left", fill="y")
 
-            self.headerGrid = Grid(self.columnKeysPageContainer, height=30, pack=True, side="left", scrollable=True, mouseScroll=False, fill="x", expand=True)
+            self.headerGrid = self._createGrid(self.columnKeysPageContainer, {"anchor": "c", "onClick": lambda e: self.sortColumn(cellValue=e), "onResize": self.syncSizes},
+                                               height=30, pack=True, side="left", scrollable=True, mouseScroll=False, fill="x", expand=True)
             self.headerGrid.menu("Column", **menus["Column"])
+            self.headerGrid.menu("Column statistics", **menus["Column statistics"])
 
         if self.rowKeys:
             self.rowKeysPageContainer = Page(self, pack=True, width=0, side="left", fill="y", pady=1 if self.columnKeys else 0)
-            self.indexGrid = Grid(self.rowKeysPageContainer, pack=True, side="top", width=100, scrollable=True, mouseScroll=False, fill="both", expand=True)
+            self.indexGrid = self._createGrid(self.rowKeysPageContainer, {"onClick": lambda e: self.sortRow(cellValue=e), "onResize": self.syncSizes},
+                                              pack=True, side="top", width=100, scrollable=True, mouseScroll=False, fill="both", expand=True)
             self.indexGrid.menu("Row", **menus["Row"])
+            self.indexGrid.menu("Row statistics", **menus["Row statistics"])
 
-        self.mainGrid = Grid(self, scrollable=True, hideMultiline=hideMultiline, hsb=cellHSB, vsb=cellVSB, pack=True, fill="both", expand=True)
+        self.mainGrid = self._createGrid(self, {"color": True, "maxLen": maxLen, "onScroll": self._syncKeysScroll, "onResize": self.syncSizes, **self.cellConfig},
+                                         scrollable=True, hideMultiline=hideMultiline, hsb=cellHSB, vsb=cellVSB, pack=True, fill="both", expand=True)
 
         if self.columnKeys:
             if cellVSB:
@@ -197,18 +271,35 @@ class Spreadsheet(Page):
 
         if not self.rowKeys:
             self.mainGrid.menu("Row", **menus["Row"])
+            self.mainGrid.menu("Row statistics", **menus["Row statistics"])
 
         if not self.columnKeys:
             self.mainGrid.menu("Column", **menus["Column"])
+            self.mainGrid.menu("Column statistics", **menus["Column statistics"])
 
         self.dataFrame = pd.DataFrame()
+        self.dataSource = None
+
+        Virtualizer.__init__(self, virtual=virtual and not canvasCells, overscan=overscan)
+        Formatter.__init__(self, maxLen=maxLen, floatPrecision=floatPrecision, datetimeFormat=datetimeFormat)
+        Loader.__init__(self, chunkSize=chunkSize)
+        Exporter.__init__(self)
+        Appender.__init__(self, appendFps=appendFps)
+        Sorter.__init__(self)
+        Filterer.__init__(self, filterEntry=filterEntry)
+        Statistician.__init__(self)
+        Linker.__init__(self)
+        Journaler.__init__(self, journalBytes=journalBytes)
 
         self.pack()
 
         self.menu("Spreadsheet",
                   Save_as_tsv=self.saveAsTSV,
+                  Cancel_save=self.cancelExport,
                   Load_tsv_file=self.loadTSV,
                   Clear_all=self.clearAll,
+                  Undo=self.undo,
+                  Redo=self.redo,
                   )
 
         if hideMultiline:
@@ -217,25 +308,58 @@ class Spreadsheet(Page):
                       Hide_multilines=lambda: self.toggleAllMultilines(False),
                       )
 
+        if model is not None:
+            self.setModel(model)
+
+
+    def _createGrid(self, parentPage, canvasParameters, **parameters):
+        """
+        Create a Grid, or a CanvasGrid with extra parameters if canvasCells is enabled.
+
+        :param generalgui.Page parentPage:
+        :param dict canvasParameters: Parameters only given to CanvasGrid
+        :param parameters: Parameters given to both
+        """
+        if self.canvasCells:
+            return CanvasGrid(parentPage, **canvasParameters, **parameters)
+        return Grid(parentPage, **parameters)
 
     defaultHeaderName = "headers"
     defaultIndexName = "indexes"
 
+    @indexValue
+    def getRowStatistics(self, cellValue=None):
+        """Return cached Statistics of a row, None while a dataSource is shown"""
+        return self.getStatistics(cellValue, row=True)
+
+    @headerValue
+    def getColumnStatistics(self, cellValue=None):
+        """Return cached Statistics of a column, None while a dataSource is shown"""
+        return self.getStatistics(cellValue)
+
     @indexValue
     def getRowAverage(self, cellValue=None):
-        """Return the row average"""
-        try:
-            return np.average(self.dataFrame.loc[[cellValue]].values[0])
-        except (TypeError, AttributeError):
-            pass
+        """Return the average of a row's numeric values"""
+        statistics = self.getRowStatistics(cellValue)
+        return statistics and statistics.mean
 
     @headerValue
     def getColumnAverage(self, cellValue=None):
-        """Return the column average"""
-        try:
-            return np.average(self.dataFrame[cellValue].values)
-        except TypeError:
-            return None
+        """Return the average of a column's numeric values"""
+        statistics = self.getColumnStatistics(cellValue)
+        return statistics and statistics.mean
+
+    @staticmethod
+    def _getStatisticsMenu(getStatistics):
+        """
+        Create information labels for a statistics menu.
+
+        :param function getStatistics: getRowStatistics or getColumnStatistics
+        """
+        def label(attr):
+            """Create function that returns one statistic."""
+            return lambda: getattr(getStatistics(), attr, None)
+        return {f"{name}:": label(attr) for name, attr in (("Count", "count"), ("Mean", "mean"), ("Min", "minimum"), ("Max", "maximum"), ("Nulls", "nulls"), ("Distinct", "distinct"))}
 
     @indexValue
     def getRowName(self, cellValue=None):
@@ -260,10 +384,10 @@ class Spreadsheet(Page):
     def sortHeader(self, cellValue=defaultHeaderName, ascending=None):
         """
         Sort headers in dataframe
-        self.preivousRowSort is assigned to cellValue to keep track of ascending toggling
+        self.preivousRowSort is assigned to (cellValue, ) to keep track of ascending toggling
         """
         try:
-            self.dataFrame.sort_index(inplace=True, axis=1, ascending=ascending)
+            self.sortDataFrame(axis=1, ascending=ascending)
         except TypeError:
             pass
 
@@ -272,10 +396,10 @@ class Spreadsheet(Page):
     def sortIndex(self, cellValue=defaultIndexName, ascending=None):
         """
         Sort index in dataframe
-        self.previousColumnSort is assigned to cellValue to keep track of ascending toggling
+        self.previousColumnSort is assigned to (cellValue, ) to keep track of ascending toggling
         """
         try:
-            self.dataFrame.sort_index(inplace=True, axis=0, ascending=ascending)
+            self.sortDataFrame(axis=0, ascending=ascending)
         except TypeError:
             pass
 
@@ -285,7 +409,7 @@ class Spreadsheet(Page):
     def sortRow(self, cellValue=None, ascending=None):
         """Sort a row in dataframe"""
         try:  # In case of mixed values
-            self.dataFrame.sort_values(inplace=True, axis=1, by=[cellValue], ascending=ascending)
+            self.sortDataFrame(axis=1, by=[cellValue], ascending=ascending)
         except TypeError:
             return
 
@@ -295,26 +419,60 @@ class Spreadsheet(Page):
     def sortColumn(self, cellValue=None, ascending=None):
         """Sort a column in dataframe"""
         try:  # In case of mixed values
-            self.dataFrame.sort_values(inplace=True, axis=0, by=[cellValue], ascending=ascending)
+            self.sortDataFrame(axis=0, by=[cellValue], ascending=ascending)
+        except TypeError:
+            return
+
+    @loadDataFrame
+    @ascending("previousColumnSort", "keys")
+    def sortColumns(self, keys, ascending=None):
+        """
+        Sort rows in dataframe by multiple columns, first column has highest priority
+
+        :param list keys: Column keys to sort by
+        """
+        try:  # In case of mixed values
+            self.sortDataFrame(axis=0, by=list(keys), ascending=ascending)
+        except TypeError:
+            return
+
+    @loadDataFrame
+    @ascending("previousRowSort", "keys")
+    def sortRows(self, keys, ascending=None):
+        """
+        Sort columns in dataframe by multiple rows, first row has highest priority
+
+        :param list keys: Index keys to sort by
+        """
+        try:  # In case of mixed values
+            self.sortDataFrame(axis=1, by=list(keys), ascending=ascending)
         except TypeError:
             return
 
     @loadDataFrame
     @indexValue
     def dropRow(self, cellValue=None):
-        """Drop a row in dataframe"""
-        if self.dataFrame.shape[0] == 1:
+        """Drop a row in dataframe, or in model if there is one"""
+        if self.model is not None:
+            self.model.dropRows([cellValue])
+        elif self.dataFrame.shape[0] == 1:
             self.clearAll()
         else:
+            self._removeStatistics(cellValue, row=True)
+            self._journalRemove(0, cellValue)
             self.dataFrame.drop(cellValue, axis="rows", inplace=True)
 
     @loadDataFrame
     @headerValue
     def dropColumn(self, cellValue=None):
-        """Drop a column in dataframe"""
-        if self.dataFrame.shape[1] == 1:
+        """Drop a column in dataframe, or in model if there is one"""
+        if self.model is not None:
+            self.model.dropColumns([cellValue])
+        elif self.dataFrame.shape[1] == 1:
             self.clearAll()
         else:
+            self._removeStatistics(cellValue)
+            self._journalRemove(1, cellValue)
             self.dataFrame.drop(cellValue, axis="columns", inplace=True)
 
     @loadDataFrame
@@ -323,11 +481,7 @@ class Spreadsheet(Page):
         """Turn a row to header and make current header a row in dataframe"""
         self.moveHeaderToRow()
         row = self.dataFrame.loc[[cellValue]].values[0]
-        self.dataFrame.columns = row
-        if cellValue == self.defaultHeaderName:
-            self.dataFrame.columns.name = None
-        else:
-            self.dataFrame.columns.name = cellValue
+        self._setKeys(1, row, name=None if cellValue == self.defaultHeaderName else cellValue)
         self.dropRow(cellValue)
 
     @loadDataFrame
@@ -335,36 +489,45 @@ class Spreadsheet(Page):
     def makeColumnIndex(self, cellValue=None):
         """Turn a column to index and make current index a column in dataframe"""
         self.moveIndexToColumn()
-
         column = self.dataFrame[cellValue].values
-        self.dataFrame.index = column
-
-        if cellValue == self.defaultIndexName:
-            self.dataFrame.index.name = None
-        else:
-            self.dataFrame.index.name = cellValue
-
+        self._setKeys(0, column, name=None if cellValue == self.defaultIndexName else cellValue)
         self.dropColumn(cellValue)
 
     @loadDataFrame
     def resetHeader(self):
         """Reset header to integers"""
         self.moveHeaderToRow()
-        self.dataFrame.columns = range(self.dataFrame.shape[1])
+        self._setKeys(1, pd.RangeIndex(self.dataFrame.shape[1]))
 
     @loadDataFrame
     def resetIndex(self):
         """Reset index to integers"""
         self.moveIndexToColumn()
-        self.dataFrame.reset_index(inplace=True, drop=True)
+        self._setKeys(0, pd.RangeIndex(self.dataFrame.shape[0]))
 
-    @loadDataFrame
     def clearAll(self):
         """Clear entire spreadsheet"""
-        self.dataFrame = pd.DataFrame()
+        self.loadDataFrame(pd.DataFrame())
+
+    def _setKeys(self, axis, keys, name=None):
+        """
+        Replace index or header of dataFrame.
+
+        :param int axis: 0 for index, 1 for header
+        :param keys: Any values that pd.Index accepts
+        :param name: Name of new index or header
+        """
+        self._journal(Operation("keys", axis, data=self.dataFrame.axes[axis]))
+        keys = pd.Index(keys, name=name)
+        if axis == 0:
+            self.dataFrame.index = keys
+        else:
+            self.dataFrame.columns = keys
+        self.dataVersion += 1
 
     def moveHeaderToRow(self):
-        """Move header to first row"""
+        """Move header to first row, unlinks model"""
+        self.setModel(None)
         headerName = self.dataFrame.columns.name
         if headerName is None:
             headerName = self.defaultHeaderName
@@ -372,101 +535,397 @@ class Spreadsheet(Page):
         if headerName not in self.dataFrame.index:
             headerRow = pd.DataFrame({headerName: self.dataFrame.columns.values}).T
             headerRow.columns = self.dataFrame.columns
-            self.dataFrame = headerRow.append(self.dataFrame)
+            dtypes = self.dataFrame.dtypes
+            self.dataFrame = pd.concat([headerRow, self.dataFrame])
+            self.dataVersion += 1
+            self._journal(Operation("insert", 0, [0], dtypes=dtypes))
 
     def moveIndexToColumn(self):
-        """Move index to first column row"""
+        """Move index to first column row, unlinks model"""
+        self.setModel(None)
         indexName = self.dataFrame.index.name
         if indexName is None:
             indexName = self.defaultIndexName
 
         if indexName not in self.dataFrame.columns:
             self.dataFrame.insert(0, indexName, self.dataFrame.index.values)
+            self.dataVersion += 1
+            self._journal(Operation("insert", 1, [0]))
 
     cellConfig = {"padx": 5, "pady": 5, "relief": "raised", "borderwidth": 1}
     def loadDataFrame(self, df=None):
         """
-        Update cells to represent a dataFrame with any types of values.
+        Update every cell to represent a dataFrame with any types of values.
+        Also call this without df after changing dataFrame inplace.
+        Giving a df stops showing dataSource, unlinks model and cancels loading a file.
         """
-        self.dataFrameIsLoading = True
+        if df is not None:
+            self.cancelLoad()
+        self._loadDataFrame(df)
 
+    def _loadDataFrame(self, df=None):
+        """
+        Helper for loadDataFrame that doesn't cancel loading a file, used by Loader for the first chunk.
+        """
         if df is not None:
             if not typeChecker(df, pd.DataFrame, error=False):
                 df = pd.DataFrame(df)
 
+            self.setModel(None)
+            self._journal(Operation("replace", data=self.dataFrame))
             self.dataFrame = df
-        df = self.dataFrame
+            self.dataSource = None
+        self.dataVersion += 1
+
+        self._fillDataFrame()
+
+    def loadDataSource(self, dataSource):
+        """
+        Show a read-only DataSource instead of dataFrame, cells are filled from windows read from it.
+        Use virtual=True so that only the window in view is read, otherwise the whole source is read.
+        Mutating methods such as sorting do nothing while it's shown.
+
+        :param generalgui.DataSource dataSource:
+        """
+        self.cancelLoad()
+        self.setModel(None)
+        self.clearJournal()
+        self.dataFrame = pd.DataFrame()
+        self.dataSource = dataSource
+        self.dataVersion += 1
+
+        self._fillDataFrame()
+
+    def getRowKey(self, y):
+        """
+        Get index key of a rendered row position in dataFrame or dataSource, rows that don't pass filter are skipped and a linked view's sort is followed.
+
+        :param int y:
+        """
+        if self.dataSource is None:
+            viewRows = self.getViewRows()
+            return self.dataFrame.index[y if viewRows is None else viewRows[y]]
+        return self.dataSource.getIndex(y, y + 1)[0]
+
+    def getViewIndex(self):
+        """
+        Get index of dataFrame in shown order, which differs from dataFrame's own order in a sorted linked view.
+        Rows that don't pass filter are included.
+
+        :rtype: pd.Index
+        """
+        if self.modelRows is None:
+            return self.dataFrame.index
+        return self.dataFrame.index[self.modelRows]
+
+    def getColumnKey(self, x):
+        """
+        Get header key of a column position in dataFrame, or in dataSource if there is one.
+
+        :param int x:
+        """
+        if self.dataSource is None:
+            return self.dataFrame.columns[x]
+        return self.dataSource.getColumns()[x]
+
+    def _fillDataFrame(self):
+        """
+        Fill every rendered cell from dataFrame without treating it as changed, so cached formatting is kept.
+        """
+        self.dataFrameIsLoading = True
+
+        self._setViewArea()
+        df = self.getViewFrame()
         # print(df.to_string())
 
-        if self.columnKeys:
-            size = Vec2(len(df.columns), 1)
-            self.headerGrid.fillGrid(Frame, Vec2(1, 0), size, height=1)
-            self.mainGrid.fillGrid(Frame, Vec2(1, 0), size, height=1)
+        if self.canvasCells:
+            self._fillCanvasCells(df)
+        else:
+            self._fillCells(df)
+
+        self._rendered = (self.dataFrame, self.dataVersion, df.index, df.columns)
+
+        self.dataFrameIsLoading = False
+        self.syncSizes()
 
-            self.headerGrid.fillGrid(Label, Vec2(1, 1), size, values=df.columns, removeExcess=True, onClick=lambda e: self.sortColumn(cellValue=e), anchor="c")
+    def _fillCells(self, df, startRow=0):
+        """
+        Fill grids with elements to represent a dataFrame.
+
+        :param pd.DataFrame df: Rows of view to fill
+        :param int startRow: Row in view that df starts at, cells above it are kept as they are
+        """
+        columns, rows = len(df.columns), len(df.index)
+        if not startRow:
+            self.mainCells = [[None] * (columns + 1)]
+            self.headerCells = [[None] * (columns + 1) for _ in range(2)]
+            self.indexCells = [[None, None]]
+        del self.mainCells[startRow + 1:]
+        del self.indexCells[startRow + 1:]
+        self.mainCells.extend([None] * (columns + 1) for _ in range(rows))
+        self.indexCells.extend([None, None] for _ in range(rows))
+
+        if self.columnKeys and not startRow:
+            size = Vec2(columns, 1)
+            self.headerCells[0][1:] = self.headerGrid.fillGrid(Frame, Vec2(1, 0), size, height=1)
+            self.mainCells[0][1:] = self.mainGrid.fillGrid(Frame, Vec2(1, 0), size, height=1)
+
+            self.headerCells[1][1:] = self.headerGrid.fillGrid(Label, Vec2(1, 1), size, values=df.columns, removeExcess=True, onClick=lambda e: self.sortColumn(cellValue=e), anchor="c")
 
         if self.rowKeys:
-            size = Vec2(1, len(df.index))
-            self.indexGrid.fillGrid(Frame, Vec2(0, 1), size, width=1)
-            self.mainGrid.fillGrid(Frame, Vec2(0, 1), size, width=1)
+            size = Vec2(1, rows)
+            indexFrames = self.indexGrid.fillGrid(Frame, Vec2(0, startRow + 1), size, width=1)
+            mainFrames = self.mainGrid.fillGrid(Frame, Vec2(0, startRow + 1), size, width=1)
+            indexLabels = self.indexGrid.fillGrid(Label, Vec2(1, startRow + 1), size, values=df.index, removeExcess=True, onClick=lambda e: self.sortRow(cellValue=e))
 
-            self.indexGrid.fillGrid(Label, Vec2(1, 1), size, values=df.index, removeExcess=True, onClick=lambda e: self.sortRow(cellValue=e))
+            for y in range(rows):
+                self.indexCells[startRow + y + 1] = [indexFrames[y], indexLabels[y]]
+                self.mainCells[startRow + y + 1][0] = mainFrames[y]
 
+        values = []
+        for row in df.itertuples(index=False):
+            values.extend(row)
+        labels = self.mainGrid.fillGrid(Label, Vec2(1, startRow + 1), Vec2(columns, rows), values=values, removeExcess=True, color=True,
+                                        formatted=self._getFormatted(df, startRow), maxLen=self.maxLen, **self.cellConfig)
+        for y in range(rows):
+            self.mainCells[startRow + y + 1][1:] = labels[y * columns:(y + 1) * columns]
+
+    def _fillCanvasCells(self, df):
+        """
+        Give canvas grids values to represent a dataFrame.
+
+        :param pd.DataFrame df:
+        """
+        if self.columnKeys:
+            self.headerGrid.setValues(df.columns, Vec2(len(df.columns), 1))
+        if self.rowKeys:
+            self.indexGrid.setValues(df.index, Vec2(1, len(df.index)))
 
         values = []
         for row in df.itertuples(index=False):
             values.extend(row)
-        self.mainGrid.fillGrid(Label, Vec2(1, 1), Vec2(df.shape[1], df.shape[0]), values=values, removeExcess=True, color=True, **self.cellConfig)
+        self.mainGrid.setValues(values, Vec2(df.shape[1], df.shape[0]), formatted=self._getFormatted(df))
+
+    def _getFormatted(self, df, startRow=0):
+        """
+        Get formatted tuples of rendered cells, windows of dataSource are formatted directly as they can't be cached by column.
+
+        :param pd.DataFrame df: Rows of view to format
+        :param int startRow: Row in view that df starts at
+        """
+        if self.dataSource is None:
+            return self.getFormattedView(startRow)
+        return self.formatFrame(df)
+
+    def _appendDataFrame(self, df, frame=None):
+        """
+        Append rows to the bottom of dataFrame, only creating cells for the new rows if possible.
+        Existing values don't change so dataVersion and cached formatting are kept.
+
+        :param pd.DataFrame df: Rows with the same columns as dataFrame
+        :param pd.DataFrame frame: dataFrame with df already appended, such as a linked model's, instead of concatenating them here
+        """
+        if self.dataFrame.empty:
+            self._journal(Operation("replace", data=self.dataFrame))
+            self.dataFrame = df if frame is None else frame
+            self.modelRows = None
+            self.dataVersion += 1
+            self._fillDataFrame()
+            return
+
+        self._addStatisticsRows(df)
+        oldFrame = self.dataFrame
+        self.dataFrame = pd.concat([oldFrame, df]) if frame is None else frame
+        if self.modelRows is not None:
+            self.modelRows = np.concatenate((self.modelRows, np.arange(len(oldFrame), len(self.dataFrame))))
+        self._journalAppend(len(oldFrame), len(df))
+
+        if self.virtual or self.canvasCells or self.filterText or not self._isRendered(oldFrame) or not df.columns.equals(oldFrame.columns):
+            self._fillDataFrame()
+            return
 
+        self.dataFrameIsLoading = True
+        self._setViewArea()
+        self._fillCells(df, startRow=len(oldFrame))
+        self._rendered = (self.dataFrame, self.dataVersion, self.getViewIndex(), self.dataFrame.columns)
         self.dataFrameIsLoading = False
         self.syncSizes()
 
+    def _isRendered(self, frame):
+        """
+        Get whether cells currently represent all of a frame that hasn't changed since.
+
+        :param pd.DataFrame frame:
+        """
+        if self._rendered is None:
+            return False
+        renderedFrame, renderedVersion, renderedIndex, renderedColumns = self._rendered
+        return renderedFrame is frame and renderedVersion == self.dataVersion and len(renderedIndex) == len(frame.index) and len(renderedColumns) == len(frame.columns)
+
+    def _reloadDataFrame(self):
+        """
+        Apply changes of dataFrame to cells after a mutating method.
+        If rows or columns have only been reordered or removed then the existing cells are moved or removed instead of filling every cell again.
+        """
+        if not self._applyDataFrameDelta():
+            self._fillDataFrame()
+
+    def _applyDataFrameDelta(self):
+        """
+        Try to apply a permutation or removal of rows or columns to existing cells.
+        Keys are compared by label so they have to be unique.
+
+        :return: Whether delta could be applied or not, if not then cells have to be filled again
+        """
+        if self.virtual or self.canvasCells or self.filterText or self._rendered is None:
+            return False
+        renderedFrame, renderedVersion, renderedIndex, renderedColumns = self._rendered
+        if renderedFrame is not self.dataFrame or renderedVersion != self.dataVersion:
+            return False
+
+        df = self.dataFrame
+        index = self.getViewIndex()
+        if df.columns.equals(renderedColumns):
+            positions = self._getDeltaPositions(renderedIndex, index)
+            if positions is None:
+                return False
+            self._moveCellRows(self.indexCells, positions)
+            self._moveCellRows(self.mainCells, positions, colorGrid=self.mainGrid)
+
+        elif index.equals(renderedIndex):
+            positions = self._getDeltaPositions(renderedColumns, df.columns)
+            if positions is None:
+                return False
+            self._moveCellColumns(self.headerCells, positions)
+            self._moveCellColumns(self.mainCells, positions)
+
+        else:
+            return False
+
+        self._rendered = (df, self.dataVersion, index, df.columns)
+        self.viewSize = Vec2(len(df.columns), len(index))
+        if df.empty:
+            self._fillDataFrame()
+        return True
+
+    @staticmethod
+    def _getDeltaPositions(oldKeys, newKeys):
+        """
+        Get rendered position of each new key, None if a key is new or if keys aren't unique.
+
+        :param pd.Index oldKeys:
+        :param pd.Index newKeys:
+        :rtype: list[int] or None
+        """
+        if len(newKeys) > len(oldKeys) or not oldKeys.is_unique or not newKeys.is_unique:
+            return None
+        positions = oldKeys.get_indexer(newKeys)
+        if (positions == -1).any():
+            return None
+        return positions.tolist()
+
+    @staticmethod
+    def _moveCellRows(cells, positions, colorGrid=None):
+        """
+        Recycle rows that aren't in positions and move the rest, first row is static.
+
+        :param list[list] cells: Cells in grid as [y][x]
+        :param list[int] positions: Previous position of each row
+        :param generalgui.Grid colorGrid: Grid to recolor moved Labels' with if alternating rows are colored
+        """
+        oldRows = cells[1:]
+        kept = set(positions)
+        recycled = [element for i, row in enumerate(oldRows) if i not in kept for element in row if element]
+        if recycled:
+            recycled[0].app.recycleElements(recycled)
+
+        for y, position in enumerate(positions):
+            if y != position:
+                for x, element in enumerate(oldRows[position]):
+                    if element:
+                        element.grid(Vec2(x, y + 1))
+                        if colorGrid and x and (y - position) % 2 and isinstance(element, Label):
+                            colorGrid.colorElement(element, y + 1)
+
+        cells[1:] = [oldRows[position] for position in positions]
+
+    @staticmethod
+    def _moveCellColumns(cells, positions):
+        """
+        Recycle columns that aren't in positions and move the rest, first column is static.
+
+        :param list[list] cells: Cells in grid as [y][x]
+        :param list[int] positions: Previous position of each column
+        """
+        kept = set(positions)
+        recycled = [element for row in cells for i, element in enumerate(row[1:]) if element and i not in kept]
+        if recycled:
+            recycled[0].app.recycleElements(recycled)
+
+        for y, row in enumerate(cells):
+            oldColumns = row[1:]
+            for x, position in enumerate(positions):
+                element = oldColumns[position]
+                if element and x != position:
+                    element.grid(Vec2(x + 1, y))
+            row[1:] = [oldColumns[position] for position in positions]
+
     def syncSizes(self):
-        if not self.dataFrameIsLoading and not self.dataFrame.columns.empty and not self.dataFrame.index.empty:
+        shape = self.getDataShape()
+        if not self.dataFrameIsLoading and shape.x and shape.y:
             # print(self.getMouse())
         # if self.mainGrid.getGridSize() > 0:
-            self._syncColumnKeysWidth()
-            self._syncRowKeysHeight()
-            self._syncRowKeysWidth()
-            self.app.widget.update()
+            if self.canvasCells:
+                self._syncCanvasSizes()
+            else:
+                self._syncCellSizes()
+                if self.virtual:
+                    self._syncVirtualSizes()
             self._syncKeysScroll()
 
     def loadTSV(self):
         """
-        Load a tsv file, configure header and index afterwards by right clicking
+        Load a tsv or csv file in the background, configure header and index afterwards by right clicking
         """
-        filetypes = [("Open a tsv file", ".tsv")]
+        filetypes = [("Open a tsv file", ".tsv"), ("Open a csv file", ".csv")]
         path = filedialog.askopenfilename(title="Select spreadsheet", filetypes=filetypes)
         if path:
-            read = File.read(path)
-            if read is not None:
-                self.dataFrame = read
-                self.loadDataFrame()
+            self.loadFile(path)
 
     def saveAsTSV(self):
-        """Save current Data Frame as a tsv file, asks user where to put file."""
-        filetypes = [("Save spreadsheet as tsv", ".tsv")]
+        """Save current Data Frame in the background as a tsv, csv, parquet or feather file, asks user where to put file. Compress tsv and csv by adding .gz, .bz2 or .xz"""
+        filetypes = [("Save spreadsheet as tsv", ".tsv"), ("Save spreadsheet as csv", ".csv"), ("Save spreadsheet as compressed tsv", ".tsv.gz"), ("Save spreadsheet as parquet", ".parquet"), ("Save spreadsheet as feather", ".feather")]
         path = filedialog.asksaveasfilename(filetypes=filetypes, defaultextension=".tsv", title="Save spreadsheet", initialfile="Spreadsheet")
         if path:
-            File.write(path, self.dataFrame, overwrite=True)
+            self.exportFile(path)
 
     def getMainValues(self):
         """Returns all label cell values from mainGrid in a list, going left to right row by row"""
-        return [ele.getValue() for ele in self.mainGrid.getChildren() if isinstance(ele, Label)]
+        if self.canvasCells:
+            return self.mainGrid.getValues()
+        return [ele.getValue() for row in self.mainCells[1:] for ele in row[1:] if isinstance(ele, Label)]
 
     def getHeaderValues(self):
         """Returns all label cell values from headerGrid in a list, going left to right row by row"""
         if self.columnKeys:
-            return [ele.getValue() for ele in self.headerGrid.getChildren() if isinstance(ele, Label)]
+            if self.canvasCells:
+                return self.headerGrid.getValues()
+            return [ele.getValue() for ele in self.headerCells[1][1:] if isinstance(ele, Label)]
+        elif self.dataSource is not None:
+            return list(self.dataSource.getColumns())
         else:
             return list(self.dataFrame.columns)
 
     def getIndexValues(self):
         """Returns all label cell values from indexGrid in a list, going left to right row by row"""
         if self.rowKeys:
-            return [ele.getValue() for ele in self.indexGrid.getChildren() if isinstance(ele, Label)]
+            if self.canvasCells:
+                return self.indexGrid.getValues()
+            return [row[1].getValue() for row in self.indexCells[1:] if isinstance(row[1], Label)]
+        elif self.dataSource is not None:
+            return list(self.dataSource.getIndex())
         else:
-            return list(self.dataFrame.index)
+            return list(self.getViewIndex())
 
     def _syncKeysScroll(self, _=None):
         """Sync header and index scrolling to main grid's"""
@@ -475,101 +934,95 @@ class Spreadsheet(Page):
         if self.rowKeys:
             self.indexGrid.canvas.widget.yview_moveto(self.mainGrid.canvas.widget.yview()[0])
 
-    def _syncColumnKeysWidth(self, test=False):
+    def _syncCanvasSizes(self):
         """
-        Sync the widths of all cells with headers
+        Sync column widths and row heights of canvas grids from their measurements, no geometry updates are needed.
         """
-        if not self.columnKeys:
-            return
-
-        columnSize = self.headerGrid.getGridSize()
-        mainSize = self.mainGrid.getGridSize()
+        widths = self.mainGrid.measuredColumnWidths
+        if self.columnKeys:
+            widths = [max(header, main) for header, main in zip(self.headerGrid.measuredColumnWidths, widths)]
+            self.headerGrid.setColumnWidths(widths)
+        self.mainGrid.setColumnWidths(widths)
 
-        if columnSize.x != mainSize.x:
-            print(self.headerGrid.getChildren())
-            raise AttributeError(f"Columns mismatch {columnSize}, {mainSize}")
+        heights = self.mainGrid.measuredRowHeights
+        if self.rowKeys:
+            heights = [max(index, main) for index, main in zip(self.indexGrid.measuredRowHeights, heights)]
+            self.indexGrid.setRowHeights(heights)
 
-        columnFrames = []
-        mainFrames = []
-        for pos in Vec2(1, 0).range(Vec2(columnSize.x - 1, 1)):
-            columnFrame = self.headerGrid.getGridElement(pos)
-            # print(columnFrame)
-            columnFrame.widgetConfig(width=0)
-            columnFrames.append(columnFrame)
+            rowTitleWidth = self.indexGrid.getTotalSize().x + 5
+            self.rowKeysPageContainer.getTopElement().widgetConfig(width=rowTitleWidth)
+            if self.columnKeys:
+                self.columnKeysFillerLeft.widgetConfig(width=rowTitleWidth)
+        self.mainGrid.setRowHeights(heights)
 
-            mainFrame = self.mainGrid.getGridElement(pos)
-            # print(mainFrame)
-            mainFrame.widgetConfig(width=0)
-            mainFrames.append(mainFrame)
+    def _getLabelMetrics(self, label):
+        """
+        Get font and inset of a label, inset is padding, border and highlight on one side.
 
-        if test:
-            return
+        :param generalgui.Label label:
+        :rtype: tuple[str, Vec2]
+        """
+        widget = label.widget
+        border = widget.winfo_pixels(widget["borderwidth"]) + widget.winfo_pixels(widget["highlightthickness"])
+        return str(widget["font"]), Vec2(widget.winfo_pixels(widget["padx"]), widget.winfo_pixels(widget["pady"])) + border
 
-        self.app.widget.update_idletasks()
+    def _measureCells(self, cells):
+        """
+        Measure elements in a cell table with font metrics of their displayed texts, Frames are ignored.
+        Elements that aren't Labels use their requested size.
 
-        for i, columnFrame in enumerate(columnFrames):
-            mainFrame = mainFrames[i]
-            columnWidth = columnFrame.widget.winfo_width()
-            mainWidth = mainFrame.widget.winfo_width()
-            if columnWidth > mainWidth:
-                mainFrame.widgetConfig(width=columnWidth)
-            else:
-                columnFrame.widgetConfig(width=mainWidth)
+        :param list[list] cells: Cells in grid as [y][x]
+        :return: Widths of each column and heights of each row
+        :rtype: tuple[list[int]]
+        """
+        widths = [0] * len(cells[0])
+        heights = [0] * len(cells)
+        metrics = {}
+        for y, row in enumerate(cells):
+            for x, element in enumerate(row):
+                if element is None or isinstance(element, Frame):
+                    continue
+                if isinstance(element, Label):
+                    if not metrics:
+                        metrics["font"], metrics["inset"] = self._getLabelMetrics(element)
+                    width, height = self.app.measureTextSize(element.getDisplayedValue(), metrics["font"])
+                    width += metrics["inset"].x * 2
+                    height += metrics["inset"].y * 2
+                else:
+                    widget = element.getTopWidget()
+                    width, height = widget.winfo_reqwidth(), widget.winfo_reqheight()
+                widths[x] = max(widths[x], width)
+                heights[y] = max(heights[y], height)
+        return widths, heights
 
-    def _syncRowKeysHeight(self, test=False):
+    def _syncCellSizes(self):
         """
-        Sync the heights of all cells with indexes
+        Sync widths of columns with headers and heights of rows with indexes.
+        Sizes are computed from font metrics and applied to filler frames in one pass, without forcing geometry updates.
         """
-        if not self.rowKeys:
-            return
-
-        rowSize = self.indexGrid.getGridSize()
-        mainSize = self.mainGrid.getGridSize()
-
-        if rowSize.y != mainSize.y:
-            raise AttributeError(f"Row mismatch {rowSize}, {mainSize}")
-
-        rowFrames = []
-        mainFrames = []
-        for pos in Vec2(0, 1).range(Vec2(1, rowSize.y - 1)):
-            rowFrame = self.indexGrid.getGridElement(pos)
-            # print(rowFrame)
-            rowFrame.widgetConfig(height=0)
-            rowFrames.append(rowFrame)
-
-            mainFrame = self.mainGrid.getGridElement(pos)
-            # print(mainFrame)
-            mainFrame.widgetConfig(height=0)
-            mainFrames.append(mainFrame)
-
-        if test:
-            return
-
-        self.app.widget.update_idletasks()
-
-        for i, rowFrame in enumerate(rowFrames):
-            mainFrame = mainFrames[i]
-            rowHeight = rowFrame.widget.winfo_height()
-            mainHeight = mainFrame.widget.winfo_height()
-            if rowHeight > mainHeight:
-                mainFrame.widgetConfig(height=rowHeight)
-            else:
-                rowFrame.widgetConfig(height=mainHeight)
-
-    def _syncRowKeysWidth(self):
-        """Set right width for index, also update filler if it exists"""
-        if not self.rowKeys:
-            return
-        children = self.indexGrid.getChildren()
-        if not children:
-            return
-
-        self.app.widget.update()  # To get right width
-        rowTitleWidth = children[-1].widget.winfo_width() + 5
-        self.rowKeysPageContainer.getTopElement().widgetConfig(width=rowTitleWidth)
+        widths, heights = self._measureCells(self.mainCells)
 
         if self.columnKeys:
-            self.columnKeysFillerLeft.widgetConfig(width=rowTitleWidth)
+            headerWidths = self._measureCells(self.headerCells)[0]
+            widths = [max(header, main) for header, main in zip(headerWidths, widths)]
+            for x in range(1, len(widths)):
+                self.headerCells[0][x].widgetConfig(width=widths[x])
+                self.mainCells[0][x].widgetConfig(width=widths[x])
+
+        if self.rowKeys:
+            indexWidths, indexHeights = self._measureCells(self.indexCells)
+            heights = [max(index, main) for index, main in zip(indexHeights, heights)]
+            for y in range(1, len(heights)):
+                self.indexCells[y][0].widgetConfig(height=heights[y])
+                self.mainCells[y][0].widgetConfig(height=heights[y])
+
+            rowTitleWidth = indexWidths[1] + 5
+            self.rowKeysPageContainer.getTopElement().widgetConfig(width=rowTitleWidth)
+            if self.columnKeys:
+                self.columnKeysFillerLeft.widgetConfig(width=rowTitleWidth)
+
+        self.renderedColumnWidths = widths[1:]
+        self.renderedRowHeights = heights[1:]
 
     def toggleAllMultilines(self, show=None):
         self.dataFrameIsLoading = True
@@ -0,0 +1,113 @@
+"""
+Appender for Spreadsheet.
+"""
+
+from generallibrary.types import typeChecker
+
+import pandas as pd
+
+import time
+
+
+def toRows(rows, columns):
+    """
+    Convert rows to a DataFrame.
+
+    :param pd.DataFrame or list or dict rows: DataFrame, list of rows or dict of columns. Rows as lists use columns if they fit.
+    :param pd.Index columns: Columns of the frame that rows are appended to
+    :rtype: pd.DataFrame
+    """
+    if typeChecker(rows, pd.DataFrame, error=False):
+        return rows
+    if isinstance(rows, list) and rows and isinstance(rows[0], (list, tuple)) and len(rows[0]) == len(columns):
+        return pd.DataFrame(rows, columns=columns)
+    return pd.DataFrame(rows)
+
+def continueIndex(df, frames):
+    """
+    Concatenate frames of rows that are about to be appended to df.
+    Frames with a default integer index continue df's index if it's a default integer index as well.
+
+    :param pd.DataFrame df: Frame that rows are appended to
+    :param list[pd.DataFrame] frames: Frames of rows in order
+    :rtype: pd.DataFrame
+    """
+    start = len(df)
+    defaultIndex = df.index.equals(pd.RangeIndex(start))
+    continued = []
+    for rows in frames:
+        if not rows.index.equals(pd.RangeIndex(len(rows))):
+            defaultIndex = False
+        elif defaultIndex:
+            rows = rows.set_axis(pd.RangeIndex(start, start + len(rows)), axis=0)
+        start += len(rows)
+        continued.append(rows)
+    return pd.concat(continued) if len(continued) > 1 else continued[0]
+
+
+class Appender:
+    """
+    Appender feature for Spreadsheet.
+    Adds rows to the bottom of dataFrame, only creating cells for the new rows.
+    Rows appended between two frames are coalesced into one append so a fast producer doesn't starve the event loop, see appendFps.
+    Rows are appended to model instead if there is one, so that every Spreadsheet showing it gets them.
+    """
+    def __init__(self, appendFps=30):
+        """
+        :param generalgui.Spreadsheet self:
+        :param float appendFps: Maximum number of times per second that appended rows are shown
+        """
+        self.appendFps = appendFps
+        self._appendPending = []
+        self._appendQueued = False
+        self._appendFollow = False
+        self._appendTime = 0
+
+    def appendRows(self, rows, follow=False):
+        """
+        Queue rows to be added to the bottom of dataFrame, they're shown at most appendFps times per second.
+        Rows with a default integer index continue dataFrame's index if it's a default integer index as well.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.DataFrame or list or dict rows: DataFrame, list of rows or dict of columns. Rows as lists use dataFrame's columns if they fit.
+        :param bool follow: Whether to scroll to the bottom once rows are shown
+        """
+        self._appendPending.append(toRows(rows, (self.dataFrame if self.model is None else self.model.dataFrame).columns))
+        self._appendFollow = self._appendFollow or follow
+
+        if not self._appendQueued:
+            self._appendQueued = True
+            delay = self._appendTime + 1 / self.appendFps - time.perf_counter()
+            self.app.widget.after(max(0, int(delay * 1000)), self.flushAppends)
+
+    def flushAppends(self):
+        """
+        Show every queued row now.
+
+        :param generalgui.Spreadsheet self:
+        """
+        self._appendQueued = False
+        self._appendTime = time.perf_counter()
+        pending, self._appendPending = self._appendPending, []
+        follow, self._appendFollow = self._appendFollow, False
+        if not pending or self.removed:
+            return
+
+        if self.model is None:
+            self._appendDataFrame(continueIndex(self.dataFrame, pending))
+        else:
+            self.model._appendFrames(pending)
+
+        if follow:
+            self.scrollToBottom()
+
+    def scrollToBottom(self):
+        """
+        Scroll mainGrid and index to the last row.
+
+        :param generalgui.Spreadsheet self:
+        """
+        self.app.widget.update_idletasks()
+        self.mainGrid._canvasConfigure()
+        self.mainGrid.canvas.widget.yview_moveto(1)
+        self._syncKeysScroll()
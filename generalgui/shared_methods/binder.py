@@ -7,6 +7,11 @@ from generallibrary.functions import leadingArgsCount
 from generallibrary.iterables import addToListInDict, uniqueObjInList
 from generallibrary.types import typeChecker
 
+from types import MappingProxyType
+
+
+noEvents = MappingProxyType({})  # Shared by parts without binds, replaced by a dict on first bind
+
 
 class Binder_App:
     """Binder feature for App"""
@@ -71,9 +76,11 @@ class Binder_App:
 
 class Binder:
     """Binder feature for all parts"""
+    __slots__ = ()
+
     def __init__(self):
-        self.events = {}
-        self.disabledPropagations = []
+        self.events = noEvents
+        self.disabledPropagations = ()
 
     def setBindPropagation(self, key, enable):
         """
@@ -86,6 +93,8 @@ class Binder:
         :param str key: Bind key, <Button-1> for example.
         :param bool enable: Whether to enable propagation or not.
         """
+        if self.disabledPropagations == ():
+            self.disabledPropagations = []
         uniqueObjInList(self.disabledPropagations, key, not enable)
 
     def createBind(self, key, func, add=True, name=None):
@@ -112,6 +121,8 @@ class Binder:
                     raise NameError(f"{existingBind} is already using this name with another key")
 
         bind = Bind(element=self, key=key, func=func, name=name)
+        if self.events is noEvents:
+            self.events = {}
         addToListInDict(self.events, key, bind)
         self.app.widgetBind(key)
 
@@ -228,6 +239,8 @@ class Binder:
 
 class Bind:
     """A specific bind that contains a func"""
+    __slots__ = ("element", "name", "key", "func")
+
     def __init__(self, element, key, func, name=None):
         self.element = element
         self.name = name
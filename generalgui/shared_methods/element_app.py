@@ -7,6 +7,8 @@ class Element_App(Styler):
     """
     Pure methods that Element and App share.
     """
+    __slots__ = ()
+
     def __init__(self):
         Styler.__init__(self)
 
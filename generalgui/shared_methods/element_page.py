@@ -31,6 +31,8 @@ class Element_Page:
     """
     Pure methods that Element and Page share.
     """
+    __slots__ = ()
+
     def __init_subclass__(cls, **kwargs):
         """
         Wrap subclasses functions that can effect a parent spreadsheet's cell sizes.
@@ -41,7 +43,9 @@ class Element_Page:
         methodsToWrap = ("setSize", "setValue")
         for methodName in methodsToWrap:
             if method := getattr(cls, methodName, None):
-                setattr(cls, methodName, lambda *args, m=method, **kwargs: spreadsheetSyncSizesWrapper(m, *args, **kwargs))
+                wrapper = lambda *args, m=method, **kwargs: spreadsheetSyncSizesWrapper(m, *args, **kwargs)
+                wrapper.__wrapped__ = method  # So that inspect.unwrap() can skip syncing, such as Grid.fillGrid() which syncs once
+                setattr(cls, methodName, wrapper)
 
     def hasGridParameters(self):
         """
@@ -75,13 +79,28 @@ class Element_Page:
             print(e, self, self.getTopWidget(), pars)
             raise e
 
+        if grid := self._getParentGrid():
+            if "column" not in pars or "row" not in pars:
+                pars = self.getTopWidget().grid_info()
+            grid._indexGridElement(self.getTopElement(), pars["column"], pars["row"])
+
+    def _getParentGrid(self):
+        """
+        Get the Grid that this Element's or Page's top widget is gridded in, or None.
+
+        :param generalgui.element.Element or generalgui.Page self: Element or Page
+        :rtype: generalgui.Grid
+        """
+        page = self.getTopElement().getParentPartPage()
+        return page if hasattr(page, "_indexGridElement") else None
+
     def getParentPartPage(self):
         """
         Get the page of this element's or page's parentPart
 
         :param generalgui.element.Element or generalgui.Page self: Element or Page
         """
-        if typeChecker(self.parentPart, "App", error=False):
+        if self.parentPart is self.app:
             return self.app
         else:
             return self.parentPart.parentPage
@@ -92,10 +111,10 @@ class Element_Page:
 
         :param generalgui.element.Element or generalgui.Page self: Element or Page
         """
-        if typeChecker(self.parentPage, "App", error=False):
+        if self.parentPage is self.app:
             return self.parentPage
 
-        elif self.parentPage.topElement == self:
+        elif self.parentPage.topElement is self:
             return self.parentPage
         else:
             return self.parentPart
@@ -114,6 +133,9 @@ class Element_Page:
             self.topElement.pack()
 
         else:
+            if not self.parentPart._materialized:
+                self.parentPart._pendingActions.append(self.pack)  # Packed once parentPart is materialized
+                return
 
             if self.hasGridParameters():
                 self._grid()
@@ -215,13 +237,12 @@ class Element_Page:
     @ignore
     def removeSiblings(self, ignore=None):
         """
-        Calls the 'remove' method on all siblings of this Element or Page.
+        Removes all siblings of this Element or Page together with App.removeParts().
 
         :param generalgui.element.Element or generalgui.page.Page self: Element or Page
         :param any ignore: A single child or multiple children to ignore. Is converted to list through decorator.
         """
-        for sibling in self.getSiblings(ignore=ignore):
-            sibling.remove()
+        self.app.removeParts(self.getSiblings(ignore=ignore))
 
     @ignore
     def nextSibling(self, ignore=None):
@@ -277,9 +298,17 @@ class Element_Page:
 
         :param generalgui.element.Element or generalgui.page.Page self: Element or Page
         """
+        if not self.isMaterialized():
+            topElement = self.getTopElement()
+            if not topElement.parentPart.isMaterialized() and topElement.pack in topElement.parentPart._pendingActions:
+                topElement.parentPart._pendingActions.remove(topElement.pack)
+            return
+
         if self.isPacked:
             if self.hasGridParameters():
                 self.getTopWidget().grid_forget()
+                if grid := self._getParentGrid():
+                    grid._unindexGridElement(self.getTopElement())
             else:
                 self.getTopWidget().pack_forget()
 
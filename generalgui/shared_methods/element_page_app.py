@@ -1,6 +1,7 @@
 """Shared methods by Element, Page and App"""
 
 from tkinter import TclError
+from types import MappingProxyType
 
 from generallibrary.types import typeChecker
 from generallibrary.iterables import exclusive
@@ -13,15 +14,24 @@ from generalgui.shared_methods.menu import Menu_Element_Page_App
 from generalgui.shared_methods.binder import Binder
 
 
+noChildren = MappingProxyType({})  # Shared by parts without child elements, replaced by a dict on first child
+
+
 class Element_Page_App(Menu_Element_Page_App, Binder):
     """
     Pure methods that Element, Page and App all share.
+    Every Element is indexed in it's parentPart's _childElements, in creation order like tkinter's children.
+    Parents never change as tkinter can't move a widget to another master, so Pages cache their parent pages and parents by class.
     """
+    __slots__ = ()
+
     def __init__(self):
         Menu_Element_Page_App.__init__(self)
         Binder.__init__(self)
 
         self.removed = False
+        self.pooled = False
+        self._childElements = noChildren
 
     def __repr__(self):
         return f"<gui part: {self.__class__.__name__}>"
@@ -120,37 +130,59 @@ class Element_Page_App(Menu_Element_Page_App, Binder):
         :param includeParts: Whether to include parts or not
         :rtype: list[generalgui.element.Element or generalgui.page.Page]
         """
-        pages = []
-
-        if typeChecker(self, "App", error=False):
+        if self is self.app:
             if includeApp or includeSelf:
                 return [self]
             else:
                 return []
 
-        parentPage = self.getParentPartOrPage() if includeParts else self.parentPage
-        while True:
-            if typeChecker(parentPage, "App", error=False):
-                if includeSelf:
-                    pages.insert(0, self)
-                if includeApp:
-                    pages.append(parentPage)
-                return pages
-            else:
+        if includeParts:
+            pages = []
+            parentPage = self.getParentPartOrPage()
+            while parentPage is not self.app:
                 pages.append(parentPage)
-            parentPage = parentPage.getParentPartOrPage() if includeParts else parentPage.parentPage
+                parentPage = parentPage.getParentPartOrPage()
+        elif self.parentPage is self.app:
+            pages = []
+        else:
+            pages = list(self.parentPage._getPageChain())
+
+        if includeSelf:
+            pages.insert(0, self)
+        if includeApp:
+            pages.append(self.app)
+        return pages
 
     def getFirstParentByClass(self, className, includeSelf=False):
         """
         Iterate parent pages to return first part with matching className or None.
+        Looked up once per Page and className if className is a str or type.
 
         :param generalgui.element.Element or generalgui.page.Page or generalgui.app.App self: Element, Page or App
         :param className: Name or type of part, used by typeChecker
         :param includeSelf:
         """
-        for part in self.getParents(includeSelf=includeSelf):
-            if typeChecker(part, className, error=False):
-                return part
+        if includeSelf and typeChecker(self, className, error=False):
+            return self
+        if self is self.app or self.parentPage is self.app:
+            return None
+        if not isinstance(className, (str, type)):
+            for part in self.parentPage._getPageChain():
+                if typeChecker(part, className, error=False):
+                    return part
+            return None
+        return self.parentPage._getParentByClass(className)
+
+    def _addChildElement(self, element):
+        """
+        Index an element that's created in this part's widget.
+
+        :param generalgui.element.Element or generalgui.app.App self: Element or App
+        :param generalgui.element.Element element:
+        """
+        if self._childElements is noChildren:
+            self._childElements = {}
+        self._childElements[element] = None
 
     @ignore
     def getChildren(self, includeParts=False, ignore=None, recurrent=False):
@@ -167,18 +199,17 @@ class Element_Page_App(Menu_Element_Page_App, Binder):
         kwargs = exclusive(locals(), "self")
         children = []
 
-        parentWidget = self.getTopWidget() if includeParts else self.getBaseWidget()
+        parentElement = self.getTopElement() if includeParts else self.getBaseElement()
 
-        for widget in parentWidget.winfo_children():
-            if getattr(widget, "element", None) is None:
+        for element in parentElement._childElements:
+            if element.pooled:
                 continue
-            part = widget.element
+            part = element
 
-            partIsTopElement = part.parentPage.topElement == part
-            if not includeParts and partIsTopElement:
+            if not includeParts and part.parentPage.topElement is part:
                 part = part.parentPage
 
-            if widget.element not in ignore and part not in ignore:
+            if element not in ignore and part not in ignore:
                 children.append(part)
                 if recurrent:
                     children.extend(part.getChildren(**kwargs))
@@ -231,6 +262,14 @@ class Element_Page_App(Menu_Element_Page_App, Binder):
         """
         return self.getTopElement().widget
 
+    def isMaterialized(self):
+        """
+        Get whether top widget has been created, only lazy Elements and Pages can be unmaterialized.
+
+        :param generalgui.element.Element or generalgui.page.Page or generalgui.app.App self: Element, Page or App
+        """
+        return getattr(self.getTopElement(), "_materialized", True)
+
     def isShown(self, error=True):
         """
         Get whether a widget is shown or not.
@@ -239,6 +278,8 @@ class Element_Page_App(Menu_Element_Page_App, Binder):
         :param generalgui.element.Element or generalgui.page.Page or generalgui.app.App self: Element, Page or App
         :param error: Whether to raise error if widget is destroyed or not
         """
+        if not self.isMaterialized():
+            return False
         try:
             return not not self.getTopWidget().winfo_ismapped()
         except TclError as e:
@@ -263,6 +304,8 @@ class Element_Page_App(Menu_Element_Page_App, Binder):
         """
         if self.removed:
             return False  # For app.remove()
+        if not self.isMaterialized():
+            return False
 
         try:
             return self.getTopWidget().winfo_manager() != ""
@@ -275,17 +318,14 @@ class Element_Page_App(Menu_Element_Page_App, Binder):
 
         :param generalgui.element.Element or generalgui.page.Page or generalgui.app.App self: Element, Page or App
         """
-        self.removed = True
-
-        for part in (self.getChildren(recurrent=True) + self.getChildren(includeParts=True, recurrent=True)):
-            part.removed = True
-
         if typeChecker(self, "App", error=False):
+            self.removed = True
+            for part in (self.getChildren(recurrent=True) + self.getChildren(includeParts=True, recurrent=True)):
+                part.removed = True
             self.getApps().remove(self)
             self.widget.quit()
         else:
-            self.getTopWidget().update()
-            self.getTopWidget().destroy()
+            self.app.removeParts((self, ))
 
 
 
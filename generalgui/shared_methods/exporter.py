@@ -0,0 +1,197 @@
+"""
+Exporter for Spreadsheet.
+"""
+
+from generalgui.datasources import importPyarrow
+
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import threading
+
+
+textCompressions = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+fileFormats = {".tsv": "tsv", ".txt": "tsv", ".csv": "csv", ".parquet": "parquet", ".pq": "parquet", ".feather": "feather", ".arrow": "feather", ".ipc": "feather"}
+
+
+def getExportFormat(path):
+    """
+    Get file format and compression of a path from it's extensions, like "tsv", "csv", "parquet" or "feather" and ".gz", ".bz2", ".xz" or None.
+
+    :param str path:
+    :raises ValueError: If extension isn't supported
+    :rtype: tuple[str]
+    """
+    root, extension = os.path.splitext(path.lower())
+    compression = None
+    if extension in textCompressions:
+        compression = extension
+        extension = os.path.splitext(root)[1]
+    fileFormat = fileFormats.get(extension)
+
+    if fileFormat is None or (compression and fileFormat not in ("tsv", "csv")):
+        raise ValueError(f"Can't export to {path}, use one of {list(fileFormats)} with optional {list(textCompressions)} for tsv and csv")
+    return fileFormat, compression
+
+def writeChunks(df, path, fileFormat, compression, chunkSize, progress, cancel, rows=None):
+    """
+    Worker for Exporter, runs in it's own thread.
+    Writes to a temporary file next to path that replaces path once done, so a cancelled or failed export leaves path untouched.
+    Puts progress between 0 and 1 in progress queue, then (None) when done or an exception if writing failed.
+
+    :param pd.DataFrame df: Snapshot of dataFrame
+    :param str path: Path to write to
+    :param str fileFormat: "tsv", "csv", "parquet" or "feather"
+    :param str compression: ".gz", ".bz2" or ".xz" for tsv and csv, codec name for parquet and feather
+    :param int chunkSize: Number of rows written at a time
+    :param queue.Queue progress: Queue to put progress in
+    :param threading.Event cancel: Stops writing and removes temporary file when set
+    :param np.ndarray rows: Positions in df of rows to write in order, None writes df as it is
+    """
+    tempPath = f"{path}.part"
+    writer = schema = None
+    try:
+        chunks = range(0, max(len(df), 1), chunkSize)
+        if fileFormat in ("tsv", "csv"):
+            opener = textCompressions.get(compression, open)
+            writer = opener(tempPath, "wt", newline="", encoding="utf-8")
+        else:
+            pyarrow = importPyarrow()
+
+        for i, start in enumerate(chunks):
+            if cancel.is_set():
+                break
+            chunk = df.iloc[start:start + chunkSize] if rows is None else df.iloc[rows[start:start + chunkSize]]
+
+            if fileFormat in ("tsv", "csv"):
+                chunk.to_csv(writer, sep="\t" if fileFormat == "tsv" else ",", header=not i)
+            else:
+                table = pyarrow.Table.from_pandas(chunk, preserve_index=fileFormat == "parquet", schema=schema)
+                if writer is None:
+                    schema = table.schema
+                    if fileFormat == "parquet":
+                        writer = pyarrow.parquet.ParquetWriter(tempPath, table.schema, **({"compression": compression} if compression else {}))
+                    else:
+                        options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+                        writer = pyarrow.ipc.new_file(tempPath, table.schema, options=options)
+                writer.write_table(table)
+
+            progress.put((i + 1) / len(chunks))
+
+        if writer is not None:  # Parquet and feather writers are only created with the first chunk
+            writer.close()
+            writer = None
+        if cancel.is_set():
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+        else:
+            os.replace(tempPath, path)
+            progress.put(None)
+
+    except Exception as e:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+        progress.put(e)
+
+
+class Exporter:
+    """
+    Exporter feature for Spreadsheet.
+    Writes dataFrame to tsv, csv, parquet or feather files in chunks on a worker thread, progress is shown in statusLabel.
+    tsv and csv can be compressed with .gz, .bz2 or .xz extensions, parquet and feather need pyarrow.
+
+    A shallow copy of dataFrame is written, so no values are copied. Sorting and dropping replace dataFrame and setting a value replaces it's column,
+    so nothing writes into the copy's values while exporting.
+    A sorted linked view writes it's rows in shown order through modelRows, which is replaced and not changed when sorting again.
+    Feather files don't store index.
+    """
+    def __init__(self, exportPollMs=100):
+        """
+        :param generalgui.Spreadsheet self:
+        :param int exportPollMs: Milliseconds between each check for export progress
+        """
+        self.exportPollMs = exportPollMs
+        self._exportQueue = None
+        self._exportCancel = None
+
+    def exportFile(self, path, compression=None, chunkSize=None):
+        """
+        Start writing dataFrame to a file on a worker thread, cancels any current export.
+
+        :param generalgui.Spreadsheet self:
+        :param str path: Path with an extension that decides format, see getExportFormat()
+        :param str compression: Codec for parquet and feather such as "snappy", "zstd" or "lz4"
+        :param int chunkSize: Number of rows written at a time, defaults to loadChunkSize
+        :raises ValueError: If extension isn't supported
+        """
+        fileFormat, textCompression = getExportFormat(path)
+        self.cancelExport()
+
+        # Values are never written in place, changed columns are replaced, so a shallow copy is a consistent snapshot
+        snapshot = self.dataFrame.copy(deep=False)
+
+        progress = queue.Queue()
+        self._exportQueue = progress
+        self._exportCancel = threading.Event()
+        args = (snapshot, path, fileFormat, textCompression or compression, chunkSize or self.loadChunkSize, progress, self._exportCancel, self.modelRows)
+        threading.Thread(target=writeChunks, args=args, daemon=True).start()
+
+        self.setStatus(f"Saving {os.path.basename(path)}")
+        self.app.widget.after(self.exportPollMs, self._pollExport, progress, os.path.basename(path))
+
+    def isExporting(self):
+        """
+        Get whether dataFrame is currently being written to a file.
+
+        :param generalgui.Spreadsheet self:
+        """
+        return self._exportQueue is not None
+
+    def cancelExport(self):
+        """
+        Stop current export, the file it would have written is left untouched.
+
+        :param generalgui.Spreadsheet self:
+        """
+        if self._exportCancel:
+            self._exportCancel.set()
+            self.setStatus(None)
+        self._exportQueue = None
+        self._exportCancel = None
+
+    def _pollExport(self, progress, name):
+        """
+        Show progress of export, queues itself again until file is written.
+
+        :param generalgui.Spreadsheet self:
+        :param queue.Queue progress: Queue of export that queued this poll, ignored if it's not current
+        :param str name: File name to show
+        """
+        if progress is not self._exportQueue:
+            return
+
+        latest = False
+        while True:
+            try:
+                latest = progress.get_nowait()
+            except queue.Empty:
+                break
+            if latest is None or isinstance(latest, Exception):
+                break
+
+        if latest is None:
+            self._exportQueue = None
+            self._exportCancel = None
+            self.setStatus(None)
+        elif isinstance(latest, Exception):
+            self._exportQueue = None
+            self._exportCancel = None
+            self.setStatus(f"Saving {name} failed: {latest}")
+        else:
+            if latest is not False:
+                self.setStatus(f"Saving {name}... ({latest:.0%})")
+            self.app.widget.after(self.exportPollMs, self._pollExport, progress, name)
@@ -0,0 +1,253 @@
+"""
+Filterer for Spreadsheet.
+"""
+
+from generalgui.elements.entry import Entry
+from generalgui.shared_methods.formatter import formatValues
+
+import numpy as np
+import pandas as pd
+
+import time
+
+
+class Filterer:
+    """
+    Filterer feature for Spreadsheet.
+    Shows only rows where index or any value contains filterText, case insensitive.
+    Rows aren't removed from dataFrame, filterRows maps rendered rows to rows in dataFrame instead.
+    A linked view's modelRows are combined with it by getViewRows so that filtered rows keep the view's sort.
+
+    Lowercased texts of every column are kept as a search index until dataVersion changes, so each filter pass is a vectorized substring search.
+    Texts are kept in object arrays, as fixed width strings would make every text of a column as long as it's longest.
+    Typing in filterEntry waits filterDelayMs before filtering, and a pass is split up by time so that a newer keystroke cancels it.
+    """
+    filterStepMs = 20
+
+    def __init__(self, filterEntry=False, filterDelayMs=150):
+        """
+        :param generalgui.Spreadsheet self:
+        :param bool filterEntry: Whether to create an entry above cells to filter rows with
+        :param int filterDelayMs: Milliseconds to wait after a keystroke before filtering
+        """
+        self.filterDelayMs = filterDelayMs
+        self.filterText = ""
+        self.filterRows = None
+        self._filterState = None
+        self._filterGeneration = 0
+        self._filterAfter = None
+        self._searchCache = {}
+        self._searchCacheVersion = None
+        self._viewRows = None
+
+        self.filterEntry = None
+        if filterEntry:
+            before = self.getBaseWidget().pack_slaves()
+            self.filterEntry = Entry(self, width=0, side="top", fill="x", **({"before": before[0]} if before else {}))
+            self.filterEntry.createBind("<KeyRelease>", self._queueFilter)
+
+    def setFilter(self, text):
+        """
+        Only show rows where index or any value contains text, case insensitive.
+
+        :param generalgui.Spreadsheet self:
+        :param str text: Text to search for, empty string shows all rows
+        """
+        self._filterGeneration += 1
+        self._cancelQueuedFilter()
+        if self.filterEntry and self.filterEntry.widget.get() != text:
+            self.filterEntry.setValue(text)
+        self._showFilter(text, self._getFilterMask(text))
+
+    def getFilterRows(self):
+        """
+        Get positions in dataFrame of the rows that pass filter, or None if every row is shown.
+        Filter is applied again if dataFrame has changed since it was last applied.
+
+        :param generalgui.Spreadsheet self:
+        :rtype: np.ndarray or None
+        """
+        if not self.filterText or self.dataSource is not None:
+            return None
+        if not self._isFilterState(self._filterState):
+            self.filterRows = np.flatnonzero(self._getFilterMask(self.filterText))
+            self._filterState = self._getFilterState()
+        return self.filterRows
+
+    def getViewRows(self):
+        """
+        Get positions in dataFrame of the rows that are shown in shown order, or None if every row is shown in dataFrame's order.
+        These are the rows that pass filter, ordered by modelRows in a sorted linked view.
+
+        :param generalgui.Spreadsheet self:
+        :rtype: np.ndarray or None
+        """
+        filterRows = self.getFilterRows()
+        if self.modelRows is None or filterRows is None:
+            return self.modelRows if filterRows is None else filterRows
+
+        if self._viewRows is None or self._viewRows[0] is not filterRows or self._viewRows[1] is not self.modelRows:
+            mask = np.zeros(self.dataFrame.shape[0], dtype=bool)
+            mask[filterRows] = True
+            self._viewRows = (filterRows, self.modelRows, self.modelRows[mask[self.modelRows]])
+        return self._viewRows[2]
+
+    def _getFilterState(self):
+        """
+        Get what filterRows depends on.
+
+        :param generalgui.Spreadsheet self:
+        """
+        return self.dataFrame, self.dataVersion, self.dataFrame.shape, self.dataFrame.index
+
+    def _isFilterState(self, state):
+        """
+        Get whether dataFrame is unchanged since state was taken.
+
+        :param generalgui.Spreadsheet self:
+        :param tuple state:
+        """
+        if state is None:
+            return False
+        frame, version, shape, index = state
+        return frame is self.dataFrame and version == self.dataVersion and shape == self.dataFrame.shape and index is self.dataFrame.index
+
+    def _getSearchColumn(self, x):
+        """
+        Get lowercased texts of a column in dataFrame in current row order, cached.
+        x of -1 is index.
+
+        :param generalgui.Spreadsheet self:
+        :param int x: Column position in dataFrame
+        :rtype: np.ndarray
+        """
+        if self._searchCacheVersion != self.dataVersion:
+            self._searchCache = {}
+            self._searchCacheVersion = self.dataVersion
+
+        df = self.dataFrame
+        if x == -1:
+            key = ("index", )
+        else:
+            key = ("column", df.columns[x]) if df.columns.is_unique else None
+
+        if key is not None and (cached := self._searchCache.get(key)):
+            index, texts = cached
+            if index is df.index or index.equals(df.index):
+                return texts
+            elif index.is_unique and not ((positions := index.get_indexer(df.index)) == -1).any():
+                texts = texts[positions]
+                self._searchCache[key] = (df.index, texts)
+                return texts
+
+        if x == -1:
+            texts = formatValues(df.index.to_series())
+        else:
+            texts = self.formatColumn(x)[0]
+        texts = pd.Series(texts, dtype=object, copy=False).str.lower().to_numpy(dtype=object)
+        if key is not None:
+            self._searchCache[key] = (df.index, texts)
+        return texts
+
+    def _dropSearchColumn(self, key):
+        """
+        Forget cached texts of a column whose values have changed without changing dataVersion.
+
+        :param generalgui.Spreadsheet self:
+        :param key: Header key
+        """
+        self._searchCache.pop(("column", key), None)
+
+    def _matchColumn(self, x, text):
+        """
+        Get a bool array of which rows of a column contain text.
+
+        :param generalgui.Spreadsheet self:
+        :param int x: Column position in dataFrame, -1 for index
+        :param str text: Lowercased text
+        """
+        return pd.Series(self._getSearchColumn(x), dtype=object, copy=False).str.contains(text, regex=False).to_numpy(dtype=bool)
+
+    def _getFilterMask(self, text):
+        """
+        Get a bool array of which rows pass a filter text, None if text is empty.
+
+        :param generalgui.Spreadsheet self:
+        :param str text:
+        """
+        if not text:
+            return None
+        text = text.lower()
+        mask = self._matchColumn(-1, text)
+        for x in range(self.dataFrame.shape[1]):
+            mask = mask | self._matchColumn(x, text)
+        return mask
+
+    def _showFilter(self, text, mask):
+        """
+        Store the result of a filter pass and fill cells with it.
+
+        :param generalgui.Spreadsheet self:
+        :param str text:
+        :param np.ndarray or None mask:
+        """
+        self.filterText = text
+        self.filterRows = None if mask is None else np.flatnonzero(mask)
+        self._filterState = self._getFilterState()
+        self.mainGrid.canvas.widget.yview_moveto(0)
+        self._fillDataFrame()
+
+    def _cancelQueuedFilter(self):
+        """
+        Cancel a queued filter pass.
+
+        :param generalgui.Spreadsheet self:
+        """
+        if self._filterAfter is not None:
+            self.app.widget.after_cancel(self._filterAfter)
+            self._filterAfter = None
+
+    def _queueFilter(self):
+        """
+        Queue a filter pass with filterEntry's text after filterDelayMs, replacing any queued or running pass.
+
+        :param generalgui.Spreadsheet self:
+        """
+        text = self.filterEntry.widget.get()
+        self._filterGeneration += 1
+        self._cancelQueuedFilter()
+        if text != self.filterText:
+            self._filterAfter = self.app.widget.after(self.filterDelayMs, self._filterStep, self._filterGeneration, text, -1, None, self._getFilterState())
+
+    def _filterStep(self, generation, text, x, mask, state):
+        """
+        Match columns until filterStepMs has passed, then queue next step.
+        Stops if a newer pass has been started.
+
+        :param generalgui.Spreadsheet self:
+        :param int generation: Generation of pass
+        :param str text: Filter text
+        :param int x: Next column position to match, -1 for index
+        :param np.ndarray or None mask: Rows that have matched so far
+        :param tuple state: State of dataFrame when pass started, pass starts over if it has changed
+        """
+        self._filterAfter = None
+        if generation != self._filterGeneration or self.removed:
+            return
+        if not text:
+            self._showFilter(text, None)
+            return
+        if not self._isFilterState(state):
+            x, mask, state = -1, None, self._getFilterState()
+
+        lowered = text.lower()
+        end = time.perf_counter() + self.filterStepMs / 1000
+        while x < self.dataFrame.shape[1]:
+            matched = self._matchColumn(x, lowered)
+            mask = matched if mask is None else mask | matched
+            x += 1
+            if time.perf_counter() > end and x < self.dataFrame.shape[1]:
+                self._filterAfter = self.app.widget.after(1, self._filterStep, generation, text, x, mask, state)
+                return
+
+        self._showFilter(text, mask)
@@ -0,0 +1,226 @@
+"""
+Formatter for Spreadsheet.
+
+Classes:
+    * Formatter
+
+Functions:
+    * formatFloats
+    * formatDatetimes
+    * formatCategoricals
+    * formatBools
+    * formatValues
+"""
+
+from generalgui.elements.label import Label
+
+import numpy as np
+import pandas as pd
+
+
+def formatFloats(series, precision=None):
+    """
+    Format a float column.
+
+    :param pd.Series series:
+    :param int precision: Number of decimals, None uses str()
+    :rtype: np.ndarray
+    """
+    if precision is None:
+        return series.to_numpy().astype(str)
+    return np.char.mod(f"%.{precision}f", series.to_numpy())
+
+def formatDatetimes(series, datetimeFormat=None):
+    """
+    Format a datetime column.
+
+    :param pd.Series series:
+    :param str datetimeFormat: strftime format, None uses str()
+    :rtype: np.ndarray
+    """
+    if datetimeFormat is None:
+        return formatValues(series)
+    return series.dt.strftime(datetimeFormat).fillna("NaT").to_numpy(dtype=object)
+
+def formatCategoricals(series):
+    """
+    Format a categorical column by only formatting it's categories.
+
+    :param pd.Series series:
+    :rtype: np.ndarray
+    """
+    categories = formatValues(pd.Series(series.cat.categories))
+    return np.append(categories, "nan")[series.cat.codes.to_numpy()]
+
+def formatBools(series):
+    """
+    Format a bool column.
+
+    :param pd.Series series:
+    :rtype: np.ndarray
+    """
+    return np.where(series.to_numpy(), "True", "False")
+
+def formatValues(series):
+    """
+    Format a column of any type with str(), None becomes an empty string like in Label.
+    Values are converted one by one as numpy would treat values such as lists as sequences.
+
+    :param pd.Series series:
+    :rtype: np.ndarray
+    """
+    return np.array(["" if value is None else str(value) for value in series.to_numpy(dtype=object)], dtype=object)
+
+
+class Formatter:
+    """
+    Formatter feature for Spreadsheet.
+    Converts whole columns to displayed strings at once with a formatter per dtype.
+    Multiline and maxLen flags are computed column-wise as well.
+    Texts are kept in object arrays, as fixed width strings would make every text of a column as long as it's longest.
+
+    Formatted columns are cached by label until dataVersion changes, sorting only reorders the cached values and appended rows only formats the new rows.
+    A value set in a linked model only formats that value.
+    """
+    def __init__(self, maxLen=None, floatPrecision=None, datetimeFormat=None):
+        """
+        :param generalgui.Spreadsheet self:
+        :param int maxLen: Hide values longer than this
+        :param int floatPrecision: Number of decimals for float columns, None uses str()
+        :param str datetimeFormat: strftime format for datetime columns, None uses str()
+        """
+        self.maxLen = maxLen
+        self.floatPrecision = floatPrecision
+        self.datetimeFormat = datetimeFormat
+        self._formatCache = {}
+        self._formatCacheVersion = None
+
+    def getColumnTexts(self, series):
+        """
+        Get displayed texts of a column with the formatter matching it's dtype.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.Series series:
+        :rtype: np.ndarray
+        """
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            return formatCategoricals(series)
+        elif dtype == bool:
+            return formatBools(series)
+        elif isinstance(dtype, np.dtype) and dtype.kind == "f":
+            return formatFloats(series, precision=self.floatPrecision)
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            return formatDatetimes(series, datetimeFormat=self.datetimeFormat)
+        else:
+            return formatValues(series)
+
+    def formatColumn(self, x):
+        """
+        Get texts, short texts and hideable flags of a column in dataFrame, in dataFrame's current row order.
+        Short texts are None for values that aren't hideable.
+
+        :param generalgui.Spreadsheet self:
+        :param int x: Column position in dataFrame
+        :rtype: tuple[np.ndarray]
+        """
+        if self._formatCacheVersion != self.dataVersion:
+            self._formatCache = {}
+            self._formatCacheVersion = self.dataVersion
+
+        df = self.dataFrame
+        key = df.columns[x] if df.columns.is_unique else None
+
+        formatted = None
+        if key is not None and (cached := self._formatCache.get(key)):
+            index, formatted = cached
+            if index is df.index or index.equals(df.index):
+                return formatted
+            elif len(index) < len(df.index) and df.index[:len(index)].equals(index):
+                appended = self.formatSeries(df.iloc[len(index):, x])
+                formatted = tuple(np.concatenate((old, new)) for old, new in zip(formatted, appended))
+            elif index.is_unique and not ((positions := index.get_indexer(df.index)) == -1).any():
+                return tuple(array[positions] for array in formatted)
+            else:
+                formatted = None
+
+        if formatted is None:
+            formatted = self.formatSeries(df.iloc[:, x])
+        if key is not None:
+            self._formatCache[key] = (df.index, formatted)
+        return formatted
+
+    def _setFormattedValue(self, rowKey, columnKey):
+        """
+        Format a value that has changed without changing dataVersion, only it's texts are replaced in it's column's cached texts.
+
+        :param generalgui.Spreadsheet self:
+        :param rowKey: Index key of changed value
+        :param columnKey: Header key of changed value
+        """
+        cached = self._formatCache.get(columnKey) if self._formatCacheVersion == self.dataVersion else None
+        if cached is None:
+            return
+        index, formatted = cached
+        if not index.is_unique or rowKey not in index:
+            del self._formatCache[columnKey]
+            return
+
+        position = index.get_loc(rowKey)
+        formatted = tuple(array if array.flags.writeable else array.copy() for array in formatted)
+        for array, value in zip(formatted, self.formatSeries(self.dataFrame[columnKey].loc[[rowKey]])):
+            array[position] = value[0]
+        self._formatCache[columnKey] = (index, formatted)
+
+    def formatSeries(self, series):
+        """
+        Get texts, short texts and hideable flags of a series without caching.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.Series series:
+        :rtype: tuple[np.ndarray]
+        """
+        texts = np.asarray(self.getColumnTexts(series), dtype=object)
+        strings = pd.Series(texts, dtype=object)
+        hideable = strings.str.contains("\n", regex=False).to_numpy(dtype=bool)
+        if self.maxLen:
+            hideable = hideable | (strings.str.len().to_numpy() > self.maxLen)
+
+        shortTexts = np.full(len(texts), None, dtype=object)
+        shortTexts[hideable] = [Label.getShortValue(text, self.maxLen) for text in texts[hideable]]
+        return texts, shortTexts, hideable
+
+    def formatFrame(self, df):
+        """
+        Get formatted (text, shortText, hideable) tuples of a whole frame without caching, going left to right row by row.
+        Used for windows read from a dataSource as they aren't part of dataFrame.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.DataFrame df:
+        :rtype: list[tuple]
+        """
+        if df.empty:
+            return []
+        columns = [self.formatSeries(df.iloc[:, x]) for x in range(df.shape[1])]
+        texts, shortTexts, hideable = (np.column_stack([column[i] for column in columns]).ravel().tolist() for i in range(3))
+        return list(zip(texts, shortTexts, hideable))
+
+    def getFormattedView(self, startRow=0):
+        """
+        Get formatted (text, shortText, hideable) tuples of the rendered part of dataFrame, going left to right row by row.
+
+        :param generalgui.Spreadsheet self:
+        :param int startRow: Row in view to start from
+        :rtype: list[tuple]
+        """
+        if not self.viewSize.x or self.viewSize.y <= startRow:
+            return []
+
+        rows = slice(self.viewStart.y + startRow, self.viewStart.y + self.viewSize.y)
+        viewRows = self.getViewRows()
+        if viewRows is not None:
+            rows = viewRows[rows]
+        columns = [self.formatColumn(x) for x in range(self.viewStart.x, self.viewStart.x + self.viewSize.x)]
+
+        texts, shortTexts, hideable = (np.column_stack([column[i][rows] for column in columns]).ravel().tolist() for i in range(3))
+        return list(zip(texts, shortTexts, hideable))
@@ -0,0 +1,280 @@
+"""
+Journaler for Spreadsheet.
+
+Classes:
+    * Operation
+    * Journaler
+"""
+
+import numpy as np
+import pandas as pd
+
+from collections import deque
+
+
+class Operation:
+    """
+    One change of a DataFrame that can be applied forwards or backwards.
+    Only what's needed to apply it the other way is stored, such as positions of a reorder or the rows that a removal took out.
+
+    kind is one of:
+        * "reorder" with positions as the new order, like DataFrame.take()
+        * "insert" with positions of inserted keys in the result, data holds the inserted slice while it's not in the frame
+        * "remove" with positions of removed keys, data holds the removed slice while it's not in the frame
+        * "keys" with data as the index or header that isn't in the frame
+        * "replace" with data as the frame that isn't shown
+    """
+    __slots__ = ("kind", "axis", "positions", "data", "dtypes")
+
+    def __init__(self, kind, axis=0, positions=None, data=None, dtypes=None):
+        """
+        :param str kind: "reorder", "insert", "remove", "keys" or "replace"
+        :param int axis: 0 for rows, 1 for columns
+        :param np.ndarray or range positions:
+        :param pd.DataFrame or pd.Index data:
+        :param pd.Series dtypes: Dtypes to restore when inserted rows are removed again
+        """
+        self.kind = kind
+        self.axis = axis
+        self.positions = positions
+        self.data = data
+        self.dtypes = dtypes
+
+    def __repr__(self):
+        return f"<Operation {self.kind} axis={self.axis} nbytes={self.nbytes}>"
+
+    @property
+    def nbytes(self):
+        """Approximate number of bytes that this Operation keeps alive, values of objects aren't counted."""
+        nbytes = getattr(self.positions, "nbytes", 0)
+        if isinstance(self.data, pd.DataFrame):
+            nbytes += int(self.data.memory_usage(index=True).sum())
+        elif isinstance(self.data, pd.Index):
+            nbytes += self.data.memory_usage()
+        return nbytes
+
+    def apply(self, df, undo=False):
+        """
+        Apply to a frame, a reorder can be applied to an array of positions as well.
+
+        :param pd.DataFrame or np.ndarray df:
+        :param bool undo: Whether to apply backwards
+        :rtype: pd.DataFrame
+        """
+        if self.kind == "reorder":
+            positions = np.argsort(self.positions) if undo else self.positions
+            return df.take(positions, axis=self.axis)
+
+        elif self.kind in ("insert", "remove"):
+            if (self.kind == "insert") != undo:
+                df = self._insert(df)
+                self.data = None
+                return df
+            self.data = df.take(self.positions, axis=self.axis)
+            return self._remove(df)
+
+        elif self.kind == "keys":
+            keys = df.axes[self.axis]
+            df = df.set_axis(self.data, axis=self.axis)
+            self.data = keys
+            return df
+
+        else:
+            df, self.data = self.data, df
+            return df
+
+    def _insert(self, df):
+        """
+        Insert data at positions.
+
+        :param pd.DataFrame df:
+        """
+        length = df.shape[self.axis]
+        mask = np.zeros(length + len(self.positions), dtype=bool)
+        mask[self.positions] = True
+        order = np.empty(len(mask), dtype=np.intp)
+        order[~mask] = np.arange(length)
+        order[mask] = np.arange(length, len(mask))
+        return pd.concat([df, self.data], axis=self.axis).take(order, axis=self.axis)
+
+    def _remove(self, df):
+        """
+        Remove keys at positions, restoring dtypes if rows that changed them are removed.
+
+        :param pd.DataFrame df:
+        """
+        mask = np.ones(df.shape[self.axis], dtype=bool)
+        mask[self.positions] = False
+        df = df.iloc[mask] if self.axis == 0 else df.iloc[:, mask]
+        if self.dtypes is not None and df.columns.equals(self.dtypes.index):
+            try:
+                df = df.astype(self.dtypes.to_dict())
+            except (TypeError, ValueError):
+                pass
+        return df
+
+
+class Journaler:
+    """
+    Journaler feature for Spreadsheet.
+    Records every change of dataFrame as Operations so that it can be undone and redone, each mutating method call becomes one entry.
+
+    Entries only store inverse information, so sorting stores a permutation, dropping stores the dropped slice and changing header stores the previous header.
+    Entries are evicted oldest first once they keep more than journalBytes alive.
+    Consecutive appends are merged into one entry, and changes that come from a SpreadsheetModel or a DataSource clear the journal.
+    """
+    def __init__(self, journalBytes=100 * 2 ** 20):
+        """
+        :param generalgui.Spreadsheet self:
+        :param int journalBytes: Maximum number of bytes that undo and redo entries may keep alive
+        """
+        self.journalBytes = journalBytes
+        self._undoEntries = deque()
+        self._redoEntries = []
+        self._journalGroup = None
+
+    def undo(self):
+        """
+        Undo the latest change of dataFrame.
+
+        :param generalgui.Spreadsheet self:
+        :return: Whether there was anything to undo
+        """
+        if self.dataSource is not None or not self._undoEntries:
+            return False
+        entry = self._undoEntries.pop()
+        self._applyEntry(entry, undo=True)
+        self._redoEntries.append(entry)
+        return True
+
+    def redo(self):
+        """
+        Redo the latest undone change of dataFrame.
+
+        :param generalgui.Spreadsheet self:
+        :return: Whether there was anything to redo
+        """
+        if self.dataSource is not None or not self._redoEntries:
+            return False
+        entry = self._redoEntries.pop()
+        self._applyEntry(entry, undo=False)
+        self._undoEntries.append(entry)
+        self._trimJournal()
+        return True
+
+    def canUndo(self):
+        """
+        :param generalgui.Spreadsheet self:
+        """
+        return bool(self._undoEntries)
+
+    def canRedo(self):
+        """
+        :param generalgui.Spreadsheet self:
+        """
+        return bool(self._redoEntries)
+
+    def clearJournal(self):
+        """
+        Forget every undo and redo entry.
+
+        :param generalgui.Spreadsheet self:
+        """
+        self._undoEntries.clear()
+        self._redoEntries = []
+        if self._journalGroup is not None:
+            self._journalGroup = []
+
+    def getJournalBytes(self):
+        """
+        Get approximate number of bytes that undo and redo entries keep alive.
+
+        :param generalgui.Spreadsheet self:
+        """
+        return sum(operation.nbytes for entries in (self._undoEntries, self._redoEntries) for entry in entries for operation in entry)
+
+    def _journal(self, operation):
+        """
+        Record an Operation that has just been applied to dataFrame.
+        Operations of one mutating method call are grouped into one entry.
+
+        :param generalgui.Spreadsheet self:
+        :param Operation operation:
+        """
+        if self._journalGroup is not None:
+            self._journalGroup.append(operation)
+        else:
+            self._pushEntry([operation])
+
+    def _journalRemove(self, axis, key):
+        """
+        Record every row or column with key as removed, call before removing them.
+
+        :param generalgui.Spreadsheet self:
+        :param int axis: 0 for rows, 1 for columns
+        :param key: Index or header key
+        """
+        positions = self.dataFrame.axes[axis].get_indexer_for([key])
+        self._journal(Operation("remove", axis, positions, self.dataFrame.take(positions, axis=axis)))
+
+    def _journalAppend(self, start, count):
+        """
+        Record appended rows, merged with previous entry if that was an append right before them.
+
+        :param generalgui.Spreadsheet self:
+        :param int start: Position of first appended row
+        :param int count: Number of appended rows
+        """
+        last = self._undoEntries[-1] if self._undoEntries and self._journalGroup is None and not self._redoEntries else None
+        if last is not None and len(last) == 1 and last[0].kind == "insert" and isinstance(last[0].positions, range) and last[0].positions.stop == start:
+            last[0].positions = range(last[0].positions.start, start + count)
+        else:
+            self._journal(Operation("insert", 0, range(start, start + count)))
+
+    def _pushEntry(self, entry):
+        """
+        Add an entry of Operations, forgetting redo entries.
+
+        :param generalgui.Spreadsheet self:
+        :param list[Operation] entry:
+        """
+        self._undoEntries.append(entry)
+        self._redoEntries = []
+        self._trimJournal()
+
+    def _trimJournal(self):
+        """
+        Evict oldest entries until journalBytes is respected.
+
+        :param generalgui.Spreadsheet self:
+        """
+        nbytes = self.getJournalBytes()
+        while nbytes > self.journalBytes and (self._undoEntries or self._redoEntries):
+            entry = self._undoEntries.popleft() if self._undoEntries else self._redoEntries.pop(0)
+            nbytes -= sum(operation.nbytes for operation in entry)
+
+    def _applyEntry(self, entry, undo):
+        """
+        Apply an entry's Operations to dataFrame and cells, row reorders of a linked view are applied to modelRows instead.
+        Existing cells are moved if the entry only reorders or removes keys.
+
+        :param generalgui.Spreadsheet self:
+        :param list[Operation] entry:
+        :param bool undo: Whether to apply backwards
+        """
+        df = oldFrame = self.dataFrame
+        rows = self.modelRows
+        moved = True
+        for operation in reversed(entry) if undo else entry:
+            moved = moved and (operation.kind == "reorder" or (operation.kind == "insert") == undo and operation.kind in ("insert", "remove"))
+            if self.model is not None and operation.kind == "reorder" and operation.axis == 0:
+                rows = operation.apply(np.arange(df.shape[0]) if rows is None else rows, undo=undo)
+            else:
+                df = operation.apply(df, undo=undo)
+
+        self.dataFrame = df
+        self.modelRows = rows
+        self.dataVersion += 1
+        if moved and self._rendered is not None and self._rendered[0] is oldFrame:
+            self._rendered = (df, self.dataVersion) + self._rendered[2:]
+        self._reloadDataFrame()
@@ -0,0 +1,191 @@
+"""
+Linker for Spreadsheet.
+"""
+
+import numpy as np
+
+
+class Linker:
+    """
+    Linker feature for Spreadsheet.
+    Shows a SpreadsheetModel that other Spreadsheets can show at the same time, dataFrame is then this Spreadsheet's view of model.dataFrame.
+    Sorting and filtering only change this view, while appending and dropping rows or columns change model and every view.
+
+    dataFrame keeps model's row order and shares it's values, even with a subset of columns, so views don't copy model.
+    Sorting rows only stores modelRows, the position in dataFrame of each shown row, and cells read values through it.
+
+    Each ModelChange is applied to existing cells where possible, appended rows only create new cells, dropped keys only remove theirs
+    and a set value only changes it's cell, statistics and cached texts.
+    Loading other data or moving header or index into the values unlinks Spreadsheet from model, keeping what it shows.
+    Changes from model clear the journal, so undo only covers this view's sorting between them.
+    """
+    def __init__(self):
+        """
+        :param generalgui.Spreadsheet self:
+        """
+        self.model = None
+        self.modelColumns = None
+        self.modelRows = None
+
+    def setModel(self, model, columns=None):
+        """
+        Show a SpreadsheetModel, or unlink from current one and keep showing it's dataFrame.
+
+        :param generalgui.Spreadsheet self:
+        :param generalgui.SpreadsheetModel model: Model to show, None to unlink
+        :param list columns: Header keys of columns to show, None shows every column
+        """
+        if self.model is not None:
+            self.model.removeView(self)
+            if model is None:
+                self._takeModelRows()
+        self.model = model
+        self.modelColumns = None if columns is None else list(columns)
+
+        if model is not None:
+            self.cancelLoad()
+            self.clearJournal()
+            self.dataSource = None
+            model.addView(self)
+            self._loadModelFrame()
+
+    def setModelColumns(self, columns=None):
+        """
+        Change which of model's columns are shown.
+
+        :param generalgui.Spreadsheet self:
+        :param list columns: Header keys of columns to show, None shows every column
+        """
+        self.setModel(self.model, columns)
+
+    def _getModelFrame(self):
+        """
+        Get model's dataFrame with modelColumns in model's row order.
+        Both a shallow copy and a subset of columns share values with it, as pandas only copies values that are written to.
+
+        :param generalgui.Spreadsheet self:
+        """
+        df = self.model.dataFrame
+        if self.modelColumns is None:
+            return df.copy(deep=False)
+        return df[[key for key in self.modelColumns if key in df.columns]]
+
+    def _setModelFrame(self, frame):
+        """
+        Replace dataFrame with another frame of model that represents the same cells, so that they can still be moved instead of filled.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.DataFrame frame:
+        """
+        if self._rendered is not None and self._rendered[0] is self.dataFrame:
+            self._rendered = (frame, ) + self._rendered[1:]
+        self.dataFrame = frame
+
+    def _takeModelRows(self):
+        """
+        Put dataFrame's rows in shown order and forget modelRows, used when unlinking as only linked views read rows through positions.
+
+        :param generalgui.Spreadsheet self:
+        """
+        if self.modelRows is not None:
+            rows, self.modelRows = self.modelRows, None
+            self._setModelFrame(self.dataFrame.take(rows))
+
+    def _loadModelFrame(self):
+        """
+        Fill every cell from model.
+
+        :param generalgui.Spreadsheet self:
+        """
+        self.dataFrame = self._getModelFrame()
+        self.modelRows = None
+        self.dataVersion += 1
+        self._fillDataFrame()
+
+    def _modelChanged(self, change):
+        """
+        Apply a change of model to dataFrame and cells.
+
+        :param generalgui.Spreadsheet self:
+        :param generalgui.ModelChange change:
+        """
+        df = self.dataFrame
+
+        if change.kind == "append":
+            frame = self._getModelFrame()
+            if not df.empty and not frame.columns.equals(df.columns):
+                self._loadModelFrame()
+            else:
+                self._appendDataFrame(change.rows.reindex(columns=frame.columns), frame=frame)
+
+        elif change.kind in ("dropRows", "dropColumns"):
+            row = change.kind == "dropRows"
+            keys = change.rows if row else change.columns
+            keys = [key for key in keys if key in (df.index if row else df.columns)]
+            if keys:
+                for key in keys:
+                    self._removeStatistics(key, row=row)
+                if row and self.modelRows is not None:
+                    self.modelRows = self._getKeptRows(~df.index.isin(keys))
+                self._setModelFrame(self._getModelFrame())
+                if not self._mutationDepth:
+                    self._reloadDataFrame()
+
+        elif change.kind == "setValue":
+            rowKey, columnKey = change.rows[0], change.columns[0]
+            if rowKey in df.index and columnKey in df.columns:
+                self._modelValueChanged(rowKey, columnKey, change.value)
+
+        else:
+            self._loadModelFrame()
+
+        self.clearJournal()
+
+    def _getKeptRows(self, kept):
+        """
+        Get modelRows without removed rows, positions are shifted to where kept rows are once removed rows are gone.
+
+        :param generalgui.Spreadsheet self:
+        :param np.ndarray kept: Bool array of which rows in dataFrame are kept
+        :rtype: np.ndarray
+        """
+        newPositions = np.cumsum(kept) - 1
+        rows = self.modelRows[kept[self.modelRows]]
+        return newPositions[rows]
+
+    def _modelValueChanged(self, rowKey, columnKey, value):
+        """
+        Apply a value set in model to one cell, it's row and column statistics and the cached texts of it's column.
+        Every cell is filled again if keys aren't unique, if the column's dtype changed or if filter or canvasCells are used.
+
+        :param generalgui.Spreadsheet self:
+        :param rowKey: Index key
+        :param columnKey: Header key
+        :param value: New value
+        """
+        df = self.dataFrame
+        frame = self._getModelFrame()
+        if not df.index.is_unique or not df.columns.is_unique or frame[columnKey].dtype != df[columnKey].dtype:
+            self.dataFrame = frame
+            self.dataVersion += 1
+            self._fillDataFrame()
+            return
+
+        self._setStatisticsValue(rowKey, columnKey, df.at[rowKey, columnKey], value)
+        self._setModelFrame(frame)
+        self._setFormattedValue(rowKey, columnKey)
+        self._dropSearchColumn(columnKey)
+        self._dropSortCache(rowKey, columnKey)
+
+        if self.canvasCells or self.filterText or self._rendered is None or self._rendered[0] is not frame or self._rendered[1] != self.dataVersion:
+            self._fillDataFrame()
+            return
+
+        # Rendered keys are unique as dataFrame's are, virtual cells only have the rows and columns in view
+        renderedIndex, renderedColumns = self._rendered[2:]
+        if rowKey in renderedIndex and columnKey in renderedColumns:
+            position = frame.index.get_loc(rowKey)
+            texts, shortTexts, hideable = self.formatColumn(frame.columns.get_loc(columnKey))
+            label = self.mainCells[renderedIndex.get_loc(rowKey) + 1][renderedColumns.get_loc(columnKey) + 1]
+            label.setValue(value, formatted=(texts[position], shortTexts[position], bool(hideable[position])))
+            self.syncSizes()
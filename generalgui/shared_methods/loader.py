@@ -0,0 +1,181 @@
+"""
+Loader for Spreadsheet.
+"""
+
+import pandas as pd
+
+import os
+import queue
+import threading
+
+
+def readChunks(path, sep, chunkSize, chunks, cancel):
+    """
+    Worker for Loader, runs in it's own thread.
+    Puts (chunk, progress) tuples in chunks queue, then (None, 1) when done or (exception, None) if reading failed.
+    Files written with both header and index (Empty top left cell) use first row as header and first column as index.
+
+    :param str path: Path to a tsv or csv file
+    :param str sep: Separator
+    :param int chunkSize: Number of rows in each chunk
+    :param queue.Queue chunks: Queue to put chunks in
+    :param threading.Event cancel: Stops reading when set
+    """
+    try:
+        size = os.path.getsize(path) or 1
+        header = indexCol = None
+        with open(path, "rb") as handle:
+            first = pd.read_csv(handle, sep=sep, header=None, nrows=1)
+            if not first.empty and pd.isna(first.iat[0, 0]):
+                header = indexCol = 0
+
+        with open(path, "rb") as handle:
+            for chunk in pd.read_csv(handle, sep=sep, header=header, index_col=indexCol, chunksize=chunkSize):
+                if cancel.is_set():
+                    return
+                chunks.put((chunk, min(1, handle.tell() / size)))
+        chunks.put((None, 1))
+
+    except Exception as e:
+        chunks.put((e, None))
+
+
+class Loader:
+    """
+    Loader feature for Spreadsheet.
+    Parses tsv and csv files in chunks on a worker thread so that the window doesn't hang.
+    First chunk is shown immediately and the rest are appended as they arrive, progress is shown in statusLabel.
+    Loading another file cancels current load.
+
+    Chunks that arrive together are appended together, and appends wait until they're a quarter of current rows so large files don't copy dataFrame for every chunk.
+    """
+    def __init__(self, chunkSize=10000, loadPollMs=50):
+        """
+        :param generalgui.Spreadsheet self:
+        :param int chunkSize: Number of rows parsed in each chunk
+        :param int loadPollMs: Milliseconds between each check for parsed chunks
+        """
+        self.loadChunkSize = chunkSize
+        self.loadPollMs = loadPollMs
+        self.statusLabel = None
+        self._loadQueue = None
+        self._loadCancel = None
+        self._loadPending = []
+        self._loadFirst = False
+
+    def loadFile(self, path, sep=None):
+        """
+        Start loading a tsv or csv file in chunks on a worker thread, cancels any current load.
+
+        :param generalgui.Spreadsheet self:
+        :param str path: Path to file
+        :param str sep: Separator, defaults to comma for csv files and tab otherwise
+        """
+        self.cancelLoad()
+        if sep is None:
+            sep = "," if ".csv" in os.path.basename(path).lower() else "\t"
+
+        chunks = queue.Queue()
+        self._loadQueue = chunks
+        self._loadCancel = threading.Event()
+        self._loadPending = []
+        self._loadFirst = True
+        threading.Thread(target=readChunks, args=(path, sep, self.loadChunkSize, chunks, self._loadCancel), daemon=True).start()
+
+        self.setStatus(f"Loading {os.path.basename(path)}")
+        self.app.widget.after(self.loadPollMs, self._pollLoad, chunks)
+
+    def isLoading(self):
+        """
+        Get whether a file is currently being loaded.
+
+        :param generalgui.Spreadsheet self:
+        """
+        return self._loadQueue is not None
+
+    def cancelLoad(self):
+        """
+        Stop loading current file, chunks that are already shown are kept.
+
+        :param generalgui.Spreadsheet self:
+        """
+        if self._loadCancel:
+            self._loadCancel.set()
+        self._loadQueue = None
+        self._loadCancel = None
+        self._loadPending = []
+        self.setStatus(None)
+
+    def setStatus(self, text=None):
+        """
+        Show a text at the bottom of Spreadsheet.
+
+        :param generalgui.Spreadsheet self:
+        :param str text: Text to show, None hides it
+        """
+        if text is None:
+            if self.statusLabel:
+                self.statusLabel.hide()
+            return
+
+        if self.statusLabel is None:
+            before = self.getBaseWidget().pack_slaves()
+            self.statusLabel = self.app.Label(self, text, pack=False, side="bottom", fill="x", anchor="w", **({"before": before[0]} if before else {}))
+        else:
+            self.statusLabel.setValue(text)
+        if not self.statusLabel.isPacked():
+            self.statusLabel.pack()
+
+    def _pollLoad(self, chunks):
+        """
+        Take parsed chunks from queue and show them, queues itself again until file is loaded.
+
+        :param generalgui.Spreadsheet self:
+        :param queue.Queue chunks: Queue of load that queued this poll, ignored if it's not current
+        """
+        if chunks is not self._loadQueue:
+            return
+        if self.removed:
+            self.cancelLoad()
+            return
+
+        done = False
+        progress = None
+        while True:
+            try:
+                chunk, chunkProgress = chunks.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(chunk, Exception):
+                self.cancelLoad()
+                if isinstance(chunk, pd.errors.EmptyDataError):
+                    self.loadDataFrame(pd.DataFrame())
+                else:
+                    self.setStatus(f"Loading failed: {chunk}")
+                return
+            elif chunk is None:
+                done = True
+                break
+            else:
+                self._loadPending.append(chunk)
+                progress = chunkProgress
+
+        pendingRows = sum(len(chunk) for chunk in self._loadPending)
+        if self._loadPending and (done or self._loadFirst or pendingRows * 4 >= len(self.dataFrame)):
+            df = pd.concat(self._loadPending) if len(self._loadPending) > 1 else self._loadPending[0]
+            self._loadPending = []
+            if self._loadFirst:
+                self._loadFirst = False
+                self._loadDataFrame(df)
+            else:
+                self._appendDataFrame(df)
+
+        if done:
+            self._loadQueue = None
+            self._loadCancel = None
+            self.setStatus(None)
+        else:
+            if progress is not None:
+                self.setStatus(f"Loading... {len(self.dataFrame) + pendingRows} rows ({progress:.0%})")
+            self.app.widget.after(self.loadPollMs, self._pollLoad, chunks)
@@ -0,0 +1,90 @@
+"""
+Measurer for App.
+"""
+
+from tkinter import font as tkfont
+
+
+class Measurer:
+    """
+    Measurer feature for App.
+    Measures text in pixels with tkinter's font metrics instead of asking widgets for their size.
+    Results are memoized per font and text so sizes can be computed without forcing geometry updates.
+
+    Call clearMeasurements() if a named font is reconfigured.
+    """
+    maxMeasurements = 100000
+
+    def __init__(self):
+        """
+        :param generalgui.app.App self:
+        """
+        self._fonts = {}
+        self._textWidths = {}
+        self._lineHeights = {}
+
+    def getFont(self, font="TkDefaultFont"):
+        """
+        Get a tkinter Font from a font name or description, memoized.
+
+        :param generalgui.app.App self:
+        :param str or tuple font: Named font like "TkDefaultFont" or a description like ("Consolas", 10)
+        :rtype: tkfont.Font
+        """
+        if font not in self._fonts:
+            if isinstance(font, str) and font in tkfont.names(self.widget):
+                self._fonts[font] = tkfont.Font(root=self.widget, name=font, exists=True)
+            else:
+                self._fonts[font] = tkfont.Font(root=self.widget, font=font)
+        return self._fonts[font]
+
+    def measureText(self, text, font="TkDefaultFont"):
+        """
+        Get pixel width of a text's widest line, memoized.
+
+        :param generalgui.app.App self:
+        :param str text:
+        :param str or tuple font: Named font like "TkDefaultFont" or a description like ("Consolas", 10)
+        :rtype: int
+        """
+        key = (font, text)
+        width = self._textWidths.get(key)
+        if width is None:
+            if len(self._textWidths) >= self.maxMeasurements:
+                self._textWidths = {}
+            tkFont = self.getFont(font)
+            width = self._textWidths[key] = max(tkFont.measure(line) for line in text.split("\n"))
+        return width
+
+    def getLineHeight(self, font="TkDefaultFont"):
+        """
+        Get pixel height of one line of text, memoized.
+
+        :param generalgui.app.App self:
+        :param str or tuple font: Named font like "TkDefaultFont" or a description like ("Consolas", 10)
+        :rtype: int
+        """
+        if font not in self._lineHeights:
+            self._lineHeights[font] = self.getFont(font).metrics("linespace")
+        return self._lineHeights[font]
+
+    def measureTextSize(self, text, font="TkDefaultFont"):
+        """
+        Get pixel width and height of a text with any number of lines.
+
+        :param generalgui.app.App self:
+        :param str text:
+        :param str or tuple font: Named font like "TkDefaultFont" or a description like ("Consolas", 10)
+        :rtype: tuple[int]
+        """
+        return self.measureText(text, font), self.getLineHeight(font) * (text.count("\n") + 1)
+
+    def clearMeasurements(self):
+        """
+        Clear memoized fonts and measurements.
+
+        :param generalgui.app.App self:
+        """
+        self._fonts = {}
+        self._textWidths = {}
+        self._lineHeights = {}
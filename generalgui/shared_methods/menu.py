@@ -1,11 +1,18 @@
 
 from generallibrary.types import typeChecker
 
+from types import MappingProxyType
+
+
+noMenuContent = MappingProxyType({})  # Shared by parts without a menu, replaced by a dict on first menu
+
 
 class Menu_Element_Page_App:
     """Keep all menu functionality in this module"""
+    __slots__ = ()
+
     def __init__(self):
-        self.menuContent = {}
+        self.menuContent = noMenuContent
 
     def menu(self, name, add=False, **buttons):
         """
@@ -18,6 +25,8 @@ class Menu_Element_Page_App:
         :param add: Whether to add to menu or not
         :param buttons: Key is string, value should be a function
         """
+        if self.menuContent is noMenuContent:
+            self.menuContent = {}
         if not add or name not in self.menuContent:
             self.menuContent[name] = buttons
         elif add:
@@ -38,15 +47,14 @@ class Menu_Element_Page_App:
         :param generalgui.element.Element or generalgui.page.Page or generalgui.app.App self: Element, Page or App
         """
         if self.app.menuPage:
-            self.app.menuPage.remove()
-            self.app.menuPage = None
-            self.app.menuTargetElement = None
+            self.app._clearMenu()
 
 
 class Menu_App:
     """
     Menu feature for App.
     Shows a menu when right clicking a page that has a menu enabled.
+    Hidden menu's page is kept and it's labels and buttons are recycled into the element pool, so the next menu borrows them.
 
      * Menu should probably inherit page so it becomes reuseable
     """
@@ -55,6 +63,7 @@ class Menu_App:
         :param generalgui.app.App self:
         """
         self.menuPage = None
+        self._idleMenuPage = None
         self.openMenuOnRelease = False
         self.menuTargetElement = None
 
@@ -91,7 +100,7 @@ class Menu_App:
         :param generalgui.app.App self:
         :param text:
         """
-        self.Label(self.menuPage, text, fill="x")
+        self.borrowElement(self.Label, self.menuPage, value=text, fill="x")
 
     def _addButton(self, text, func):
         """
@@ -99,9 +108,21 @@ class Menu_App:
         :param text:
         :param func:
         """
-        button = self.Button(self.menuPage, text.replace("_", " "), func, fill="x")
+        button = self.borrowElement(self.Button, self.menuPage, value=text.replace("_", " "), onClick=func, fill="x")
         button.createBind("<ButtonRelease-1>", self.hideMenu, name="HideMenu")
 
+    def _clearMenu(self):
+        """
+        Hide menuPage and recycle it's children, it's kept to be shown again by next menu.
+
+        :param generalgui.app.App self:
+        """
+        self.menuPage.getTopWidget().place_forget()
+        self.recycleElements(self.menuPage.getChildren())
+        self.menuPage.getTopElement().pooled = True  # So that it isn't one of App's children while hidden
+        self.menuPage = None
+        self.menuTargetElement = None
+
     def createMenu(self, event_or_part):
         """
         Create a menu for a part, used by part.showMenu()
@@ -115,9 +136,12 @@ class Menu_App:
             self.menuTargetElement = event_or_part
 
         if self.menuPage:
-            self.menuPage.remove()
+            self._clearMenu()
 
-        self.menuPage = self.Page(self, relief="solid", borderwidth=1, padx=5, pady=5)
+        if self._idleMenuPage is None or self._idleMenuPage.removed:
+            self._idleMenuPage = self.Page(self, relief="solid", borderwidth=1, padx=5, pady=5)
+        self.menuPage = self._idleMenuPage
+        self.menuPage.getTopElement().pooled = False
         for part in self.menuTargetElement.getParents(includeSelf=True, includeApp=True, includeParts=True):
             if part.menuContent:
                 self._addLine()
@@ -42,14 +42,13 @@ class Page_App:
     @ignore
     def removeChildren(self, recurrent=False, ignore=None):
         """
-        Calls the 'remove' method on all children retrieved from the 'getChildren' method.
+        Removes all children retrieved from the 'getChildren' method together with App.removeParts().
 
         :param generalgui.page.Page or generalgui.app.App self: Page or App
         :param any ignore: A single child or multiple children to ignore. Is converted to list through decorator.
         :param recurrent: Whether to include childrens' children or not
         """
-        for child in self.getChildren(ignore=ignore, recurrent=recurrent):
-            child.remove()
+        self.app.removeParts(self.getChildren(ignore=ignore, recurrent=recurrent))
 
     def packPart(self, part):
         """
@@ -0,0 +1,158 @@
+"""
+Pooler for App.
+"""
+
+from collections import OrderedDict
+
+
+class Pooler:
+    """
+    Pooler feature for App.
+    Keeps detached elements so that they can be borrowed again instead of constructing new tkinter widgets.
+
+    Elements are pooled by class, parentPage and the parameters they were created with, except the ones in their class' reuseParameters such as value and position.
+    Tkinter can't move a widget to another master, so an element is only borrowed again by it's own parentPage.
+    Least recently pooled elements are removed once there are more than elementPoolSize, and removing a Page takes it's pooled elements out of the pool.
+    """
+    elementPoolSize = 10000
+
+    def __init__(self):
+        """
+        :param generalgui.app.App self:
+        """
+        self._elementPool = {}
+        self._pooledElements = OrderedDict()
+
+    @staticmethod
+    def getElementPoolKey(eleCls, parentPage, parameters):
+        """
+        Get the key that an element is pooled with, or None if it can't be pooled, such as when a parameter is a function.
+
+        :param class eleCls: Class of element
+        :param generalgui.Page parentPage: Page of element
+        :param dict parameters: Parameters that element is created with
+        :rtype: tuple or None
+        """
+        items = tuple(sorted(((key, value) for key, value in parameters.items() if key not in eleCls.reuseParameters), key=lambda item: item[0]))
+        if any(callable(value) for key, value in items):
+            return None
+        key = (eleCls, parentPage, parameters.get("onClick") is not None, items)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def borrowElement(self, eleCls, parentPage, **parameters):
+        """
+        Get a pooled element that was created with the same parameters and prepare it with the new ones, or create a new element.
+
+        :param generalgui.app.App self:
+        :param class eleCls: Class of element
+        :param generalgui.Page parentPage: Page of element
+        :param parameters: Parameters for eleCls
+        :rtype: generalgui.element.Element
+        """
+        key = self.getElementPoolKey(eleCls, parentPage, parameters)
+        if key is not None and (bucket := self._elementPool.get(key)):
+            while bucket:
+                element = bucket.popitem()[0]
+                del self._pooledElements[element]
+                if not element.removed and not parentPage.removed:
+                    element._reuse(**parameters)
+                    return element
+            del self._elementPool[key]
+
+        element = eleCls(parentPage, **parameters)
+        element.poolKey = key
+        return element
+
+    def recycleElement(self, element):
+        """
+        Detach an element and pool it so that it can be borrowed again, elements that can't be pooled are removed.
+
+        :param generalgui.app.App self:
+        :param generalgui.element.Element or generalgui.Page element: Element or Page to recycle
+        :return: Whether element was pooled
+        """
+        return self.recycleElements((element, ))[0]
+
+    def recycleElements(self, elements):
+        """
+        Recycle several elements, the ones that can't be pooled and the evicted ones are removed together at the end.
+
+        :param generalgui.app.App self:
+        :param list[generalgui.element.Element or generalgui.Page] elements: Elements or Pages to recycle
+        :return: Whether each element was pooled
+        :rtype: list[bool]
+        """
+        pooled = []
+        removed = []
+        for element in elements:
+            key = getattr(element, "poolKey", None)
+            if element.removed or element.pooled:
+                pooled.append(element.pooled)
+                continue
+            if key is None or element.parentPage.removed or self.elementPoolSize <= 0:
+                removed.append(element)
+                pooled.append(False)
+                continue
+
+            if element.hasGridParameters():
+                element.widget.grid_forget()
+                if grid := element._getParentGrid():
+                    grid._unindexGridElement(element)
+            else:
+                element.widget.pack_forget()
+            element.pooled = True
+
+            self._elementPool.setdefault(key, {})[element] = None
+            self._pooledElements[element] = key
+            pooled.append(True)
+
+        while len(self._pooledElements) > self.elementPoolSize:
+            removed.append(self._evictElement())
+        self.removeParts(removed)
+        return pooled
+
+    def getPooledCount(self):
+        """
+        Get number of elements in pool.
+
+        :param generalgui.app.App self:
+        """
+        return len(self._pooledElements)
+
+    def clearElementPool(self):
+        """
+        Remove every pooled element.
+
+        :param generalgui.app.App self:
+        """
+        self.removeParts([self._evictElement() for _ in range(len(self._pooledElements))])
+
+    def _evictElement(self):
+        """
+        Take out least recently pooled element, it's then to be removed with removeParts().
+
+        :param generalgui.app.App self:
+        :rtype: generalgui.element.Element
+        """
+        element = next(iter(self._pooledElements))
+        self._unpoolElement(element)
+        return element
+
+    def _unpoolElement(self, element):
+        """
+        Take out an element from pool if it's in it, used by removeParts() so that removed elements don't take up pool slots.
+
+        :param generalgui.app.App self:
+        :param generalgui.element.Element element:
+        """
+        key = self._pooledElements.pop(element, None)
+        if key is None:
+            return
+        bucket = self._elementPool[key]
+        del bucket[element]
+        if not bucket:
+            del self._elementPool[key]
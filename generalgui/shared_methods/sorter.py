@@ -0,0 +1,167 @@
+"""
+Sorter for Spreadsheet.
+"""
+
+from generalgui.shared_methods.journaler import Operation
+
+import numpy as np
+import pandas as pd
+
+
+class Sorter:
+    """
+    Sorter feature for Spreadsheet.
+    Caches the sorted order of every sort key so that sorting by it again, or toggling ascending, only reorders dataFrame instead of sorting it.
+
+    A linked view's rows are sorted by storing positions as modelRows instead of reordering dataFrame, see Linker.
+    Orders are stored as sorted keys and cleared when dataVersion changes.
+    Removed rows are skipped and appended rows make it sort again, keys have to be unique to use the cache.
+    Tied values are ordered by their key's position when the cache was cleared, so an order doesn't depend on previous sorts.
+    Descending is the reversed ascending order unless sorted values have NaN or ties, as NaN is always put last and ties keep their base order.
+    """
+    def __init__(self):
+        """
+        :param generalgui.Spreadsheet self:
+        """
+        self._sortCache = {}
+        self._sortCacheVersion = None
+        self._sortBase = {}
+
+    def sortDataFrame(self, axis=0, by=None, ascending=True):
+        """
+        Reorder rows or columns of dataFrame by values or by keys, through a cached order if possible.
+
+        :param generalgui.Spreadsheet self:
+        :param int axis: 0 to reorder rows, 1 to reorder columns
+        :param list by: Columns (axis=0) or rows (axis=1) whose values to sort by, in priority order. None sorts by index or header
+        :param bool ascending:
+        :raises TypeError: If values can't be compared
+        """
+        if self._sortCacheVersion != self.dataVersion:
+            self._sortCache = {}
+            self._sortCacheVersion = self.dataVersion
+            self._sortBase = {}
+
+        df = self.dataFrame
+        keys = df.index if axis == 0 else df.columns
+        sortKey = (axis, None if by is None else tuple(by))
+
+        positions = self._getCachedSortPositions(keys, sortKey, ascending)
+        if positions is None:
+            positions, reversible = self._getSortPositions(axis, by, ascending)
+            if keys.is_unique:
+                self._sortCache[sortKey + (ascending, )] = (keys[positions], reversible)
+
+        if axis == 0 and self.model is not None:
+            self._sortModelRows(positions)
+            return
+
+        sortedFrame = df.take(positions, axis=axis)
+        self._journal(Operation("reorder", axis, positions))
+
+        # Cells represent the same frame, only reordered, so existing cells can be moved
+        if self._rendered is not None and self._rendered[0] is df:
+            self._rendered = (sortedFrame, ) + self._rendered[1:]
+        self.dataFrame = sortedFrame
+
+    def _sortModelRows(self, positions):
+        """
+        Show rows of a linked view in a sorted order by storing it as modelRows, dataFrame keeps sharing model's values.
+        The journal gets the reorder of shown rows.
+
+        :param generalgui.Spreadsheet self:
+        :param np.ndarray positions: Sorted positions in dataFrame
+        """
+        shown = np.empty(len(positions), dtype=np.intp)
+        shown[np.arange(len(positions)) if self.modelRows is None else self.modelRows] = np.arange(len(positions))
+        self._journal(Operation("reorder", 0, shown[positions]))
+        self.modelRows = positions
+
+    def _getCachedSortPositions(self, keys, sortKey, ascending):
+        """
+        Get positions of keys in a cached order, or None if there's no usable cached order.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.Index keys: Current keys of axis
+        :param tuple sortKey: (axis, by)
+        :param bool ascending:
+        """
+        if not keys.is_unique:
+            return None
+
+        cached = self._sortCache.get(sortKey + (ascending, ))
+        if cached is None:
+            reverse = self._sortCache.get(sortKey + (not ascending, ))
+            if reverse is None or not reverse[1]:
+                return None
+            cached = (reverse[0][::-1], True)
+
+        positions = keys.get_indexer(cached[0])
+        positions = positions[positions >= 0]
+        if len(positions) != len(keys):
+            return None
+        return positions
+
+    def _getBasePositions(self, axis, keys):
+        """
+        Get each key's position in the base order of axis that ties are ordered by.
+        Keys become the base order if there is none or it's missing some of them, cached orders of axis are cleared then.
+
+        :param generalgui.Spreadsheet self:
+        :param int axis:
+        :param pd.Index keys: Current keys of axis
+        :rtype: np.ndarray
+        """
+        if not keys.is_unique:
+            return np.arange(len(keys))
+
+        base = self._sortBase.get(axis)
+        if base is not None:
+            positions = base.get_indexer(keys)
+            if not (positions == -1).any():
+                return positions
+
+        self._sortBase[axis] = keys
+        self._sortCache = {key: value for key, value in self._sortCache.items() if key[0] != axis}
+        return np.arange(len(keys))
+
+    def _getSortPositions(self, axis, by, ascending):
+        """
+        Sort keys or values of dataFrame and get the sorted positions, ties are put in base order and NaN is put last.
+
+        :param generalgui.Spreadsheet self:
+        :param int axis:
+        :param list by:
+        :param bool ascending:
+        :return: Sorted positions and whether they can be reversed to sort the other way
+        :raises TypeError: If values can't be compared
+        """
+        df = self.dataFrame
+        keys = df.index if axis == 0 else df.columns
+        if by is None:
+            values = pd.DataFrame({0: keys})
+        elif axis == 0:
+            values = df[list(by)].reset_index(drop=True)
+        else:
+            values = df.loc[list(by)].T.reset_index(drop=True)
+        values.columns = range(values.shape[1])
+
+        try:
+            reversible = not values.duplicated().any() and not values.isna().to_numpy().any()
+        except TypeError:  # Unhashable values such as lists
+            reversible = False
+
+        count = values.shape[1]
+        values[count] = self._getBasePositions(axis, keys)
+        positions = values.sort_values(by=list(range(count + 1)), ascending=[ascending] * count + [True]).index.to_numpy()
+        return positions, reversible
+
+    def _dropSortCache(self, rowKey, columnKey):
+        """
+        Forget cached orders that were sorted by a value that has changed without changing dataVersion.
+
+        :param generalgui.Spreadsheet self:
+        :param rowKey: Index key of changed value
+        :param columnKey: Header key of changed value
+        """
+        self._sortCache = {key: value for key, value in self._sortCache.items() if key[1] is None or (columnKey if key[0] == 0 else rowKey) not in key[1]}
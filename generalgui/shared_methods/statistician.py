@@ -0,0 +1,277 @@
+"""
+Statistician for Spreadsheet.
+
+Classes:
+    * Statistics
+    * Statistician
+"""
+
+import numpy as np
+import pandas as pd
+
+from math import log
+
+
+class Statistics:
+    """
+    Count, mean, min, max, null count and distinct estimate of some values, can be updated when values are added or removed.
+    Distinct is estimated with a HyperLogLog sketch so that it can be merged.
+
+    Removing a value that's min or max makes it dirty as they can't be updated without the remaining values.
+    Distinct can't be updated for removed values either, so it may overestimate after removals but never exceeds count.
+    """
+    hllPrecision = 10
+
+    def __init__(self):
+        self.count = 0
+        self.nulls = 0
+        self.numeric = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.registers = np.zeros(2 ** self.hllPrecision, dtype=np.uint8)
+        self.dirty = False
+
+    def __repr__(self):
+        return f"<Statistics count={self.count} mean={self.mean} min={self.minimum} max={self.maximum} nulls={self.nulls} distinct={self.distinct}>"
+
+    @classmethod
+    def fromValues(cls, values):
+        """
+        Create Statistics from values.
+
+        :param pd.Series or list values:
+        :rtype: Statistics
+        """
+        statistics = cls()
+        values = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+        notNull = values.dropna()
+        statistics.count = len(notNull)
+        statistics.nulls = len(values) - len(notNull)
+
+        numbers = cls._getNumbers(notNull)
+        statistics.numeric = len(numbers)
+        statistics.total = float(numbers.sum()) if len(numbers) else 0.0
+
+        if len(notNull):
+            try:
+                statistics.minimum, statistics.maximum = notNull.min(), notNull.max()
+            except (TypeError, ValueError):  # In case of mixed values or values such as arrays
+                pass
+
+            try:
+                hashes = pd.util.hash_pandas_object(notNull, index=False).to_numpy()
+            except TypeError:  # Unhashable values such as lists are hashed by their repr
+                hashes = pd.util.hash_pandas_object(notNull.map(repr), index=False).to_numpy()
+            bits = 64 - cls.hllPrecision
+            buckets = (hashes >> np.uint64(bits)).astype(np.intp)
+            remaining = (hashes & np.uint64(2 ** bits - 1)).astype(float)
+            ranks = (bits - np.frexp(remaining)[1] + 1).astype(np.uint8)
+            np.maximum.at(statistics.registers, buckets, ranks)
+        return statistics
+
+    @staticmethod
+    def _getNumbers(values):
+        """
+        Get the numeric values of some non null values, bools excluded.
+
+        :param pd.Series values:
+        """
+        if pd.api.types.is_bool_dtype(values.dtype):
+            return pd.Series([], dtype=float)
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return values
+        return pd.to_numeric(values[values.map(lambda value: isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_)))], errors="coerce").dropna()
+
+    @property
+    def mean(self):
+        """Mean of numeric values, None if there are none."""
+        return self.total / self.numeric if self.numeric else None
+
+    @property
+    def distinct(self):
+        """Estimated number of distinct non null values."""
+        size = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / size) * size ** 2 / np.sum(2.0 ** -self.registers.astype(float))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * log(size / zeros)
+        return min(int(round(estimate)), self.count)
+
+    def add(self, values):
+        """
+        Update with added values.
+
+        :param pd.Series or list values:
+        """
+        self.merge(self.fromValues(values))
+
+    def merge(self, other):
+        """
+        Update with another Statistics' values.
+
+        :param Statistics other:
+        """
+        self.count += other.count
+        self.nulls += other.nulls
+        self.numeric += other.numeric
+        self.total += other.total
+        self.registers = np.maximum(self.registers, other.registers)
+
+        for attr, func in (("minimum", min), ("maximum", max)):
+            values = [value for value in (getattr(self, attr), getattr(other, attr)) if value is not None]
+            try:
+                setattr(self, attr, func(values) if values else None)
+            except (TypeError, ValueError):  # In case of mixed values or values such as arrays
+                setattr(self, attr, None)
+
+    def remove(self, values):
+        """
+        Update with removed values.
+
+        :param pd.Series or list values:
+        """
+        values = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+        other = self.fromValues(values)
+        self.count -= other.count
+        self.nulls -= other.nulls
+        self.numeric -= other.numeric
+        self.total -= other.total
+
+        extremes = [value for value in (self.minimum, self.maximum) if value is not None]
+        if extremes and any(self._equals(value, extreme) for value in values.dropna() for extreme in extremes):
+            self.dirty = True
+
+    @staticmethod
+    def _equals(value, other):
+        """
+        Get whether two values are equal, isin() isn't used as it unpacks values such as lists.
+        Values that can't be compared, such as arrays, count as equal so that statistics are computed again.
+        """
+        try:
+            return bool(value == other)
+        except (TypeError, ValueError):
+            return True
+
+
+class Statistician:
+    """
+    Statistician feature for Spreadsheet.
+    Caches Statistics of columns and rows by key once they're requested, shown in right click menu.
+
+    Appended rows are added to cached column statistics, removed rows or columns are removed from them and set values replace old ones,
+    so they're only computed again when dataVersion changes.
+    Statistics whose min or max was removed are computed again the next time they're requested.
+    """
+    def __init__(self):
+        """
+        :param generalgui.Spreadsheet self:
+        """
+        self._columnStatistics = {}
+        self._rowStatistics = {}
+        self._statisticsVersion = None
+
+    def getStatistics(self, key, row=False):
+        """
+        Get Statistics of a column or row, cached.
+
+        :param generalgui.Spreadsheet self:
+        :param key: Header key of a column or index key of a row
+        :param bool row: Whether key is an index key
+        :rtype: Statistics or None
+        """
+        if self.dataSource is not None:
+            return None
+        self._checkStatisticsVersion()
+
+        df = self.dataFrame
+        if key not in (df.index if row else df.columns):
+            return None
+        cache = self._rowStatistics if row else self._columnStatistics
+
+        statistics = cache.get(key)
+        if statistics is None or statistics.dirty:
+            values = df.loc[key] if row else df[key]
+            if isinstance(values, pd.DataFrame):  # Duplicate keys
+                return Statistics.fromValues(pd.Series(values.to_numpy().ravel(), dtype=object))
+            statistics = cache[key] = Statistics.fromValues(values)
+        return statistics
+
+    def _checkStatisticsVersion(self):
+        """
+        Clear cached Statistics if dataVersion has changed.
+
+        :param generalgui.Spreadsheet self:
+        :return: Whether cache was kept
+        """
+        if self._statisticsVersion != self.dataVersion:
+            self._clearStatistics()
+            return False
+        return True
+
+    def _clearStatistics(self):
+        """
+        Clear every cached Statistics.
+
+        :param generalgui.Spreadsheet self:
+        """
+        self._columnStatistics = {}
+        self._rowStatistics = {}
+        self._statisticsVersion = self.dataVersion
+
+    def _addStatisticsRows(self, df):
+        """
+        Add rows that are about to be appended to cached column statistics.
+
+        :param generalgui.Spreadsheet self:
+        :param pd.DataFrame df: Rows that are appended
+        """
+        if not self._checkStatisticsVersion():
+            return
+        if not df.columns.equals(self.dataFrame.columns) or not df.columns.is_unique:
+            self._clearStatistics()
+            return
+        for key, statistics in self._columnStatistics.items():
+            statistics.add(df[key])
+
+    def _removeStatistics(self, key, row=False):
+        """
+        Remove a row or column that's about to be dropped from cached statistics.
+
+        :param generalgui.Spreadsheet self:
+        :param key: Header key of column or index key of row
+        :param bool row: Whether key is an index key
+        """
+        if not self._checkStatisticsVersion():
+            return
+        df = self.dataFrame
+        if not df.index.is_unique or not df.columns.is_unique:
+            self._clearStatistics()
+            return
+
+        if row:
+            self._rowStatistics.pop(key, None)
+            values, cache = df.loc[key], self._columnStatistics
+        else:
+            self._columnStatistics.pop(key, None)
+            values, cache = df[key], self._rowStatistics
+
+        for cachedKey, statistics in cache.items():
+            statistics.remove([values[cachedKey]])
+
+    def _setStatisticsValue(self, rowKey, columnKey, oldValue, value):
+        """
+        Replace a value that's about to change in cached statistics of it's row and column.
+
+        :param generalgui.Spreadsheet self:
+        :param rowKey: Index key
+        :param columnKey: Header key
+        :param oldValue: Value before change
+        :param value: Value after change
+        """
+        if not self._checkStatisticsVersion():
+            return
+        for statistics in (self._rowStatistics.get(rowKey), self._columnStatistics.get(columnKey)):
+            if statistics is not None:
+                statistics.remove([oldValue])
+                statistics.add([value])
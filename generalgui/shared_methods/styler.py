@@ -20,6 +20,8 @@ class Styler:
     """
     Styler feature for App and Element.
     """
+    __slots__ = ()
+
     def __init__(self):
         self.styleHandler = None
 
@@ -96,6 +98,7 @@ class StyleHandler:
     """
     Handles styles for an element.
     """
+    __slots__ = ("changeFunc", "getOriginalFunc", "styles", "highestPriority", "allStyles", "originalStyle")
     prefix = "$"
     def __init__(self, changeFunc, getOriginalFunc):
         """
@@ -209,6 +212,8 @@ class Style:
     """
     A specific style. Initalized through StyleHandler.createStyle().
     """
+    __slots__ = ("styleHandler", "name", "style", "priority", "kwargs")
+
     def __init__(self, styleHandler, name, style, priority, **kwargs):
         """
         A style that has it's own kwargs.
@@ -0,0 +1,205 @@
+"""
+Virtualizer for Spreadsheet.
+"""
+
+from generalvector import Vec2
+
+from math import ceil
+
+
+class Virtualizer:
+    """
+    Virtualizer feature for Spreadsheet.
+    Only creates cells for the rows and columns that are visible in mainGrid's canvas, plus an overscan margin.
+    Cells are recycled by fillGrid when scrolling and canvas' scrollregions are given the size of the entire dataFrame.
+
+    viewStart is the (column, row) position in dataFrame of the first rendered cell.
+    viewSize is the (columns, rows) size of the rendered area.
+    """
+    def __init__(self, virtual=False, overscan=5):
+        """
+        :param generalgui.Spreadsheet self:
+        :param virtual: Whether to only create cells in view or not
+        :param overscan: Number of rows and columns to render outside of view
+        """
+        self.virtual = virtual
+        self.overscan = overscan
+        self.viewStart = Vec2(0)
+        self.viewSize = Vec2(0)
+        self.virtualRowHeight = 27
+        self.virtualColumnWidth = 60
+        self.virtualColumnWidths = {}
+        self._viewUpdateQueued = False
+
+        if self.virtual:
+            canvas = self.mainGrid.canvas
+            canvas.widgetConfig(xscrollcommand=self._getVirtualScrollCommand(self.mainGrid.hsb))
+            canvas.widgetConfig(yscrollcommand=self._getVirtualScrollCommand(self.mainGrid.vsb))
+            canvas.createBind("<Configure>", self._queueViewUpdate)
+
+    def getDataShape(self):
+        """
+        Get (columns, rows) of dataSource if there is one, otherwise of dataFrame's rows that are shown.
+
+        :param generalgui.Spreadsheet self:
+        :rtype: Vec2
+        """
+        if self.dataSource is not None:
+            rows, columns = self.dataSource.getShape()
+        else:
+            viewRows = self.getViewRows()
+            rows = self.dataFrame.shape[0] if viewRows is None else len(viewRows)
+            columns = self.dataFrame.shape[1]
+        return Vec2(columns, rows)
+
+    def getViewFrame(self):
+        """
+        Get the part of dataFrame that is rendered in mainGrid, read from dataSource if there is one.
+
+        :param generalgui.Spreadsheet self:
+        :rtype: pd.DataFrame
+        """
+        end = self.viewStart + self.viewSize
+        if self.dataSource is not None:
+            return self.dataSource.read(self.viewStart.y, end.y, self.viewStart.x, end.x)
+        viewRows = self.getViewRows()
+        if viewRows is not None:
+            return self.dataFrame.iloc[viewRows[self.viewStart.y:end.y], self.viewStart.x:end.x]
+        if not self.virtual:
+            return self.dataFrame
+        return self.dataFrame.iloc[self.viewStart.y:end.y, self.viewStart.x:end.x]
+
+    def _getVirtualScrollCommand(self, scrollbar):
+        """
+        Create a scrollcommand for mainGrid's canvas that also queues a view update.
+
+        :param generalgui.Spreadsheet self:
+        :param generalgui.Scrollbar or bool scrollbar: Optional scrollbar to keep updated
+        """
+        def command(*args):
+            """Set scrollbar and queue view update."""
+            if scrollbar:
+                scrollbar.widget.set(*args)
+            self._queueViewUpdate()
+        return command
+
+    def _queueViewUpdate(self):
+        """
+        Queue one call to _updateView, no matter how many scroll events arrive before it's called.
+
+        :param generalgui.Spreadsheet self:
+        """
+        if not self._viewUpdateQueued and not self.removed:
+            self._viewUpdateQueued = True
+            self.app.widget.after(10, self._updateView)
+
+    def _updateView(self):
+        """
+        Render cells again if visible area isn't completely rendered.
+
+        :param generalgui.Spreadsheet self:
+        """
+        self._viewUpdateQueued = False
+        if self.removed or self.dataFrameIsLoading:
+            return
+
+        start, size = self._getVisibleArea()
+        end = start + size
+        renderedEnd = self.viewStart + self.viewSize
+        if not (self.viewStart <= start and end <= renderedEnd):
+            self._fillDataFrame()
+
+    def _setViewArea(self):
+        """
+        Set viewStart and viewSize to visible area plus overscan, confined to dataFrame's shape.
+
+        :param generalgui.Spreadsheet self:
+        """
+        shape = self.getDataShape()
+        if not self.virtual:
+            self.viewStart = Vec2(0)
+            self.viewSize = shape
+            return
+
+        start, size = self._getVisibleArea()
+        start = (start - self.overscan).max(0)
+        end = (start + size + self.overscan * 2).min(shape)
+        self.viewStart = start.min(end)
+        self.viewSize = end - self.viewStart
+
+    def _getVisibleArea(self):
+        """
+        Get (start, size) of rows and columns that are currently visible in mainGrid's canvas, without overscan.
+
+        :param generalgui.Spreadsheet self:
+        :rtype: tuple[Vec2]
+        """
+        canvas = self.mainGrid.canvas.widget
+        if canvas.winfo_ismapped():
+            canvasSize = Vec2(canvas.winfo_width(), canvas.winfo_height())
+        else:
+            canvasSize = Vec2(canvas.winfo_reqwidth(), canvas.winfo_reqheight())
+        topLeft = Vec2(canvas.canvasx(0), canvas.canvasy(0))
+
+        firstRow = int(topLeft.y // self.virtualRowHeight)
+        lastRow = ceil((topLeft.y + canvasSize.y) / self.virtualRowHeight)
+
+        columns = self.getDataShape().x
+        firstColumn = None
+        lastColumn = columns
+        offset = 0
+        for column in range(columns):
+            offset += self._getVirtualColumnWidth(column)
+            if firstColumn is None and offset > topLeft.x:
+                firstColumn = column
+            if offset >= topLeft.x + canvasSize.x:
+                lastColumn = column + 1
+                break
+        if firstColumn is None:
+            firstColumn = lastColumn
+
+        start = Vec2(firstColumn, firstRow)
+        return start, Vec2(lastColumn, lastRow) - start
+
+    def _getVirtualColumnWidth(self, column):
+        """
+        Get measured width of a column position, or an estimate if it hasn't been rendered yet.
+
+        :param generalgui.Spreadsheet self:
+        :param int column:
+        """
+        return self.virtualColumnWidths.get(column, self.virtualColumnWidth)
+
+    def _getVirtualOffset(self, pos):
+        """
+        Get pixel offset of a (column, row) position in dataFrame.
+
+        :param generalgui.Spreadsheet self:
+        :param Vec2 pos:
+        """
+        return Vec2(sum(self._getVirtualColumnWidth(column) for column in range(pos.x)), pos.y * self.virtualRowHeight)
+
+    def _syncVirtualSizes(self):
+        """
+        Use measured sizes of rendered cells to improve size estimates, then give every canvas the size of entire dataFrame and move canvasFrames to viewStart.
+
+        :param generalgui.Spreadsheet self:
+        """
+        if self.renderedRowHeights:
+            self.virtualRowHeight = max(1, sum(self.renderedRowHeights) / len(self.renderedRowHeights))
+        for i, width in enumerate(self.renderedColumnWidths):
+            self.virtualColumnWidths[self.viewStart.x + i] = width
+        if self.virtualColumnWidths:
+            self.virtualColumnWidth = sum(self.virtualColumnWidths.values()) / len(self.virtualColumnWidths)
+
+        offset = self._getVirtualOffset(self.viewStart)
+        totalSize = self._getVirtualOffset(self.getDataShape()) + 10
+
+        self.mainGrid.setScrollSize(totalSize)
+        self.mainGrid.placeCanvasFrame(offset)
+        if self.columnKeys:
+            self.headerGrid.setScrollSize(Vec2(totalSize.x, 0))
+            self.headerGrid.placeCanvasFrame(Vec2(offset.x, 0))
+        if self.rowKeys:
+            self.indexGrid.setScrollSize(Vec2(0, totalSize.y))
+            self.indexGrid.placeCanvasFrame(Vec2(0, offset.y))
@@ -0,0 +1,180 @@
+"""
+Data that multiple Spreadsheets can show at once.
+
+Classes:
+    * ModelChange
+    * SpreadsheetModel
+
+Functions:
+    * setFrameValue
+"""
+
+from generalgui.shared_methods.appender import toRows, continueIndex
+
+from generallibrary.types import typeChecker
+
+import pandas as pd
+
+from collections import namedtuple
+
+
+ModelChange = namedtuple("ModelChange", ("kind", "rows", "columns", "value"))
+ModelChange.__doc__ = """
+One change of a SpreadsheetModel, given to every Spreadsheet showing it.
+
+kind is "append" with rows as a DataFrame of appended rows, "dropRows" with rows as index keys, "dropColumns" with columns as header keys,
+"setValue" with one key in rows and columns and the new value, or "load" when the whole dataFrame was replaced.
+"""
+
+
+def setFrameValue(df, rowKey, columnKey, value):
+    """
+    Get a shallow copy of df with one value changed, the changed column is replaced by a copy instead of being written to in place.
+    Frames sharing values with df, such as views and export snapshots, keep the old value.
+    The column becomes an object column if it's dtype can't hold value.
+
+    :param pd.DataFrame df:
+    :param rowKey: Index key
+    :param columnKey: Header key
+    :param value:
+    :rtype: pd.DataFrame
+    """
+    column = df[columnKey].copy()
+    try:
+        column.loc[rowKey] = value
+    except (TypeError, ValueError):
+        column = column.astype(object)
+        column.loc[rowKey] = value
+    df = df.copy(deep=False)
+    df[columnKey] = column
+    return df
+
+
+class SpreadsheetModel:
+    """
+    Holds a dataFrame that multiple Spreadsheets show, each with it's own sort, filter and subset of columns.
+    Give it to Spreadsheet with model parameter or setModel().
+
+    Every mutation changes dataFrame once and gives one ModelChange to each Spreadsheet, which applies it to it's own cells.
+    Spreadsheets showing every column hold a shallow copy of dataFrame, values are never written in place so they stay shared until a view sorts it's rows.
+    Keys are matched by label, so dropping a duplicated key drops every row or column with it.
+    """
+    def __init__(self, df=None):
+        """
+        :param pd.DataFrame df: Any value that pd.DataFrame accepts
+        """
+        self.dataFrame = self._toDataFrame(df)
+        self.version = 0
+        self.views = []
+
+    def __repr__(self):
+        return f"<SpreadsheetModel shape={self.dataFrame.shape} views={len(self.views)}>"
+
+    @staticmethod
+    def _toDataFrame(df):
+        """
+        Convert df to a DataFrame.
+
+        :param df:
+        :rtype: pd.DataFrame
+        """
+        if df is None:
+            return pd.DataFrame()
+        if not typeChecker(df, pd.DataFrame, error=False):
+            return pd.DataFrame(df)
+        return df
+
+    def addView(self, view):
+        """
+        Make a Spreadsheet receive changes, use Spreadsheet.setModel() instead of calling this.
+
+        :param generalgui.Spreadsheet view:
+        """
+        if view not in self.views:
+            self.views.append(view)
+
+    def removeView(self, view):
+        """
+        Stop a Spreadsheet from receiving changes, use Spreadsheet.setModel(None) instead of calling this.
+
+        :param generalgui.Spreadsheet view:
+        """
+        if view in self.views:
+            self.views.remove(view)
+
+    def loadDataFrame(self, df):
+        """
+        Replace dataFrame, every view fills it's cells again.
+
+        :param pd.DataFrame df: Any value that pd.DataFrame accepts
+        """
+        self.dataFrame = self._toDataFrame(df)
+        self._notify(ModelChange("load", None, None, None))
+
+    def appendRows(self, rows):
+        """
+        Add rows to the bottom of dataFrame, views only create cells for the new rows.
+        Rows with a default integer index continue dataFrame's index if it's a default integer index as well.
+
+        :param pd.DataFrame or list or dict rows: DataFrame, list of rows or dict of columns. Rows as lists use dataFrame's columns if they fit.
+        """
+        self._appendFrames([toRows(rows, self.dataFrame.columns)])
+
+    def _appendFrames(self, frames):
+        """
+        Append frames of rows in one change.
+
+        :param list[pd.DataFrame] frames:
+        """
+        rows = continueIndex(self.dataFrame, frames)
+        self.dataFrame = rows if self.dataFrame.empty else pd.concat([self.dataFrame, rows])
+        self._notify(ModelChange("append", rows, None, None))
+
+    def dropRows(self, keys):
+        """
+        Drop rows from dataFrame, views remove their cells.
+
+        :param list keys: Index keys
+        """
+        keys = [key for key in keys if key in self.dataFrame.index]
+        if keys:
+            self.dataFrame = self.dataFrame.drop(keys, axis="rows")
+            self._notify(ModelChange("dropRows", keys, None, None))
+
+    def dropColumns(self, keys):
+        """
+        Drop columns from dataFrame, views remove their cells.
+
+        :param list keys: Header keys
+        """
+        keys = [key for key in keys if key in self.dataFrame.columns]
+        if keys:
+            self.dataFrame = self.dataFrame.drop(keys, axis="columns")
+            self._notify(ModelChange("dropColumns", None, keys, None))
+
+    def setValue(self, rowKey, columnKey, value):
+        """
+        Change the value of a cell in dataFrame.
+
+        :param rowKey: Index key
+        :param columnKey: Header key
+        :param value:
+        :raises KeyError: If rowKey or columnKey isn't in dataFrame
+        """
+        if rowKey not in self.dataFrame.index or columnKey not in self.dataFrame.columns:
+            raise KeyError(f"{rowKey}, {columnKey} is not a cell in {self}")
+        self.dataFrame = setFrameValue(self.dataFrame, rowKey, columnKey, value)
+        self._notify(ModelChange("setValue", [rowKey], [columnKey], value))
+
+    def _notify(self, change):
+        """
+        Give a change to every view, views that have been removed are forgotten.
+
+        :param ModelChange change:
+        """
+        self.version += 1
+        for view in self.views.copy():
+            if view.removed:
+                self.views.remove(view)
+            else:
+                view._modelChanged(change)
@@ -0,0 +1,80 @@
+"""Tests for CanvasGrid"""
+from test.shared_methods import GuiTests
+
+from generalgui import App, CanvasGrid
+
+from generalvector import Vec2
+
+from types import SimpleNamespace
+
+
+class CanvasGridTest(GuiTests):
+    def test_setValues(self):
+        grid = CanvasGrid(App())
+        self.assertRaises(ValueError, grid.setValues, [1, 2, 3], Vec2(2, 2))
+
+        grid.setValues([1, 2, 3, 4, 5, 6], Vec2(3, 2))
+        self.assertEqual(Vec2(3, 2), grid.size)
+        self.assertEqual(3, grid.getValue(Vec2(2, 0)))
+        self.assertEqual(4, grid.getValue(Vec2(0, 1)))
+        self.assertEqual([1, 2, 3, 4, 5, 6], grid.getValues())
+        self.assertEqual(3, len(grid.columnWidths))
+        self.assertEqual(2, len(grid.rowHeights))
+        self.assertEqual(Vec2(sum(grid.columnWidths), sum(grid.rowHeights)), grid.getTotalSize())
+
+        grid.setValues([], Vec2(0, 0))
+        self.assertEqual([], grid.getValues())
+        self.assertEqual(Vec2(0, 0), grid.getTotalSize())
+
+    def test_getCellPos(self):
+        grid = CanvasGrid(App())
+        grid.setValues(["a", "b", "c", "d"], Vec2(2, 2))
+        grid.setColumnWidths([10, 20])
+        grid.setRowHeights([5, 5])
+
+        self.assertEqual(Vec2(0, 0), grid.getCellPos(SimpleNamespace(x=0, y=0)))
+        self.assertEqual(Vec2(1, 0), grid.getCellPos(SimpleNamespace(x=10, y=4)))
+        self.assertEqual(Vec2(1, 1), grid.getCellPos(SimpleNamespace(x=29, y=9)))
+        self.assertEqual(None, grid.getCellPos(SimpleNamespace(x=30, y=0)))
+        self.assertEqual(None, grid.getCellPos(SimpleNamespace(x=0, y=10)))
+
+    def test_render(self):
+        grid = CanvasGrid(App(), width=100, height=50)
+        grid.setValues(list(range(1000)), Vec2(10, 100))
+        self.assertLess(len(grid._items), 1000)
+        self.assertGreater(len(grid._items), 0)
+
+    def test_measureVisibleRows(self):
+        grid = CanvasGrid(App(), width=100, height=50)
+        values = ["a"] * 2000
+        values[-1] = "a" * 50
+        grid.setValues(values, Vec2(2, 1000))
+        self.assertTrue(grid._measuredRows[0])
+        self.assertLess(sum(grid._measuredRows), 100)
+        self.assertEqual(1000, len(grid.rowHeights))
+        width = grid.columnWidths[1]
+
+        grid.canvas.widget.yview_moveto(1)
+        grid.render()
+        self.assertTrue(grid._measuredRows[-1])
+        self.assertGreater(grid.columnWidths[1], width)
+        self.assertEqual(width, grid.columnWidths[0])
+
+    def test_multilines(self):
+        grid = CanvasGrid(App(), hideMultiline=True)
+        grid.setValues(["a\nb", "c"], Vec2(2, 1))
+
+        self.assertEqual("a ...", grid.getDisplayedText(Vec2(0, 0)))
+        self.assertEqual("c", grid.getDisplayedText(Vec2(1, 0)))
+        height = grid.rowHeights[0]
+
+        grid.toggleMultilines(Vec2(0, 0))
+        self.assertEqual("a\nb", grid.getDisplayedText(Vec2(0, 0)))
+        self.assertGreater(grid.rowHeights[0], height)
+
+        grid.toggleAllMultilines(False)
+        self.assertEqual("a ...", grid.getDisplayedText(Vec2(0, 0)))
+        self.assertEqual(height, grid.rowHeights[0])
+
+        grid.toggleAllMultilines(True)
+        self.assertEqual("a\nb", grid.getDisplayedText(Vec2(0, 0)))
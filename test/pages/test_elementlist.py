@@ -23,4 +23,14 @@ class OptionMenuTest(GuiTests):
 
         # print([elementList.getGridPos(ele) for ele in elementList.getChildren()])
 
+    def test_removedSlots(self):
+        elementList = ElementList(Page(App()), maxFirstSteps=2)
+        labels = [Label(elementList, i) for i in range(5)]
+
+        labels[3].remove()
+        labels[1].remove()
+        self.assertEqual(Vec2(0, 1), elementList.getGridPos(Label(elementList, "first hole")))
+        self.assertEqual(Vec2(1, 1), elementList.getGridPos(Label(elementList, "second hole")))
+        self.assertEqual(Vec2(2, 1), elementList.getGridPos(Label(elementList, "appended")))
+
 
@@ -45,6 +45,29 @@ class OptionMenuTest(GuiTests):
         label1.remove()
         self.assertEqual(Vec2(0, 0), grid.getGridSize())
 
+    def test_gridIndex(self):
+        grid = Grid(App())
+        label = Label(grid, "hello", column=2, row=1)
+        self.assertEqual({(2, 1): [label]}, grid.gridCells)
+
+        label.grid(Vec2(0, 3))
+        self.assertEqual(None, grid.getGridElement(Vec2(2, 1)))
+        self.assertEqual(label, grid.getGridElement(Vec2(0, 3)))
+        self.assertEqual(Vec2(1, 4), grid.getGridSize())
+
+        page = Grid(grid, column=1, row=0)
+        self.assertEqual(page.getTopElement(), grid.getGridElement(Vec2(1, 0)))
+        self.assertEqual(Vec2(1, 0), grid.getGridPos(page))
+
+        label.hide()
+        self.assertEqual(None, grid.getGridElement(Vec2(0, 3)))
+        self.assertRaises(AttributeError, grid.getGridPos, label)
+        self.assertEqual(Vec2(2, 1), grid.getGridSize())
+
+        page.remove()
+        self.assertEqual({}, grid.gridCells)
+        self.assertEqual(Vec2(0, 0), grid.getGridSize())
+
     def test_fillGrid(self):
         grid = Grid(App())
 
@@ -74,6 +97,24 @@ class OptionMenuTest(GuiTests):
         self.assertEqual([Vec2(0, 0), Vec2(0, 1), Vec2(1, 0), Vec2(2, 0), Vec2(1, 1), Vec2(2, 1)],
                          [grid.getGridPos(ele) for ele in grid.getChildren()])
 
+        elements = grid.fillGrid(Label, Vec2(1, 0), Vec2(2, 1), values=["a", "b"])
+        self.assertEqual(["a", "b"], [ele.getValue() for ele in elements])
+        self.assertEqual([Vec2(1, 0), Vec2(2, 0)], [grid.getGridPos(ele) for ele in elements])
+
+    def test_fillGridBatched(self):
+        grid = Grid(App())
+
+        elements = grid.fillGrid(Label, Vec2(2, 1), Vec2(3, 2), values=range(6))
+        self.assertEqual(list(range(6)), [ele.getValue() for ele in elements])
+        self.assertEqual([Vec2(x, y) for y in (1, 2) for x in (2, 3, 4)], [grid.getGridPos(ele) for ele in elements])
+        self.assertEqual([Vec2(x, y) for y in (1, 2) for x in (2, 3, 4)], [Vec2(ele.widget.grid_info()["column"], ele.widget.grid_info()["row"]) for ele in elements])
+
+        reused = grid.fillGrid(Label, Vec2(2, 1), Vec2(3, 1), values=["a", "b", "c"], removeExcess=True)
+        self.assertEqual(elements[:3], reused)
+        self.assertEqual(["a", "b", "c"], [ele.getValue() for ele in reused])
+        self.assertEqual(Vec2(5, 2), grid.getGridSize())
+        self.assertTrue(all(ele.pooled for ele in elements[3:]))
+
     def test_getFirstElementPos(self):
         grid = Grid(App())
 
@@ -114,6 +155,31 @@ class OptionMenuTest(GuiTests):
         Label(grid, column=0, row=2)
         self.assertEqual(Vec2(0, 2), grid.getFirstElementPos(Vec2(3, 2), Vec2(1, 0)))
 
+    def test_sparse(self):
+        grid = Grid(App(), sparse=True)
+        far = Label(grid, column=5000, row=5000)
+        Label(grid, column=5000, row=2)
+        Label(grid, column=3, row=5000)
+        self.assertEqual({2: [5000], 5000: [3, 5000]}, grid.rowIndexes)
+        self.assertEqual({3: [5000], 5000: [2, 5000]}, grid.columnIndexes)
+        self.assertEqual(Vec2(5001, 5001), grid.getGridSize())
+
+        self.assertEqual(Vec2(5000, 2), grid.getFirstElementPos(Vec2(5000, 0), Vec2(0, 1), maxSteps=10000))
+        self.assertEqual(Vec2(5000, 5000), grid.getFirstElementPos(Vec2(5000, 3), Vec2(0, 1), maxSteps=10000))
+        self.assertEqual(None, grid.getFirstElementPos(Vec2(5000, 3), Vec2(0, 1), maxSteps=100))
+        self.assertEqual(Vec2(3, 5000), grid.getFirstElementPos(Vec2(4999, 5000), Vec2(-1, 0), maxSteps=10000))
+        self.assertEqual(None, grid.getFirstElementPos(Vec2(4999, 5000), Vec2(-2, 0), maxSteps=10000))
+        self.assertEqual(Vec2(5000, 5000), grid.getFirstElementPos(Vec2(0, 0), Vec2(1, 1), maxSteps=10000))
+
+        far.remove()
+        self.assertEqual({2: [5000], 5000: [3]}, grid.rowIndexes)
+        self.assertEqual(Vec2(5001, 5001), grid.getGridSize())
+        self.assertEqual(None, grid.getFirstElementPos(Vec2(0, 0), Vec2(1, 1), maxSteps=10000))
+
+        elements = grid.fillGrid(Label, Vec2(100000, 7), Vec2(2, 1), values=["a", "b"])
+        self.assertEqual([Vec2(100000, 7), Vec2(100001, 7)], [grid.getGridPos(ele) for ele in elements])
+        self.assertEqual([Vec2(100000, 7), Vec2(100001, 7)], [Vec2(ele.widget.grid_info()["column"], ele.widget.grid_info()["row"]) for ele in elements])
+
     def test_getFirstEmptyPos(self):
         grid = Grid(App())
 
@@ -2,9 +2,12 @@
 
 from test.shared_methods import GuiTests
 
-from generalgui import App, Page, Spreadsheet, Label
+from generalgui import App, Page, Spreadsheet, Label, DataFrameSource, MemmapSource
+
+from generalvector import Vec2
 
 import pandas as pd
+import numpy as np
 
 
 class SpreadsheetTest(GuiTests):
@@ -78,3 +81,183 @@ class SpreadsheetTest(GuiTests):
                         self.assertEqual(["col_b", "col_a"], spreadsheet.getHeaderValues())
                         self.assertEqual(["row_a", "row_b"], spreadsheet.getIndexValues())
 
+    def test_virtual(self):
+        spreadsheet = Spreadsheet(Page(App()), virtual=True, overscan=2)
+        spreadsheet.loadDataFrame(pd.DataFrame([[x * y for x in range(20)] for y in range(1000)]))
+
+        self.assertEqual(Vec2(0, 0), spreadsheet.viewStart)
+        self.assertLess(spreadsheet.viewSize.y, 1000)
+        self.assertLess(spreadsheet.viewSize.x, 20)
+
+        mainValues = spreadsheet.getMainValues()
+        self.assertEqual(spreadsheet.viewSize.x * spreadsheet.viewSize.y, len(mainValues))
+        self.assertEqual(list(spreadsheet.getViewFrame().values.flatten()), mainValues)
+        self.assertEqual(list(range(spreadsheet.viewSize.x)), spreadsheet.getHeaderValues())
+        self.assertEqual(list(range(spreadsheet.viewSize.y)), spreadsheet.getIndexValues())
+
+        spreadsheet.sortColumn(1)
+        spreadsheet.sortColumn(1)
+        self.assertEqual(list(range(999, 999 - spreadsheet.viewSize.y, -1)), spreadsheet.getIndexValues())
+
+    def test_loadDataSource(self):
+        spreadsheet = Spreadsheet(Page(App()), virtual=True, overscan=2)
+        spreadsheet.loadDataSource(MemmapSource(np.arange(20000).reshape(1000, 20)))
+
+        self.assertTrue(spreadsheet.dataFrame.empty)
+        self.assertEqual(Vec2(20, 1000), spreadsheet.getDataShape())
+        self.assertLess(spreadsheet.viewSize.y, 1000)
+        self.assertEqual(list(spreadsheet.getViewFrame().values.flatten()), spreadsheet.getMainValues())
+        self.assertEqual(list(range(spreadsheet.viewSize.y)), spreadsheet.getIndexValues())
+
+        version = spreadsheet.dataVersion
+        spreadsheet.sortColumn(1)
+        self.assertEqual(version, spreadsheet.dataVersion)
+        self.assertEqual(list(range(spreadsheet.viewSize.y)), spreadsheet.getIndexValues())
+
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [1, 2]}))
+        self.assertIsNone(spreadsheet.dataSource)
+        self.assertEqual([1, 2], spreadsheet.getMainValues())
+
+        spreadsheet.loadDataSource(DataFrameSource(pd.DataFrame({"a": [1, 2]}, index=["x", "y"])))
+        self.assertEqual(["x", "y"], spreadsheet.getIndexValues())
+        self.assertEqual("y", spreadsheet.getRowKey(1))
+        self.assertEqual("a", spreadsheet.getColumnKey(0))
+
+        spreadsheet.clearAll()
+        self.assertIsNone(spreadsheet.dataSource)
+
+    def test_sortCache(self):
+        spreadsheet = Spreadsheet(Page(App()))
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [3, 1, 2], "b": ["x", "x", "y"]}))
+        label = spreadsheet.mainCells[1][1]
+
+        spreadsheet.sortColumn("a")
+        self.assertEqual([1, 2, 0], spreadsheet.getIndexValues())
+        self.assertIn((0, ("a", ), True), spreadsheet._sortCache)
+        self.assertIs(label, spreadsheet.mainCells[3][1])
+
+        spreadsheet.sortColumn("a")
+        self.assertEqual([0, 2, 1], spreadsheet.getIndexValues())
+        self.assertNotIn((0, ("a", ), False), spreadsheet._sortCache)
+
+        spreadsheet.sortColumns(["b", "a"])
+        self.assertEqual([1, 0, 2], spreadsheet.getIndexValues())
+        spreadsheet.sortColumns(["b", "a"])
+        self.assertEqual([2, 0, 1], spreadsheet.getIndexValues())
+
+        spreadsheet.sortIndex()
+        self.assertEqual([0, 1, 2], spreadsheet.getIndexValues())
+        self.assertEqual([3, "x", 1, "x", 2, "y"], spreadsheet.getMainValues())
+
+        spreadsheet.loadDataFrame()
+        spreadsheet.sortColumn("a")
+        self.assertEqual([(0, ("a", ), True)], list(spreadsheet._sortCache))
+
+    def test_sortCacheTies(self):
+        spreadsheet = Spreadsheet(Page(App()))
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [1, 1, 2, 1], "b": [4, 3, 2, 1]}))
+
+        spreadsheet.sortColumn("a")
+        self.assertEqual([0, 1, 3, 2], spreadsheet.getIndexValues())
+        spreadsheet.sortColumn("a")
+        self.assertEqual([2, 0, 1, 3], spreadsheet.getIndexValues())
+        self.assertEqual([(0, ("a", ), True), (0, ("a", ), False)], list(spreadsheet._sortCache))
+
+        spreadsheet.sortColumn("b")
+        self.assertEqual([3, 2, 1, 0], spreadsheet.getIndexValues())
+        spreadsheet.sortColumn("a")
+        self.assertEqual([0, 1, 3, 2], spreadsheet.getIndexValues())
+        spreadsheet.sortColumn("a")
+        self.assertEqual([2, 0, 1, 3], spreadsheet.getIndexValues())
+
+    def test_sortToggle(self):
+        spreadsheet = Spreadsheet(Page(App()))
+        spreadsheet.loadDataFrame(pd.DataFrame({1: [2, 1], "a": [1, 2], "b": [3, 3]}))
+
+        spreadsheet.sortColumn(1)
+        self.assertEqual([1, 0], spreadsheet.getIndexValues())
+        spreadsheet.sortColumns(["a", "b"])
+        self.assertEqual([0, 1], spreadsheet.getIndexValues())
+        spreadsheet.sortColumns(["a", "b"])
+        self.assertEqual([1, 0], spreadsheet.getIndexValues())
+        spreadsheet.sortColumn(1)
+        self.assertEqual([1, 0], spreadsheet.getIndexValues())
+        spreadsheet.sortColumns([1])
+        self.assertEqual([0, 1], spreadsheet.getIndexValues())
+
+    def test_delta(self):
+        spreadsheet = Spreadsheet(Page(App()))
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [3, 1, 2], "b": ["c", "a", "b"]}))
+        version = spreadsheet.dataVersion
+        label = spreadsheet.mainCells[1][1]
+        self.assertEqual(3, label.getValue())
+
+        spreadsheet.sortColumn("a")
+        self.assertEqual([1, "a", 2, "b", 3, "c"], spreadsheet.getMainValues())
+        self.assertEqual([1, 2, 0], spreadsheet.getIndexValues())
+        self.assertIs(label, spreadsheet.mainCells[3][1])
+        self.assertEqual(Vec2(1, 3), spreadsheet.mainGrid.getGridPos(label))
+
+        spreadsheet.dropRow(1)
+        self.assertEqual([2, "b", 3, "c"], spreadsheet.getMainValues())
+        self.assertEqual(Vec2(1, 2), spreadsheet.mainGrid.getGridPos(label))
+
+        spreadsheet.dropColumn("a")
+        self.assertEqual(["b", "c"], spreadsheet.getMainValues())
+        self.assertEqual(["b"], spreadsheet.getHeaderValues())
+        self.assertEqual(version, spreadsheet.dataVersion)
+
+        spreadsheet.resetIndex()
+        self.assertGreater(spreadsheet.dataVersion, version)
+        self.assertEqual([2, "b", 0, "c"], spreadsheet.getMainValues())
+
+    def test_cellGridPos(self):
+        app = App()
+        spreadsheet = Spreadsheet(Page(app))
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [3, 1, 2], "b": ["c", "a", "b"]}, index=["x", "y", "z"]))
+        label = spreadsheet.mainCells[1][2]
+        self.assertEqual(Vec2(2, 1), spreadsheet.mainGrid.getGridPos(label))
+
+        spreadsheet.sortColumn("a")
+        self.assertEqual(Vec2(2, 3), spreadsheet.mainGrid.getGridPos(label))
+
+        app.menuTargetElement = label
+        self.assertEqual("x", spreadsheet.getRowName())
+        self.assertEqual("b", spreadsheet.getColumnName())
+
+        spreadsheet.dropRow("y")
+        self.assertEqual(Vec2(2, 2), spreadsheet.mainGrid.getGridPos(label))
+        self.assertEqual("x", spreadsheet.getRowName())
+
+    def test_canvasCells(self):
+        spreadsheet = Spreadsheet(Page(App()), canvasCells=True)
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [3, 1, 2], "b": ["c", "a", "b"]}))
+        self.assertEqual([3, "c", 1, "a", 2, "b"], spreadsheet.getMainValues())
+        self.assertEqual(["a", "b"], spreadsheet.getHeaderValues())
+        self.assertEqual([0, 1, 2], spreadsheet.getIndexValues())
+        self.assertEqual(spreadsheet.headerGrid.columnWidths, spreadsheet.mainGrid.columnWidths)
+        self.assertEqual(spreadsheet.indexGrid.rowHeights, spreadsheet.mainGrid.rowHeights)
+
+        spreadsheet.sortColumn("a")
+        self.assertEqual([1, "a", 2, "b", 3, "c"], spreadsheet.getMainValues())
+        self.assertEqual([1, 2, 0], spreadsheet.getIndexValues())
+
+        spreadsheet.mainGrid.menuCellPos = Vec2(0, 2)
+        spreadsheet.app.menuTargetElement = spreadsheet.mainGrid.canvas
+        self.assertEqual(0, spreadsheet.getRowName())
+        self.assertEqual("a", spreadsheet.getColumnName())
+
+    def test_syncSizes(self):
+        spreadsheet = Spreadsheet(Page(App()))
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": ["short", "a much longer value"], "longer header": ["x\ny", 2]}))
+
+        widths = spreadsheet.renderedColumnWidths
+        heights = spreadsheet.renderedRowHeights
+        self.assertGreater(widths[0], widths[1])
+        self.assertEqual(widths[0], int(spreadsheet.headerCells[0][1].getWidgetConfig("width")))
+        self.assertEqual(widths[1], int(spreadsheet.mainCells[0][2].getWidgetConfig("width")))
+        self.assertEqual(heights[1], int(spreadsheet.indexCells[2][0].getWidgetConfig("height")))
+
+        spreadsheet.show(mainloop=False)
+        self.assertEqual(widths[0], spreadsheet.mainCells[1][1].widget.winfo_width())
+        self.assertEqual(heights[0], spreadsheet.mainCells[1][1].widget.winfo_height())
@@ -0,0 +1,26 @@
+"""Measure Python memory of every cell in a big Grid"""
+
+import os
+import tracemalloc
+
+import generalgui
+from generalgui import App, Grid, Label
+
+from generalvector import Vec2
+
+
+size = Vec2(100, 1000)
+
+grid = Grid(App())
+tracemalloc.start()
+before = tracemalloc.take_snapshot()
+grid.fillGrid(Label, Vec2(0, 0), size, values=range(size.x * size.y))
+after = tracemalloc.take_snapshot()
+tracemalloc.stop()
+
+allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+print(f"{size.x * size.y} cells use {allocated / 2 ** 20:.1f} MiB of Python memory, {allocated / (size.x * size.y):.0f} bytes per cell")
+
+ownFiles = (tracemalloc.Filter(True, os.path.join(os.path.dirname(generalgui.__file__), "*")), )
+allocated = sum(stat.size_diff for stat in after.filter_traces(ownFiles).compare_to(before.filter_traces(ownFiles), "filename"))
+print(f"{allocated / (size.x * size.y):.0f} bytes per cell are allocated by generalgui itself, the rest by tkinter")
@@ -1,6 +1,6 @@
 """Random testing"""
 
-from generalgui import Page, Button, Label, OptionMenu, Checkbutton, Entry, LabelCheckbutton, LabelEntry, Spreadsheet, App, ElementList
+from generalgui import Page, Button, Label, OptionMenu, Checkbutton, Entry, LabelCheckbutton, LabelEntry, Spreadsheet, App, ElementList, SpreadsheetModel
 
 from generalvector import Vec2
 
@@ -19,7 +19,7 @@ from generallibrary.functions import leadingArgsCount
 
 def debug():
     for spreadsheet in spreadsheets:
-        spreadsheet._syncColumnKeysWidth(True)
+        spreadsheet.syncSizes()
         # frame = spreadsheet.mainGrid.getBaseElement()
         # frame.parentPage.hideChildren()
         # frame.gridLabels(Vec2(0, 1), frame.getGridSize() - Vec2(1), [])
@@ -40,14 +40,15 @@ def addBig():
 
     df = pd.DataFrame(l)
 
-    ss(lambda x: x.loadDataFrame(df))
+    model.loadDataFrame(df)
 
 app = App()
 page = ElementList(app, maxFirstSteps=4)
 
 columnKeys = ("color", "number", "name")
-Button(page, "Add row", onClick=lambda: ss(lambda x: x.loadDataFrame(pd.DataFrame([["red", 5, "mandera"]], columns=columnKeys))))
-Button(page, "Add indexed row", onClick=lambda: ss(lambda x: x.loadDataFrame(pd.DataFrame([["yellow", 2, "buck"], ["blue", 5, "zole"]], columns=columnKeys, index=["hello", "there"]))))
+model = SpreadsheetModel()
+Button(page, "Add row", onClick=lambda: spreadsheets[0].appendRows(pd.DataFrame([["red", 5, "mandera"]], columns=columnKeys), follow=True))
+Button(page, "Add indexed row", onClick=lambda: model.appendRows(pd.DataFrame([["yellow", 2, "buck"], ["blue", 5, "zole"]], columns=columnKeys, index=["hello", "there"])))
 Button(page, "Add big", onClick=addBig)
 Button(page, "Add Elements", onClick=addEles)
 Button(page, "Small", onClick=lambda: ss(lambda x: x.getTopElement().widgetConfig(height=200, width=200)))
@@ -72,7 +73,7 @@ for one in range(2):
             for four in range(2):
                 # if not spreadsheets:
                 #     spreadsheets.append(Spreadsheet(rowPage, cellVSB=True, cellHSB=True, columnKeys=True, rowKeys=True, side="left", pack=True))
-                spreadsheets.append(Spreadsheet(rowPage, cellVSB=one, cellHSB=two, columnKeys=three, rowKeys=four, side="left", pack=True))
+                spreadsheets.append(Spreadsheet(rowPage, cellVSB=one, cellHSB=two, columnKeys=three, rowKeys=four, side="left", pack=True, model=model))
 
 
 
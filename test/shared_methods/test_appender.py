@@ -0,0 +1,50 @@
+"""Tests for Appender"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet
+
+import pandas as pd
+
+
+class AppenderTest(GuiTests):
+    def test_appendRows(self):
+        spreadsheet = Spreadsheet(App())
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        label = spreadsheet.mainCells[1][1]
+
+        spreadsheet.appendRows([[3, "z"]])
+        spreadsheet.appendRows(pd.DataFrame({"a": [4], "b": ["w"]}))
+        self.assertEqual(2, len(spreadsheet.dataFrame))
+
+        spreadsheet.flushAppends()
+        self.assertEqual([0, 1, 2, 3], spreadsheet.dataFrame.index.tolist())
+        self.assertEqual([1, "x", 2, "y", 3, "z", 4, "w"], spreadsheet.getMainValues())
+        self.assertEqual([0, 1, 2, 3], spreadsheet.getIndexValues())
+        self.assertIs(label, spreadsheet.mainCells[1][1])
+
+    def test_appendRowsIndexed(self):
+        spreadsheet = Spreadsheet(App())
+        spreadsheet.appendRows(pd.DataFrame({"a": [1]}, index=["first"]))
+        spreadsheet.flushAppends()
+        spreadsheet.appendRows({"a": [2]})
+        spreadsheet.flushAppends()
+        self.assertEqual(["first", 0], spreadsheet.getIndexValues())
+        self.assertEqual([1, 2], spreadsheet.getMainValues())
+
+    def test_coalescing(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, appendFps=1)
+        spreadsheet.appendRows([[0]])
+        app.widget.update()
+        self.assertEqual(1, len(spreadsheet.dataFrame))
+
+        for i in range(1, 100):
+            spreadsheet.appendRows([[i]], follow=True)
+        app.widget.update()
+        self.assertEqual(1, len(spreadsheet.dataFrame))
+        self.assertEqual(99, len(spreadsheet._appendPending))
+
+        spreadsheet.flushAppends()
+        self.assertEqual(list(range(100)), spreadsheet.dataFrame[0].tolist())
+        self.assertEqual(1, spreadsheet.mainGrid.canvas.widget.yview()[1])
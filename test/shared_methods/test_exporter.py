@@ -0,0 +1,118 @@
+"""Tests for Exporter"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet
+from generalgui.shared_methods.exporter import getExportFormat, writeChunks
+
+import pandas as pd
+
+import tempfile
+import threading
+import unittest
+import queue
+import time
+import os
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class ExporterTest(GuiTests):
+    def waitForExport(self, spreadsheet):
+        for _ in range(1000):
+            if not spreadsheet.isExporting():
+                return
+            spreadsheet.app.widget.update()
+            time.sleep(0.01)
+        self.fail("File wasn't saved")
+
+    def test_getExportFormat(self):
+        self.assertEqual(("tsv", None), getExportFormat("a/b.tsv"))
+        self.assertEqual(("csv", ".gz"), getExportFormat("b.CSV.gz"))
+        self.assertEqual(("parquet", None), getExportFormat("b.parquet"))
+        self.assertEqual(("feather", None), getExportFormat("b.feather"))
+        self.assertRaises(ValueError, getExportFormat, "b.xlsx")
+        self.assertRaises(ValueError, getExportFormat, "b.parquet.gz")
+
+    def test_exportFile(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=3)
+        df = pd.DataFrame({"a": range(10), "b": [chr(97 + i) * 2 for i in range(10)]}, index=[f"r{i}" for i in range(10)])
+        spreadsheet.loadDataFrame(df)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, sep in (("test.tsv", "\t"), ("test.csv.gz", ",")):
+                path = os.path.join(directory, name)
+                spreadsheet.exportFile(path)
+                self.assertTrue(spreadsheet.isExporting())
+                spreadsheet.sortColumn("a", ascending=False)
+                self.waitForExport(spreadsheet)
+                spreadsheet.sortColumn("a")
+
+                self.assertEqual(df.values.tolist(), pd.read_csv(path, sep=sep, index_col=0).values.tolist())
+                self.assertEqual(df.index.tolist(), pd.read_csv(path, sep=sep, index_col=0).index.tolist())
+                self.assertFalse(os.path.exists(f"{path}.part"))
+
+            spreadsheet.loadFile(os.path.join(directory, "test.tsv"))
+            for _ in range(1000):
+                if not spreadsheet.isLoading():
+                    break
+                app.widget.update()
+                time.sleep(0.01)
+            self.assertEqual(df.values.tolist(), spreadsheet.dataFrame.values.tolist())
+        self.assertFalse(spreadsheet.statusLabel.isPacked())
+
+    def test_cancelExport(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=1)
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": range(100)}))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.tsv")
+            with open(path, "w") as file:
+                file.write("old")
+            spreadsheet.exportFile(path)
+            spreadsheet.cancelExport()
+            self.assertFalse(spreadsheet.isExporting())
+            time.sleep(0.2)
+            with open(path) as file:
+                self.assertEqual("old", file.read())
+
+    @unittest.skipUnless(pyarrow, "pyarrow isn't installed")
+    def test_exportArrow(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=3)
+        df = pd.DataFrame({"a": range(10), "b": [chr(97 + i) * 2 for i in range(10)]}, index=[f"r{i}" for i in range(10)])
+        spreadsheet.loadDataFrame(df)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.parquet")
+            spreadsheet.exportFile(path, compression="zstd")
+            spreadsheet.sortColumn("a", ascending=False)
+            self.waitForExport(spreadsheet)
+            self.assertEqual(df.values.tolist(), pd.read_parquet(path).values.tolist())
+            self.assertEqual(df.index.tolist(), pd.read_parquet(path).index.tolist())
+
+            path = os.path.join(directory, "test.feather")
+            spreadsheet.exportFile(path)
+            self.waitForExport(spreadsheet)
+            self.assertEqual(df.values.tolist()[::-1], pd.read_feather(path).values.tolist())
+            self.assertFalse(os.path.exists(f"{path}.part"))
+
+    @unittest.skipUnless(pyarrow, "pyarrow isn't installed")
+    def test_cancelArrowBeforeFirstChunk(self):
+        df = pd.DataFrame({"a": range(10)})
+        with tempfile.TemporaryDirectory() as directory:
+            for name, fileFormat in (("test.parquet", "parquet"), ("test.feather", "feather")):
+                path = os.path.join(directory, name)
+                progress = queue.Queue()
+                cancel = threading.Event()
+                cancel.set()
+                writeChunks(df, path, fileFormat, None, 3, progress, cancel)
+
+                self.assertTrue(progress.empty())
+                self.assertFalse(os.path.exists(path))
+                self.assertFalse(os.path.exists(f"{path}.part"))
@@ -0,0 +1,49 @@
+"""Tests for Filterer"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet
+
+import pandas as pd
+import time
+
+
+class FiltererTest(GuiTests):
+    def test_setFilter(self):
+        spreadsheet = Spreadsheet(App())
+        spreadsheet.loadDataFrame(pd.DataFrame({"fruit": ["Apple", "banana", "cherry"], "n": [1, 22, 3]}, index=["x", "y", "pineapple"]))
+
+        spreadsheet.setFilter("APPLE")
+        self.assertEqual(["Apple", 1, "cherry", 3], spreadsheet.getMainValues())
+        self.assertEqual(["x", "pineapple"], spreadsheet.getIndexValues())
+        self.assertEqual("pineapple", spreadsheet.getRowKey(1))
+        self.assertEqual(3, len(spreadsheet.dataFrame))
+        self.assertEqual(["apple", "banana", "cherry"], list(spreadsheet._getSearchColumn(0)))
+        self.assertEqual(object, spreadsheet._getSearchColumn(0).dtype)
+
+        spreadsheet.sortColumn("n", ascending=False)
+        self.assertEqual(["pineapple", "x"], spreadsheet.getIndexValues())
+
+        spreadsheet.setFilter("")
+        self.assertIsNone(spreadsheet.getFilterRows())
+        self.assertEqual(["y", "pineapple", "x"], spreadsheet.getIndexValues())
+
+    def test_filterEntry(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, filterEntry=True)
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": ["one", "two", "three"]}))
+
+        spreadsheet.filterEntry.setValue("t")
+        spreadsheet._queueFilter()
+        generation = spreadsheet._filterGeneration
+        spreadsheet.filterEntry.setValue("th")
+        spreadsheet._queueFilter()
+        self.assertNotEqual(generation, spreadsheet._filterGeneration)
+
+        for _ in range(100):
+            app.widget.update()
+            if spreadsheet.filterText:
+                break
+            time.sleep(0.01)
+        self.assertEqual("th", spreadsheet.filterText)
+        self.assertEqual(["three"], spreadsheet.getMainValues())
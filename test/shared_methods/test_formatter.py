@@ -0,0 +1,53 @@
+"""Tests for Formatter"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Page, Spreadsheet
+from generalgui.shared_methods.formatter import formatFloats, formatDatetimes, formatCategoricals, formatBools, formatValues
+
+import pandas as pd
+import numpy as np
+
+
+class FormatterTest(GuiTests):
+    def test_functions(self):
+        self.assertEqual(["1.5", "nan"], list(formatFloats(pd.Series([1.5, np.nan]))))
+        self.assertEqual(["1.50", "nan"], list(formatFloats(pd.Series([1.5, np.nan]), precision=2)))
+
+        dates = pd.Series(pd.to_datetime(["2020-01-02", None]))
+        self.assertEqual(["2020-01-02 00:00:00", "NaT"], list(formatDatetimes(dates)))
+        self.assertEqual(["02/01", "NaT"], list(formatDatetimes(dates, datetimeFormat="%d/%m")))
+
+        self.assertEqual(["b", "a", "nan"], list(formatCategoricals(pd.Series(["b", "a", None], dtype="category"))))
+        self.assertEqual(["True", "False"], list(formatBools(pd.Series([True, False]))))
+        self.assertEqual(["", "2", "a\nb"], list(formatValues(pd.Series([None, 2, "a\nb"]))))
+        self.assertEqual(["[1, 2]", "(3,)", ""], list(formatValues(pd.Series([[1, 2], (3, ), None]))))
+        self.assertEqual(object, formatValues(pd.Series(["a" * 1000, "b"])).dtype)
+
+    def test_listValues(self):
+        spreadsheet = Spreadsheet(Page(App()))
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [[1, 2], [3]], "b": [(1, ), None]}))
+        self.assertEqual(["[1, 2]", "[3]"], list(spreadsheet.formatColumn(0)[0]))
+        self.assertEqual(["(1,)", ""], list(spreadsheet.formatColumn(1)[0]))
+        self.assertEqual("[1, 2]", spreadsheet.mainCells[1][1].widget["text"])
+
+    def test_formatColumn(self):
+        spreadsheet = Spreadsheet(Page(App()), maxLen=3, floatPrecision=1)
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [2.25, 1.0], "b": ["x\ny", "long"]}))
+
+        texts, shortTexts, hideable = spreadsheet.formatColumn(1)
+        self.assertEqual(["x\ny", "long"], list(texts))
+        self.assertEqual(["x ...", "lon ..."], list(shortTexts))
+        self.assertEqual([True, True], list(hideable))
+
+        self.assertEqual(["2.2", "1.0"], list(spreadsheet.formatColumn(0)[0]))
+        self.assertEqual("2.2", spreadsheet.mainCells[1][1].widget["text"])
+        self.assertEqual(2.25, spreadsheet.mainCells[1][1].getValue())
+
+        cached = spreadsheet._formatCache["a"]
+        spreadsheet.sortColumn("a")
+        self.assertIs(cached, spreadsheet._formatCache["a"])
+        self.assertEqual(["1.0", "2.2"], list(spreadsheet.formatColumn(0)[0]))
+
+        spreadsheet.loadDataFrame()
+        self.assertIsNot(cached, spreadsheet._formatCache["a"])
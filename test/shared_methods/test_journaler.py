@@ -0,0 +1,74 @@
+"""Tests for Journaler"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet
+
+import pandas as pd
+
+
+class JournalerTest(GuiTests):
+    def test_undoRedo(self):
+        spreadsheet = Spreadsheet(App())
+        df = pd.DataFrame({"a": [3, 1, 2], "b": ["x", "y", "z"]}, index=["r0", "r1", "r2"])
+        spreadsheet.loadDataFrame(df)
+        self.assertFalse(spreadsheet.canRedo())
+
+        spreadsheet.sortColumn("a")
+        spreadsheet.dropRow("r2")
+        self.assertEqual([1, "y", 3, "x"], spreadsheet.getMainValues())
+
+        self.assertTrue(spreadsheet.undo())
+        self.assertEqual([1, "y", 2, "z", 3, "x"], spreadsheet.getMainValues())
+        label = spreadsheet.mainCells[1][1]
+        self.assertTrue(spreadsheet.undo())
+        self.assertIs(label, spreadsheet.mainCells[2][1])
+        self.assertTrue(spreadsheet.dataFrame.equals(df))
+        self.assertTrue(spreadsheet.undo())
+        self.assertTrue(spreadsheet.dataFrame.empty)
+        self.assertFalse(spreadsheet.undo())
+
+        self.assertTrue(spreadsheet.redo())
+        self.assertTrue(spreadsheet.redo())
+        self.assertTrue(spreadsheet.redo())
+        self.assertEqual([1, "y", 3, "x"], spreadsheet.getMainValues())
+        self.assertFalse(spreadsheet.redo())
+
+        spreadsheet.undo()
+        spreadsheet.sortColumn("b")
+        self.assertFalse(spreadsheet.canRedo())
+
+    def test_undoKeys(self):
+        spreadsheet = Spreadsheet(App())
+        df = pd.DataFrame({"a": [3, 1], "b": ["x", "y"]}, index=["r0", "r1"])
+        spreadsheet.loadDataFrame(df)
+
+        spreadsheet.makeColumnIndex("b")
+        self.assertEqual(["x", "y"], spreadsheet.dataFrame.index.tolist())
+        spreadsheet.undo()
+        self.assertTrue(spreadsheet.dataFrame.equals(df))
+
+        spreadsheet.resetIndex()
+        spreadsheet.clearAll()
+        spreadsheet.undo()
+        spreadsheet.undo()
+        self.assertTrue(spreadsheet.dataFrame.equals(df))
+
+    def test_undoAppends(self):
+        spreadsheet = Spreadsheet(App())
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [1]}))
+        for i in range(3):
+            spreadsheet.appendRows([[i + 2]])
+            spreadsheet.flushAppends()
+
+        spreadsheet.undo()
+        self.assertEqual([1], spreadsheet.getMainValues())
+        spreadsheet.redo()
+        self.assertEqual([1, 2, 3, 4], spreadsheet.getMainValues())
+
+    def test_journalBytes(self):
+        spreadsheet = Spreadsheet(App(), journalBytes=100)
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": range(20)}))
+        spreadsheet.sortColumn("a", ascending=False)
+        self.assertLessEqual(spreadsheet.getJournalBytes(), 100)
+        self.assertFalse(spreadsheet.canUndo())
@@ -0,0 +1,134 @@
+"""Tests for Linker"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet, SpreadsheetModel
+
+import numpy as np
+import pandas as pd
+
+
+class LinkerTest(GuiTests):
+    def test_setModel(self):
+        app = App()
+        model = SpreadsheetModel(pd.DataFrame({"a": [2, 1, 3], "b": ["x", "y", "z"]}))
+        first = Spreadsheet(app, model=model)
+        second = Spreadsheet(app)
+        second.setModel(model, columns=["b"])
+
+        self.assertEqual([first, second], model.views)
+        self.assertEqual([2, "x", 1, "y", 3, "z"], first.getMainValues())
+        self.assertEqual(["x", "y", "z"], second.getMainValues())
+
+        first.sortColumn("a")
+        self.assertEqual([1, "y", 2, "x", 3, "z"], first.getMainValues())
+        self.assertEqual(["x", "y", "z"], second.getMainValues())
+
+        second.setFilter("z")
+        self.assertEqual(["z"], second.getMainValues())
+        self.assertEqual(3, len(first.getMainValues()) / 2)
+
+    def test_modelChanges(self):
+        app = App()
+        model = SpreadsheetModel(pd.DataFrame({"a": [2, 1, 3], "b": ["x", "y", "z"]}))
+        first = Spreadsheet(app, model=model)
+        second = Spreadsheet(app, model=model)
+        first.sortColumn("a")
+        label = first.mainCells[1][1]
+
+        model.appendRows([[4, "w"]])
+        self.assertEqual([0, 1, 2, 3], model.dataFrame.index.tolist())
+        self.assertEqual([1, "y", 2, "x", 3, "z", 4, "w"], first.getMainValues())
+        self.assertEqual([2, "x", 1, "y", 3, "z", 4, "w"], second.getMainValues())
+        self.assertIs(label, first.mainCells[1][1])
+
+        second.dropRow(1)
+        self.assertEqual([0, 2, 3], model.dataFrame.index.tolist())
+        self.assertEqual([2, "x", 3, "z", 4, "w"], first.getMainValues())
+        self.assertEqual([2, "x", 3, "z", 4, "w"], second.getMainValues())
+        self.assertEqual(3, first.getColumnStatistics("a").count)
+
+        model.dropColumns(["b"])
+        self.assertEqual([2, 3, 4], first.getMainValues())
+        self.assertEqual([2, 3, 4], second.getMainValues())
+
+        model.setValue(3, "a", 5)
+        self.assertEqual([2, 3, 5], first.getMainValues())
+        self.assertEqual([2, 3, 5], second.getMainValues())
+
+        second.appendRows([[6]])
+        second.flushAppends()
+        self.assertEqual([2, 3, 5, 6], first.getMainValues())
+        self.assertEqual([2, 3, 5, 6], second.getMainValues())
+
+    def test_unlink(self):
+        app = App()
+        model = SpreadsheetModel(pd.DataFrame({"a": [1, 2]}))
+        first = Spreadsheet(app, model=model)
+        second = Spreadsheet(app, model=model)
+
+        second.loadDataFrame(pd.DataFrame({"c": [3]}))
+        self.assertIsNone(second.model)
+        self.assertEqual([first], model.views)
+
+        model.loadDataFrame(pd.DataFrame({"a": [7]}))
+        self.assertEqual([7], first.getMainValues())
+        self.assertEqual([3], second.getMainValues())
+
+        first.remove()
+        model.appendRows([[8]])
+        self.assertEqual([], model.views)
+
+    def test_modelRows(self):
+        app = App()
+        model = SpreadsheetModel(pd.DataFrame({"a": [2, 1, 3], "b": [4.5, 5.5, 6.5]}))
+        first = Spreadsheet(app, model=model)
+        second = Spreadsheet(app)
+        second.setModel(model, columns=["b"])
+
+        first.sortColumn("a")
+        self.assertEqual([1, 5.5, 2, 4.5, 3, 6.5], first.getMainValues())
+        self.assertEqual([1, 0, 2], first.modelRows.tolist())
+        self.assertEqual([1, 0, 2], first.getIndexValues())
+        for view in (first, second):
+            self.assertTrue(np.shares_memory(view.dataFrame["b"].to_numpy(), model.dataFrame["b"].to_numpy()))
+
+        first.setFilter("4.5")
+        self.assertEqual([2, 4.5], first.getMainValues())
+        first.setFilter("")
+
+        first.undo()
+        self.assertEqual([2, 4.5, 1, 5.5, 3, 6.5], first.getMainValues())
+        first.redo()
+        self.assertEqual([1, 5.5, 2, 4.5, 3, 6.5], first.getMainValues())
+
+        model.dropRows([0])
+        self.assertEqual([0, 1], first.modelRows.tolist())
+        self.assertEqual([1, 5.5, 3, 6.5], first.getMainValues())
+
+        first.setModel(None)
+        self.assertIsNone(first.modelRows)
+        self.assertEqual([1, 2], first.dataFrame.index.tolist())
+        self.assertEqual([1, 5.5, 3, 6.5], first.getMainValues())
+
+    def test_setValue(self):
+        app = App()
+        model = SpreadsheetModel(pd.DataFrame({"a": [2, 1, 3], "b": ["x", "y", "z"]}))
+        spreadsheet = Spreadsheet(app, model=model)
+        spreadsheet.sortColumn("a")
+        self.assertEqual(3, spreadsheet.getColumnStatistics("a").maximum)
+        labels = [label for row in spreadsheet.mainCells[1:] for label in row[1:]]
+
+        model.setValue(2, "a", 0)
+        self.assertEqual([1, "y", 2, "x", 0, "z"], spreadsheet.getMainValues())
+        self.assertEqual(labels, [label for row in spreadsheet.mainCells[1:] for label in row[1:]])
+        self.assertEqual("0", spreadsheet.mainCells[3][1].getDisplayedValue())
+        self.assertEqual(3, spreadsheet.getColumnStatistics("a").count)
+        self.assertEqual(2, spreadsheet.getColumnStatistics("a").maximum)
+
+        spreadsheet.sortColumn("a", ascending=True)
+        self.assertEqual([0, "z", 1, "y", 2, "x"], spreadsheet.getMainValues())
+
+        model.setValue(2, "b", 5)
+        self.assertEqual(object, model.dataFrame["b"].dtype)
+        self.assertEqual([0, 5, 1, "y", 2, "x"], spreadsheet.getMainValues())
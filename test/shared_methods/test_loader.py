@@ -0,0 +1,91 @@
+"""Tests for Loader"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet
+
+import pandas as pd
+
+import tempfile
+import time
+import os
+
+
+class LoaderTest(GuiTests):
+    def waitForLoad(self, spreadsheet):
+        for _ in range(1000):
+            if not spreadsheet.isLoading():
+                return
+            spreadsheet.app.widget.update()
+            time.sleep(0.01)
+        self.fail("File didn't load")
+
+    def test_loadFile(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=3)
+        df = pd.DataFrame({"a": range(10), "b": [chr(97 + i) * 2 for i in range(10)]}, index=[f"r{i}" for i in range(10)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.tsv")
+            df.to_csv(path, sep="\t")
+            spreadsheet.loadFile(path)
+            self.assertTrue(spreadsheet.isLoading())
+            self.waitForLoad(spreadsheet)
+
+        self.assertEqual(df.values.tolist(), spreadsheet.dataFrame.values.tolist())
+        self.assertEqual(df.index.tolist(), spreadsheet.dataFrame.index.tolist())
+        self.assertEqual(["0", "aa", "9", "jj"], spreadsheet.getMainValues()[:2] + spreadsheet.getMainValues()[-2:])
+        self.assertFalse(spreadsheet.statusLabel.isPacked())
+
+    def test_loadFileWithoutKeys(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.csv")
+            pd.DataFrame([[1, 2], [3, 4], [5, 6]]).to_csv(path, header=False, index=False)
+            spreadsheet.loadFile(path)
+            self.waitForLoad(spreadsheet)
+
+        self.assertEqual([[1, 2], [3, 4], [5, 6]], spreadsheet.dataFrame.values.tolist())
+
+    def test_cancelLoad(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            first = os.path.join(directory, "first.tsv")
+            second = os.path.join(directory, "second.tsv")
+            pd.DataFrame({"a": range(100)}).to_csv(first, sep="\t")
+            pd.DataFrame({"b": range(5)}).to_csv(second, sep="\t")
+
+            spreadsheet.loadFile(first)
+            spreadsheet.loadFile(second)
+            self.waitForLoad(spreadsheet)
+
+        self.assertEqual(["b"], spreadsheet.dataFrame.columns.tolist())
+        self.assertEqual(list(range(5)), spreadsheet.dataFrame["b"].tolist())
+
+        spreadsheet.cancelLoad()
+        self.assertFalse(spreadsheet.isLoading())
+
+    def test_loadDataFrameCancelsLoad(self):
+        app = App()
+        spreadsheet = Spreadsheet(app, chunkSize=2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.tsv")
+            pd.DataFrame({"a": range(100)}).to_csv(path, sep="\t")
+
+            spreadsheet.loadFile(path)
+            spreadsheet.loadDataFrame(pd.DataFrame({"b": [1]}))
+            self.assertFalse(spreadsheet.isLoading())
+
+            spreadsheet.loadFile(path)
+            spreadsheet.clearAll()
+            self.assertFalse(spreadsheet.isLoading())
+            for _ in range(20):
+                app.widget.update()
+                time.sleep(0.01)
+
+        self.assertTrue(spreadsheet.dataFrame.empty)
@@ -0,0 +1,22 @@
+"""Tests for Measurer"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App
+
+
+class MeasurerTest(GuiTests):
+    def test_measureText(self):
+        app = App()
+        self.assertEqual(app.getFont().measure("hello"), app.measureText("hello"))
+        self.assertEqual(app.measureText("hello"), app.measureText("hi\nhello"))
+        self.assertEqual(0, app.measureText(""))
+        self.assertIn(("TkDefaultFont", "hello"), app._textWidths)
+
+        app.clearMeasurements()
+        self.assertEqual({}, app._textWidths)
+
+    def test_measureTextSize(self):
+        app = App()
+        self.assertEqual(app.getFont().metrics("linespace"), app.getLineHeight())
+        self.assertEqual((app.measureText("hello"), app.getLineHeight() * 2), app.measureTextSize("a\nhello"))
@@ -0,0 +1,102 @@
+"""Tests for Pooler"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Page, Grid, Label, Entry, InputList
+
+from generalvector import Vec2
+
+
+class PoolerTest(GuiTests):
+    def test_borrowElement(self):
+        app = App()
+        page = Page(app)
+
+        label = app.borrowElement(Label, page, value="hello", anchor="w")
+        self.assertEqual([label], page.getChildren())
+        self.assertEqual(True, app.recycleElement(label))
+        self.assertEqual([], page.getChildren())
+        self.assertEqual(1, app.getPooledCount())
+        self.assertEqual(False, label.removed)
+
+        self.assertIsNot(label, app.borrowElement(Label, page, value="hello", anchor="e"))
+        self.assertIsNot(label, app.borrowElement(Label, Page(app), value="hello", anchor="w"))
+        self.assertIsNot(label, app.borrowElement(Entry, page, anchor="w"))
+
+        reused = app.borrowElement(Label, page, value="there", anchor="w")
+        self.assertIs(label, reused)
+        self.assertEqual("there", reused.getValue())
+        self.assertEqual(True, reused.isPacked())
+        self.assertEqual(0, app.getPooledCount())
+
+    def test_recycleElement(self):
+        app = App()
+        page = Page(app)
+
+        label = Label(page, "hello")
+        self.assertEqual(False, app.recycleElement(label))
+        self.assertEqual(True, label.removed)
+
+        label = app.borrowElement(Label, page, value="hello", onClick=lambda: 5)
+        self.assertEqual(True, app.recycleElement(label))
+        reused = app.borrowElement(Label, page, value="hello", onClick=lambda: 6)
+        self.assertIs(label, reused)
+        self.assertEqual([6], reused.click(animate=False))
+
+    def test_elementPoolSize(self):
+        app = App()
+        app.elementPoolSize = 2
+        page = Page(app)
+
+        labels = [app.borrowElement(Label, page, value=i) for i in range(3)]
+        for label in labels:
+            app.recycleElement(label)
+        self.assertEqual(2, app.getPooledCount())
+        self.assertEqual([True, False, False], [label.removed for label in labels])
+
+        app.clearElementPool()
+        self.assertEqual(0, app.getPooledCount())
+        self.assertEqual([True, True, True], [label.removed for label in labels])
+
+    def test_fillGrid(self):
+        app = App()
+        grid = Grid(app)
+
+        elements = grid.fillGrid(Label, Vec2(0, 0), Vec2(2, 2), values=range(4))
+        grid.fillGrid(Label, Vec2(0, 0), Vec2(2, 1), values=range(2), removeExcess=True)
+        self.assertEqual(2, app.getPooledCount())
+        self.assertEqual(Vec2(2, 1), grid.getGridSize())
+
+        reused = grid.fillGrid(Label, Vec2(0, 1), Vec2(2, 1), values=["a", "b"])
+        self.assertEqual(set(elements[2:]), set(reused))
+        self.assertEqual(["a", "b"], [ele.getValue() for ele in reused])
+        self.assertEqual([Vec2(0, 1), Vec2(1, 1)], [grid.getGridPos(ele) for ele in reused])
+
+    def test_removePooled(self):
+        app = App()
+        grid = Grid(app)
+        page = Page(app)
+        app.recycleElement(app.borrowElement(Label, page, value="hello"))
+
+        elements = grid.fillGrid(Label, Vec2(0, 0), Vec2(2, 2), values=range(4))
+        grid.fillGrid(Label, Vec2(0, 0), Vec2(2, 1), values=range(2), removeExcess=True)
+        self.assertEqual(3, app.getPooledCount())
+
+        grid.remove()
+        self.assertEqual(1, app.getPooledCount())
+        self.assertEqual(True, all(ele.removed for ele in elements))
+        self.assertEqual(1, len(app._elementPool))
+
+        app.removeParts([page])
+        self.assertEqual(0, app.getPooledCount())
+        self.assertEqual({}, app._elementPool)
+
+    def test_inputList(self):
+        app = App()
+        inputList = InputList(app)
+
+        inputList.setValues({"a": "x", "b": True})
+        elements = inputList.getChildren()
+        inputList.setValues({"c": "y", "d": False})
+        self.assertEqual(set(elements), set(inputList.getChildren()))
+        self.assertEqual({"c": "y", "d": False}, inputList.getValues())
@@ -0,0 +1,74 @@
+"""Tests for Statistician"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import App, Spreadsheet
+from generalgui.shared_methods.statistician import Statistics
+
+import pandas as pd
+import numpy as np
+
+
+class StatisticianTest(GuiTests):
+    def test_statistics(self):
+        statistics = Statistics.fromValues(pd.Series([1.0, np.nan, 3.0]))
+        self.assertEqual((2, 1, 2.0, 1.0, 3.0, 2), (statistics.count, statistics.nulls, statistics.mean, statistics.minimum, statistics.maximum, statistics.distinct))
+
+        statistics.add([5.0, 5.0])
+        self.assertEqual((4, 3.5, 5.0, 3), (statistics.count, statistics.mean, statistics.maximum, statistics.distinct))
+
+        statistics.remove([3.0])
+        self.assertFalse(statistics.dirty)
+        statistics.remove([1.0])
+        self.assertTrue(statistics.dirty)
+
+        mixed = Statistics.fromValues(pd.Series(["a", 2, None, 4]))
+        self.assertEqual((3, 1, 3.0, None), (mixed.count, mixed.nulls, mixed.mean, mixed.minimum))
+
+        lists = Statistics.fromValues(pd.Series([[1, 2], [1, 2], [3], None]))
+        self.assertEqual((3, 1, [1, 2], [3], 2), (lists.count, lists.nulls, lists.minimum, lists.maximum, lists.distinct))
+        lists.remove([[2]])
+        self.assertFalse(lists.dirty)
+        lists.remove([[3]])
+        self.assertTrue(lists.dirty)
+        self.assertEqual(2, Statistics.fromValues([(1, ), [2]]).count)
+
+        self.assertAlmostEqual(1000, Statistics.fromValues(pd.Series(np.arange(100000) % 1000)).distinct, delta=100)
+
+    def test_cache(self):
+        spreadsheet = Spreadsheet(App())
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None]}, index=["r1", "r2", "r3"]))
+
+        statistics = spreadsheet.getColumnStatistics("a")
+        self.assertEqual(2, spreadsheet.getColumnAverage("a"))
+        self.assertIs(statistics, spreadsheet.getColumnStatistics("a"))
+        self.assertEqual(1, spreadsheet.getColumnStatistics("b").nulls)
+        self.assertEqual(1, spreadsheet.getRowAverage("r1"))
+
+        spreadsheet.appendRows(pd.DataFrame({"a": [6], "b": ["z"]}, index=["r4"]))
+        spreadsheet.flushAppends()
+        self.assertIs(statistics, spreadsheet.getColumnStatistics("a"))
+        self.assertEqual((4, 3, 6), (statistics.count, statistics.mean, statistics.maximum))
+
+        spreadsheet.dropRow("r2")
+        self.assertIs(statistics, spreadsheet.getColumnStatistics("a"))
+        self.assertEqual((3, 10 / 3), (statistics.count, statistics.mean))
+        self.assertEqual(2, spreadsheet.getColumnStatistics("b").count)
+
+        spreadsheet.dropColumn("b")
+        self.assertEqual(1, spreadsheet.getRowStatistics("r1").count)
+        self.assertIsNone(spreadsheet.getColumnStatistics("b"))
+
+        spreadsheet.loadDataFrame()
+        self.assertIsNot(statistics, spreadsheet.getColumnStatistics("a"))
+
+    def test_listValues(self):
+        spreadsheet = Spreadsheet(App())
+        spreadsheet.loadDataFrame(pd.DataFrame({"a": [[1, 2], [3], None], "b": [(1, ), [2], "c"]}, index=["r1", "r2", "r3"]))
+
+        self.assertEqual((2, [1, 2], [3]), (spreadsheet.getColumnStatistics("a").count, spreadsheet.getColumnStatistics("a").minimum, spreadsheet.getColumnStatistics("a").maximum))
+        self.assertEqual((3, None), (spreadsheet.getColumnStatistics("b").count, spreadsheet.getColumnStatistics("b").minimum))
+        self.assertEqual(2, spreadsheet.getRowStatistics("r1").distinct)
+
+        spreadsheet.dropRow("r2")
+        self.assertEqual(1, spreadsheet.getColumnStatistics("a").count)
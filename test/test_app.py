@@ -4,7 +4,7 @@ import tkinter as tk
 
 from test.shared_methods import GuiTests
 
-from generalgui import App, Page, LabelEntry, Button
+from generalgui import App, Page, LabelEntry, Button, Label
 
 from generallibrary.time import sleep
 
@@ -252,22 +252,32 @@ class AppTest(GuiTests):
         button = Button(Page(Page(Page(app))), value="test val")
         self.assertEqual(button, app.getElementByValue("test val"))
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    def test_removeParts(self):
+        app = App()
+        page = Page(app)
+        label = Label(page, "hello")
+        page2 = Page(page)
+        label2 = Label(page2, "there")
+        label3 = Label(page, "stays")
+
+        app.removeParts([label2, page2, label])
+        self.assertEqual([True, True, True, False], [part.removed for part in (label, page2, label2, label3)])
+        self.assertEqual([label3], page.getChildren())
+        self.assertRaises(tk.TclError, label.isShown)
+
+        lazyPage = Page(page, lazy=True)
+        lazyLabel = Label(lazyPage, "lazy")
+        Label(lazyPage, "lazy2")
+        lazyPage.removeChildren()
+        self.assertEqual(True, lazyLabel.removed)
+        self.assertEqual(False, lazyPage.isMaterialized())
+        self.assertEqual([], lazyPage.getChildren())
+        lazyPage.show(mainloop=False)
+        self.assertEqual(False, lazyLabel.isMaterialized())
+
+        page.removeChildren(recurrent=True)
+        self.assertEqual([], page.getChildren())
+        self.assertEqual(True, lazyPage.removed)
 
 
 
@@ -0,0 +1,107 @@
+"""Tests for DataSources"""
+
+from test.shared_methods import GuiTests
+
+from generalgui import DataSource, DataFrameSource, MemmapSource, FeatherSource, ParquetSource
+
+import numpy as np
+import pandas as pd
+
+import tempfile
+import unittest
+import os
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class DataSourcesTest(GuiTests):
+    def test_dataFrameSource(self):
+        source = DataFrameSource(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=["x", "y", "z"]))
+        self.assertEqual((3, 2), source.getShape())
+        self.assertEqual(["y", "z"], source.getIndex(1).tolist())
+
+        df = source.read(1, 5, 1)
+        self.assertEqual([[5], [6]], df.values.tolist())
+        self.assertEqual(["y", "z"], df.index.tolist())
+        self.assertEqual(["b"], df.columns.tolist())
+
+    def test_memmapSource(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "array.npy")
+            np.save(path, np.arange(30).reshape(10, 3))
+
+            source = MemmapSource(path, columns=["a", "b", "c"])
+            self.assertEqual((10, 3), source.getShape())
+
+            df = source.read(2, 4, 1, 3)
+            self.assertEqual([[7, 8], [10, 11]], df.values.tolist())
+            self.assertEqual([2, 3], df.index.tolist())
+            self.assertEqual(["b", "c"], df.columns.tolist())
+            self.assertEqual((0, 3), source.read(10, 20).shape)
+            del source, df
+
+    def test_memmapSourceStructured(self):
+        array = np.zeros(4, dtype=[("x", int), ("y", float)])
+        array["x"] = range(4)
+        source = MemmapSource(array)
+        self.assertEqual(["x", "y"], source.getColumns().tolist())
+        self.assertEqual([1, 2], source.read(1, 3, 0, 1)["x"].tolist())
+
+        self.assertEqual((5, 1), MemmapSource(np.arange(5)).getShape())
+        self.assertRaises(ValueError, MemmapSource, np.zeros((2, 2, 2)))
+
+    def test_abstract(self):
+        class MissingRead(DataSource):
+            def getShape(self):
+                return 0, 0
+
+            def getColumns(self):
+                return pd.Index([])
+
+        self.assertRaises(TypeError, DataSource)
+        self.assertRaises(TypeError, MissingRead)
+
+    @unittest.skipUnless(pyarrow, "pyarrow isn't installed")
+    def test_featherSource(self):
+        df = pd.DataFrame({"a": range(10), "b": [f"s{i}" for i in range(10)], "c": np.arange(10) / 2})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frame.feather")
+            pyarrow.feather.write_feather(df, path, chunksize=3)
+
+            source = FeatherSource(path)
+            self.assertEqual((10, 3), source.getShape())
+            self.assertEqual([0, 3, 6, 9, 10], source.batchOffsets.tolist())
+            self.assertEqual(["a", "b", "c"], source.getColumns().tolist())
+
+            window = source.read(2, 8, 1, 3)
+            self.assertEqual(["b", "c"], window.columns.tolist())
+            self.assertEqual(list(range(2, 8)), window.index.tolist())
+            self.assertEqual(df.iloc[2:8, 1:3].values.tolist(), window.values.tolist())
+            self.assertEqual([[9]], source.read(9, 20, 0, 1).values.tolist())
+            self.assertEqual((0, 3), source.read(10, 20).shape)
+            source.close()
+
+    @unittest.skipUnless(pyarrow, "pyarrow isn't installed")
+    def test_parquetSource(self):
+        df = pd.DataFrame({"a": range(10), "b": [f"s{i}" for i in range(10)]})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frame.parquet")
+            pyarrow.parquet.write_table(pyarrow.Table.from_pandas(df), path, row_group_size=4)
+
+            source = ParquetSource(path, cacheSize=1)
+            self.assertEqual((10, 2), source.getShape())
+            self.assertEqual([0, 4, 8, 10], source.groupOffsets.tolist())
+            self.assertEqual(["a", "b"], source.getColumns().tolist())
+
+            window = source.read(3, 9)
+            self.assertEqual(list(range(3, 9)), window.index.tolist())
+            self.assertEqual(df.iloc[3:9].values.tolist(), window.values.tolist())
+            self.assertEqual([["s8"]], source.read(8, 9, 1).values.tolist())
+            self.assertEqual(1, len(source._groupCache))
+            self.assertEqual((0, 2), source.read(10, 20).shape)
+            source.close()
@@ -1,10 +1,17 @@
 """Tests for Element"""
 
+import os
+import sys
 import tkinter as tk
+import tracemalloc
 
 from test.shared_methods import GuiTests
 
-from generalgui import App, Page, Label, Button, Checkbutton
+import generalgui
+from generalgui import App, Page, Grid, Label, Button, Checkbutton
+from generalgui.element import initPlans, widgetConfigKeys
+from generalgui.shared_methods.binder import noEvents
+from generalgui.shared_methods.menu import noMenuContent
 
 from generalvector import Vec2
 
@@ -42,6 +49,82 @@ class ElementTest(GuiTests):
             text1.parentPage.showChildren(mainloop=False)
             self.assertTrue(text2.isShown())
 
+    def test_widgetClassCache(self):
+        page = Page(App())
+        label = Label(page, "hello", anchor="w", side="left")
+        self.assertIn(tk.Label, initPlans)
+        self.assertIn("anchor", widgetConfigKeys[tk.Label])
+        self.assertNotIn("side", widgetConfigKeys[tk.Label])
+        self.assertEqual({"side": "left"}, label.packParameters)
+        self.assertEqual("w", label.getWidgetConfig("anchor"))
+
+        keys = widgetConfigKeys[tk.Label]
+        Label(page, "there")
+        self.assertIs(keys, widgetConfigKeys[tk.Label])
+
+    def test_slots(self):
+        page = Page(App())
+        label = Label(page, "hello")
+        self.assertEqual(False, hasattr(label, "__dict__"))
+        self.assertIs(noEvents, label.events)
+        self.assertIs(noMenuContent, label.menuContent)
+        self.assertIsNone(label.styleHandler)
+        with self.assertRaises(AttributeError):
+            label.notAnAttribute = 5
+
+        label.onClick(lambda: 5)
+        label.menu("Label", Hello=lambda: 5)
+        self.assertIsNot(noEvents, label.events)
+        self.assertIsNot(noMenuContent, label.menuContent)
+        self.assertIs(noEvents, Label(page, "there").events)
+
+    def test_cellMemory(self):
+        grid = Grid(App())
+        size = Vec2(10, 100)
+        ownFiles = (tracemalloc.Filter(True, os.path.join(os.path.dirname(generalgui.__file__), "*")), )
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot().filter_traces(ownFiles)
+        labels = grid.fillGrid(Label, Vec2(0, 0), size, values=range(size.x * size.y))
+        after = tracemalloc.take_snapshot().filter_traces(ownFiles)
+        tracemalloc.stop()
+
+        for label in labels:
+            self.assertEqual(False, hasattr(label, "__dict__"))
+            self.assertIs(noEvents, label.events)
+            self.assertIs(noMenuContent, label.menuContent)
+            self.assertEqual((), label.disabledPropagations)
+            self.assertIsNone(label._pendingConfig)
+            self.assertIsNone(label._pendingActions)
+
+        # Each cell should only cost it's slotted instance, the containers it has to own and it's entries in grid's indexes
+        label = labels[-1]
+        poolKey = sys.getsizeof(label.poolKey) + sys.getsizeof(label.poolKey[3]) + sum(map(sys.getsizeof, label.poolKey[3]))
+        owned = sys.getsizeof(label) + sys.getsizeof(label.parameters) + sys.getsizeof(label.packParameters) + sys.getsizeof(label._initArgs) + poolKey
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename")) / len(labels)
+        self.assertLess(allocated, owned + 384)
+
+    def test_hierarchyIndex(self):
+        app = App()
+        page = Page(app)
+        page2 = Page(page, scrollable=True)
+        label = Label(page2, "hello")
+        label2 = Label(page2, "there", pack=False)
+
+        self.assertIs(page2, label.getFirstParentByClass("Page"))
+        self.assertIs(page, page2.getFirstParentByClass(Page))
+        self.assertIsNone(label.getFirstParentByClass("Spreadsheet"))
+        self.assertIs(label, label.getFirstParentByClass("Label", includeSelf=True))
+        self.assertIn("Spreadsheet", page2._parentsByClass)
+        self.assertEqual((page2, page), page2._getPageChain())
+
+        self.assertEqual([label, label2], page2.getChildren())
+        self.assertEqual([page2.frame], page.getChildren(includeParts=True))
+        label.remove()
+        self.assertEqual([label2], page2.getChildren())
+        page2.remove()
+        self.assertEqual([], page.getChildren())
+        self.assertEqual({}, page.frame._childElements)
+
     def test_nextSibling(self):
         page = Page(App())
         button = Button(page, "button")
@@ -4,7 +4,7 @@ import tkinter as tk
 
 from test.shared_methods import GuiTests
 
-from generalgui import App, Page
+from generalgui import App, Page, Label
 
 from generalvector import Vec2
 
@@ -178,6 +178,31 @@ class PageTest(GuiTests):
         app.widget.update()
         self.assertEqual(Vec2(120), page.getSize())
 
+    def test_lazy(self):
+        app = App()
+        page = Page(app, lazy=True, vsb=True, width=200, height=200)
+        label = Label(page, "hello")
+        subPage = Page(page, lazy=True)
+        Label(subPage, "there")
+
+        self.assertEqual(False, page.isMaterialized())
+        self.assertEqual(False, label.isMaterialized())
+        self.assertEqual(False, page.isShown())
+        self.assertEqual(False, page.isPacked())
+        label.setValue("hi")
+        self.assertEqual(False, label.isMaterialized())
+
+        page.show(mainloop=False)
+        self.assertEqual(True, label.isMaterialized())
+        self.assertEqual("hi", label.getWidgetConfig("text"))
+        self.assertEqual(True, label.isShown())
+        self.assertEqual([label, subPage], page.getChildren())
+        self.assertEqual(False, subPage.isMaterialized())
+        self.assertIsNotNone(page.canvasWindow)
+
+        subPage.show(mainloop=False)
+        self.assertEqual(["there"], [child.getValue() for child in subPage.getChildren()])
+
     def test_states(self):
         app = App()
         page = Page(app)